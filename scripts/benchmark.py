@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""
+BMAD Enhanced - Benchmark Harness
+
+Repeatable performance benchmarks for the skill monitor, error handler,
+progress tracker and wizard. Inputs are generated from a fixed seed;
+each benchmark is measured cold (first call in a fresh process with empty
+caches) and warm (repeated calls in one process), reported with 95%
+confidence intervals and compared against a committed JSON baseline.
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import random
+import platform
+import tempfile
+import statistics
+import subprocess
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from bmadlib.loader import load_script
+from bmadlib.output import colors_for
+from bmadlib.profiling import instrumented
+
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "benchmark-baseline.json"
+BASELINE_VERSION = 1
+
+CATEGORIES = ["planning", "development", "quality", "architecture", "brownfield", "implementation"]
+
+WORDS = [
+    "create", "task", "spec", "implement", "feature", "test", "review", "code", "architecture",
+    "refactor", "bug", "fix", "deploy", "quality", "gate", "epic", "breakdown", "api", "database",
+    "story", "estimate", "risk", "migration", "legacy", "performance", "security", "design",
+    "document", "validate", "requirements", "coverage", "integration", "service", "schema", "plan"
+]
+
+# Two-sided 95% Student t critical values by degrees of freedom
+T_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306, 9: 2.262,
+    10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145, 15: 2.131, 16: 2.120, 17: 2.110,
+    18: 2.101, 19: 2.093, 20: 2.086, 21: 2.080, 22: 2.074, 23: 2.069, 24: 2.064, 25: 2.060,
+    26: 2.056, 27: 2.052, 28: 2.048, 29: 2.045, 30: 2.042, 40: 2.021, 60: 2.000, 120: 1.980
+}
+
+
+@dataclass
+class Benchmark:
+    """A declared benchmark
+
+    ``setup(workdir, params)`` does untimed preparation and returns a
+    callable that performs one sample and returns how many operations it
+    did; timings are reported per operation.
+    """
+    name: str
+    description: str
+    setup: Callable[[Path, Dict], Callable[[], int]]
+
+
+@dataclass
+class Stats:
+    """Per-operation timing statistics for one benchmark mode"""
+    n: int
+    mean: float
+    ci: float
+    median: float
+    stdev: float
+    min: float
+    ops: int
+    samples: List[float] = field(default_factory=list)
+
+    @property
+    def ops_per_sec(self) -> float:
+        return 1.0 / self.mean if self.mean > 0 else 0.0
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, description: str):
+    """Register a benchmark; benchmarks run in declaration order"""
+    def decorator(setup):
+        BENCHMARKS[name] = Benchmark(name, description, setup)
+        return setup
+    return decorator
+
+
+def t_critical(df: int) -> float:
+    """95% two-sided t value for df degrees of freedom (conservative between table entries)"""
+    if df <= 0:
+        return float("inf")
+    for key in sorted(T_95):
+        if df <= key:
+            return T_95[key]
+    return 1.96
+
+
+def summarize(samples: List[float], ops: int) -> Stats:
+    """Statistics of per-operation times"""
+    n = len(samples)
+    mean = statistics.fmean(samples)
+    stdev = statistics.stdev(samples) if n > 1 else 0.0
+    ci = t_critical(n - 1) * stdev / n ** 0.5 if n > 1 else 0.0
+    return Stats(n, mean, ci, statistics.median(samples), stdev, min(samples), ops, samples)
+
+
+# Synthetic inputs
+
+
+def generate_inputs(workdir: Path, params: Dict):
+    """Write a seeded synthetic skills tree (about 10% invalid) under workdir"""
+    rng = random.Random(params["seed"])
+    skills_dir = workdir / ".claude" / "skills"
+    for i in range(params["skills"]):
+        category = CATEGORIES[i % len(CATEGORIES)]
+        name = f"{rng.choice(WORDS)}-{rng.choice(WORDS)}-{i}"
+        skill_dir = skills_dir / category / name
+        skill_dir.mkdir(parents=True, exist_ok=True)
+        fields = {"name": name, "description": " ".join(rng.choices(WORDS, k=12)), "category": category}
+        roll = rng.random()
+        if roll < 0.05:
+            del fields["description"]
+        lines = [] if roll > 0.97 else ["---"] + [f"{k}: {v}" for k, v in fields.items()] + ["---", ""]
+        lines += [f"# {name}", "", "## Workflow Steps" if roll < 0.95 else "## Notes", ""]
+        for step in range(rng.randint(40, 300)):
+            lines.append(f"{step + 1}. " + " ".join(rng.choices(WORDS, k=rng.randint(4, 16))))
+        (skill_dir / "SKILL.md").write_text("\n".join(lines) + "\n", encoding='utf-8')
+
+
+def synthetic_goals(params: Dict) -> List[str]:
+    """Seeded natural-language goals"""
+    rng = random.Random(params["seed"] + 1)
+    return [" ".join(rng.choices(WORDS, k=rng.randint(3, 9))) for _ in range(params["goals"])]
+
+
+# Benchmarks
+
+
+@benchmark("monitor.discover", "SkillMonitor.discover_skills over the synthetic skills tree")
+def bench_discover(workdir: Path, params: Dict) -> Callable[[], int]:
+    monitor_module = load_script("monitor-skills.py")
+
+    def run() -> int:
+        monitor = monitor_module.SkillMonitor(".claude/skills")
+        with redirect_stdout(io.StringIO()):
+            return monitor.discover_skills()
+    return run
+
+
+@benchmark("monitor.export_json", "SkillMonitor.export_json of every discovered skill")
+def bench_export(workdir: Path, params: Dict) -> Callable[[], int]:
+    monitor = load_script("monitor-skills.py").SkillMonitor(".claude/skills")
+    with redirect_stdout(io.StringIO()):
+        monitor.discover_skills()
+    output = str(workdir / "skills-export.json")
+
+    def run() -> int:
+        with redirect_stdout(io.StringIO()):
+            monitor.export_json(output)
+        return len(monitor.skills)
+    return run
+
+
+@benchmark("errors.format", "BMADError.format and to_json for every error template")
+def bench_error_format(workdir: Path, params: Dict) -> Callable[[], int]:
+    errors = load_script("error-handler.py")
+    handler = errors.ErrorHandler()
+    context = {"command": "*implement", "spec_file": ".claude/tasks/task-001-spec.md", "file": "src/app.py"}
+    templates = list(errors.ERROR_TEMPLATES)
+
+    def run() -> int:
+        for _ in range(params["repeat"]):
+            for name in templates:
+                error = handler.create_error(name, context)
+                error.format()
+                error.to_json()
+        return params["repeat"] * len(templates)
+    return run
+
+
+@benchmark("errors.handle", "ErrorHandler.handle_error with JSONL and SQLite logging")
+def bench_error_handle(workdir: Path, params: Dict) -> Callable[[], int]:
+    errors = load_script("error-handler.py")
+    handler = errors.ErrorHandler(log_file=str(workdir / "errors.jsonl"), db_path=str(workdir / "errors.db"))
+    templates = [name for name, t in errors.ERROR_TEMPLATES.items()
+                 if t["severity"] != errors.ErrorSeverity.CRITICAL]
+    context = {"command": "*test", "file": "src/app.py"}
+
+    def run() -> int:
+        with redirect_stderr(io.StringIO()):
+            for i in range(params["repeat"]):
+                handler.handle_error(handler.create_error(templates[i % len(templates)], context))
+        handler.sink.flush()
+        return params["repeat"]
+    return run
+
+
+@benchmark("progress.update", "ProgressTracker step and substep updates (non-TTY renderer)")
+def bench_progress(workdir: Path, params: Dict) -> Callable[[], int]:
+    progress = load_script("progress-visualizer.py")
+    steps = list(progress.WorkflowStep)
+    updates = params["repeat"] * 10
+
+    def run() -> int:
+        renderer = progress.TerminalRenderer(stream=io.StringIO(), in_place=False)
+        tracker = progress.ProgressTracker(total_steps=len(steps), renderer=renderer)
+        tracker.start("Benchmark")
+        for i in range(updates):
+            if i % 100 == 0:
+                tracker.update_step(steps[(i // 100) % len(steps)])
+            else:
+                tracker.update_substep(f"Processing item {i}")
+        tracker.complete()
+        renderer.stop()
+        return updates
+    return run
+
+
+@benchmark("wizard.recommend", "recommend_by_goal latency over synthetic goals")
+def bench_recommend(workdir: Path, params: Dict) -> Callable[[], int]:
+    wizard = load_script("bmad-wizard.py")
+    goals = synthetic_goals(params)
+
+    def run() -> int:
+        for goal in goals:
+            wizard.recommend_by_goal(goal)
+        return len(goals)
+    return run
+
+
+# Runners
+
+
+def run_warm(bench: Benchmark, workdir: Path, params: Dict) -> Stats:
+    """Repeated samples in this process after warm-up runs"""
+    sample = bench.setup(workdir, params)
+    for _ in range(params["warmup"]):
+        sample()
+    times = []
+    ops = 0
+    for _ in range(params["runs"]):
+        start = time.perf_counter()
+        ops = sample()
+        times.append((time.perf_counter() - start) / max(ops, 1))
+    return summarize(times, ops)
+
+
+def cold_sample(name: str, workdir: Path, params: Dict) -> Tuple[float, int]:
+    """Set up and run a benchmark once in this (fresh) process: (seconds per op, ops)"""
+    start = time.perf_counter()
+    ops = BENCHMARKS[name].setup(workdir, params)()
+    return (time.perf_counter() - start) / max(ops, 1), ops
+
+
+def run_cold(bench: Benchmark, workdir: Path, params: Dict) -> Stats:
+    """One sample per fresh interpreter, each with an empty cache directory"""
+    times = []
+    ops = 0
+    for i in range(params["cold_runs"]):
+        cache_dir = tempfile.mkdtemp(prefix="cold-cache-", dir=workdir)
+        env = dict(os.environ, BMAD_CACHE_DIR=cache_dir)
+        result = subprocess.run(
+            [sys.executable, str(Path(__file__).resolve()), "--cold-sample", bench.name,
+             "--workdir", str(workdir), "--params", json.dumps(params)],
+            cwd=workdir, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"cold sample failed: {result.stderr.strip().splitlines()[-1:]}")
+        seconds, ops = json.loads(result.stdout)
+        times.append(seconds)
+    return summarize(times, ops)
+
+
+def compare(current: Stats, baseline: Optional[Dict], tolerance: float) -> str:
+    """'regression', 'faster', 'ok', or 'new' against a baseline entry
+
+    A change counts only when the whole confidence interval lies beyond
+    the baseline mean by more than the tolerance, so noise alone does
+    not fail a run.
+    """
+    if not baseline:
+        return "new"
+    base = baseline["mean"]
+    if current.mean - current.ci > base * (1 + tolerance):
+        return "regression"
+    if current.mean + current.ci < base * (1 - tolerance):
+        return "faster"
+    return "ok"
+
+
+def format_time(seconds: float) -> str:
+    """Human-readable duration"""
+    if seconds >= 1:
+        return f"{seconds:.2f}s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds * 1e6:.1f}µs"
+
+
+def print_results(results: Dict[str, Dict[str, Stats]], baseline: Dict, tolerance: float, colors) -> int:
+    """Print the results table; returns the number of regressions"""
+    marks = {
+        "regression": f"{colors.RED}REGRESSION{colors.ENDC}",
+        "faster": f"{colors.GREEN}faster{colors.ENDC}",
+        "ok": "ok",
+        "new": f"{colors.YELLOW}new{colors.ENDC}",
+    }
+    print(f"\n{colors.BOLD}{'Benchmark':<22} {'mode':<5} {'n':>3} {'mean/op':>10} {'±95% CI':>10} "
+          f"{'median':>10} {'ops/s':>11} {'baseline':>10} {'Δ':>7}  status{colors.ENDC}")
+    print("─" * 104)
+    regressions = 0
+    for name, modes in results.items():
+        for mode, stats in modes.items():
+            base = baseline.get(name, {}).get(mode)
+            status = compare(stats, base, tolerance)
+            regressions += status == "regression"
+            base_text = format_time(base["mean"]) if base else "-"
+            delta = f"{(stats.mean / base['mean'] - 1) * 100:+.0f}%" if base and base["mean"] else "-"
+            print(f"{name:<22} {mode:<5} {stats.n:>3} {format_time(stats.mean):>10} "
+                  f"{'±' + format_time(stats.ci):>10} {format_time(stats.median):>10} "
+                  f"{stats.ops_per_sec:>11,.0f} {base_text:>10} {delta:>7}  {marks[status]}")
+    return regressions
+
+
+def load_baseline(path: Path) -> Dict:
+    """Benchmark results from a baseline file ({} if missing or from another format version)"""
+    try:
+        data = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != BASELINE_VERSION:
+        return {}
+    return data.get("results", {})
+
+
+def write_results(path: Path, results: Dict[str, Dict[str, Stats]], params: Dict):
+    """Write results in the baseline format"""
+    data = {
+        "version": BASELINE_VERSION,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": params,
+        "results": {
+            name: {mode: {k: v for k, v in asdict(stats).items() if k != "samples"}
+                   for mode, stats in modes.items()}
+            for name, modes in results.items()
+        }
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding='utf-8')
+
+
+@instrumented("benchmark")
+def main():
+    """Main entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark the BMAD scripts and compare with a committed baseline",
+        epilog="Benchmarks: " + ", ".join(BENCHMARKS)
+    )
+    parser.add_argument("--only", help="Comma-separated benchmark names (default: all)")
+    parser.add_argument("--runs", type=int, default=15, help="Warm samples per benchmark (default: 15)")
+    parser.add_argument("--warmup", type=int, default=2, help="Untimed warm-up runs (default: 2)")
+    parser.add_argument("--cold-runs", type=int, default=5,
+                        help="Fresh-process samples per benchmark, 0 to skip cold runs (default: 5)")
+    parser.add_argument("--skills", type=int, default=300, help="Synthetic skills (default: 300)")
+    parser.add_argument("--goals", type=int, default=200, help="Synthetic goals (default: 200)")
+    parser.add_argument("--repeat", type=int, default=200, help="Operations per error/progress sample (default: 200)")
+    parser.add_argument("--seed", type=int, default=1234, help="Input generator seed (default: 1234)")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline JSON to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--json", dest="json_file", help="Also write the results to this file")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed slowdown beyond the confidence interval (default: 0.25 = 25%%)")
+    parser.add_argument("--cold-sample", help=argparse.SUPPRESS)
+    parser.add_argument("--workdir", help=argparse.SUPPRESS)
+    parser.add_argument("--params", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.cold_sample:
+        os.chdir(args.workdir)
+        print(json.dumps(cold_sample(args.cold_sample, Path(args.workdir), json.loads(args.params))))
+        return 0
+
+    names = [n.strip() for n in args.only.split(",")] if args.only else list(BENCHMARKS)
+    unknown = [n for n in names if n not in BENCHMARKS]
+    if unknown:
+        print(f"❌ Unknown benchmark(s): {', '.join(unknown)}. Available: {', '.join(BENCHMARKS)}",
+              file=sys.stderr)
+        return 2
+
+    params = {
+        "seed": args.seed, "skills": args.skills, "goals": args.goals, "repeat": args.repeat,
+        "runs": args.runs, "warmup": args.warmup, "cold_runs": args.cold_runs
+    }
+    colors = colors_for(sys.stdout)
+    baseline_path = Path(args.baseline)
+    baseline = load_baseline(baseline_path)
+
+    results: Dict[str, Dict[str, Stats]] = {}
+    with tempfile.TemporaryDirectory(prefix="bmad-bench-") as tmp:
+        workdir = Path(tmp)
+        generate_inputs(workdir, params)
+        previous_cwd = os.getcwd()
+        previous_cache_dir = os.environ.get("BMAD_CACHE_DIR")
+        os.chdir(workdir)
+        os.environ["BMAD_CACHE_DIR"] = str(workdir / "cache")
+        try:
+            for name in names:
+                bench = BENCHMARKS[name]
+                print(f"⏱️  {name}: {bench.description}", file=sys.stderr, flush=True)
+                modes = {}
+                if args.cold_runs > 0:
+                    modes["cold"] = run_cold(bench, workdir, params)
+                modes["warm"] = run_warm(bench, workdir, params)
+                results[name] = modes
+        finally:
+            os.chdir(previous_cwd)
+            if previous_cache_dir is None:
+                os.environ.pop("BMAD_CACHE_DIR", None)
+            else:
+                os.environ["BMAD_CACHE_DIR"] = previous_cache_dir
+
+    regressions = print_results(results, baseline, args.tolerance, colors)
+    if args.json_file:
+        write_results(Path(args.json_file), results, params)
+    if args.save_baseline:
+        write_results(baseline_path, results, params)
+        print(f"\n✓ Baseline written to {baseline_path}")
+        return 0
+    if not baseline:
+        print(f"\n⚠️  No baseline at {baseline_path}; run with --save-baseline to create one")
+    elif regressions:
+        print(f"\n{colors.RED}❌ {regressions} regression(s) beyond {args.tolerance:.0%} of baseline{colors.ENDC}")
+        return 1
+    else:
+        print(f"\n{colors.GREEN}✅ No regressions against {baseline_path.name}{colors.ENDC}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+BMAD Enhanced - Daemon Client
+
+Thin client for bmad-daemon.py. Runs a BMAD script inside the resident
+daemon when one is listening, and runs the script directly otherwise, so
+it is always safe to call. Start it with ``python3 -S`` for the fastest
+startup.
+
+Usage:
+    python3 -S scripts/bmad-client.py <tool> [script args...]
+    python3 -S scripts/bmad-client.py ping
+
+Tools: wizard, monitor, errors, analytics, report, progress, health
+"""
+
+import os
+import sys
+
+from bmadlib.rpc import TOOLS, request, socket_path
+
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def run_locally(tool: str, argv: list):
+    """Replace this process with the script itself (no daemon)"""
+    script = os.path.join(SCRIPTS_DIR, TOOLS[tool])
+    os.execv(sys.executable, [sys.executable, script] + argv)
+
+
+def start_daemon(path: str) -> bool:
+    """Start a background daemon for this project (BMAD_DAEMON=auto)"""
+    import subprocess
+
+    script = os.path.join(SCRIPTS_DIR, "bmad-daemon.py")
+    result = subprocess.run([sys.executable, script, "--socket", path, "start", "--detach"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return result.returncode == 0
+
+
+def needs_stdin(tool: str, argv: list) -> bool:
+    """Whether a script invocation reads standard input"""
+    if tool != "wizard" or "--batch" not in argv:
+        return False
+    i = argv.index("--batch") + 1
+    return i >= len(argv) or argv[i] == "-" or argv[i].startswith("--")
+
+
+def client_env() -> dict:
+    """Environment forwarded with a request (colors if our output is a terminal)"""
+    env = {k: v for k, v in os.environ.items() if k.startswith("BMAD_") or k == "NO_COLOR"}
+    if sys.stdout.isatty():
+        env.setdefault("BMAD_COLOR", "1")
+    return env
+
+
+def main():
+    """Main entry point"""
+    if len(sys.argv) < 2 or sys.argv[1] in ("-h", "--help"):
+        print(__doc__.strip().split("\n\n", 1)[1])
+        return 0
+
+    tool, argv = sys.argv[1], sys.argv[2:]
+    path = socket_path()
+
+    if tool == "ping":
+        try:
+            info = request({"op": "ping"}, path, timeout=2.0)
+        except OSError:
+            print(f"BMAD daemon not running ({path})")
+            return 1
+        print(f"pid {info['pid']}, up {info['uptime_s']}s, {info['requests']} requests")
+        return 0
+
+    if tool not in TOOLS:
+        print(f"❌ Unknown tool '{tool}'. Tools: {', '.join(TOOLS)}", file=sys.stderr)
+        return 2
+
+    # Interactive sessions need a terminal, which the daemon doesn't have
+    if tool == "wizard" and not argv:
+        run_locally(tool, argv)
+
+    message = {
+        "op": "run",
+        "tool": tool,
+        "argv": argv,
+        "env": client_env(),
+        "stdin": sys.stdin.read() if needs_stdin(tool, argv) else None
+    }
+    try:
+        response = request(message, path)
+    except OSError:
+        if os.environ.get("BMAD_DAEMON") == "auto" and start_daemon(path):
+            try:
+                response = request(message, path)
+            except OSError:
+                run_locally(tool, argv)
+        else:
+            run_locally(tool, argv)
+
+    if not response.get("ok"):
+        print(f"❌ BMAD daemon: {response.get('error')}", file=sys.stderr)
+        return 1
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    return response["exit"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
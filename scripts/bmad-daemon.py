@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+BMAD Enhanced - Resident Daemon
+
+Long-lived local server for the BMAD scripts. It imports the wizard,
+skill monitor, error handler and reporting scripts once, keeps their
+indexes, caches and telemetry sinks warm, and serves requests from
+bmad-client.py over a Unix socket.
+"""
+
+import io
+import os
+import sys
+import time
+import threading
+import socketserver
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Dict, Optional
+
+from bmadlib import metrics
+from bmadlib.loader import SCRIPTS_DIR, load_script as load_tool_script
+from bmadlib.rpc import TOOLS, decode, encode, request, socket_path
+from bmadlib.telemetry import get_writer
+
+
+# Environment variables a client forwards for each request
+FORWARDED_ENV_PREFIXES = ("BMAD_", "NO_COLOR")
+
+REQUESTS_TOTAL = metrics.counter("bmad_daemon_requests_total", "Requests served by the daemon", ["op"])
+
+
+def load_script(tool: str):
+    """Import the script behind a client tool name"""
+    return load_tool_script(TOOLS[tool])
+
+
+def cache_skill_analysis(monitor_module):
+    """Make the skill monitor reuse analyses of unchanged SKILL.md files
+
+    Discovery still walks the skills tree on every request, but a file is
+    only re-read and its frontmatter re-parsed when its size or mtime
+    changed.
+    """
+    base = monitor_module.SkillMonitor
+    cache: Dict[str, tuple] = {}
+
+    class CachedSkillMonitor(base):
+        def _analyze_skill(self, skill_file: Path):
+            try:
+                st = skill_file.stat()
+                key = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                return super()._analyze_skill(skill_file)
+            cached = cache.get(str(skill_file))
+            if cached and cached[0] == key:
+                return cached[1]
+            info = super()._analyze_skill(skill_file)
+            cache[str(skill_file)] = (key, info)
+            return info
+
+    monitor_module.SkillMonitor = CachedSkillMonitor
+
+
+class BMADDaemon:
+    """Request dispatcher holding the warm state shared across requests
+
+    Script invocations (``run``) swap process-wide state such as
+    ``sys.argv``, standard streams and environment variables, and the other
+    ops call into the same scripts, which read that state. So every request
+    that touches script code holds ``run_lock``; only ``ping`` and ``stop``
+    are answered concurrently.
+    """
+
+    # Ops that never touch script state
+    CONCURRENT_OPS = ("ping", "stop")
+
+    def __init__(self, root: Path, idle_timeout: float = 1800.0):
+        self.root = root
+        self.idle_timeout = idle_timeout
+        self.started = time.time()
+        self.last_request = time.monotonic()
+        self.requests = 0
+        self.run_lock = threading.Lock()
+        self.server: Optional[socketserver.UnixStreamServer] = None
+        self.error_handler = None
+        self.metrics_server = None
+
+    def preload(self):
+        """Import scripts and build the indexes requests will need"""
+        wizard = load_script("wizard")
+        wizard.get_command_index()
+        wizard.get_name_index()
+        cache_skill_analysis(load_script("monitor"))
+        errors = load_script("errors")
+        self.error_handler = errors.ErrorHandler(db_path=str(self.root / ".claude/logs/errors.db"))
+        for tool in ("analytics", "report", "progress"):
+            load_script(tool)
+        get_writer()
+
+    def start_metrics(self, port: int, host: str = "127.0.0.1", interval: float = 300.0):
+        """Serve Prometheus metrics and keep the skill metrics fresh
+
+        Skills are scanned once now and then every ``interval`` seconds (and
+        on every ``monitor`` request); scrapes only read the latest values.
+        """
+        self.scan_skills()
+        self.metrics_server = metrics.serve(port, host)
+        if interval > 0:
+            threading.Thread(target=self._rescan_skills, args=(interval,), name="bmad-skill-scan",
+                             daemon=True).start()
+
+    def scan_skills(self):
+        """Rescan the skills tree, updating the skill metrics"""
+        monitor = load_script("monitor")
+        with self.run_lock, redirect_stdout(io.StringIO()):
+            monitor.SkillMonitor(str(self.root / ".claude/skills")).discover_skills()
+
+    def handle(self, message: Dict) -> Dict:
+        """Dispatch one request"""
+        self.requests += 1
+        self.last_request = time.monotonic()
+        op = message.get("op")
+        handler = getattr(self, f"op_{op}", None) if isinstance(op, str) else None
+        if handler is None:
+            return {"ok": False, "error": f"unknown op: {op!r}"}
+        REQUESTS_TOTAL.inc(op=op)
+        try:
+            if op in self.CONCURRENT_OPS:
+                result = handler(message)
+            else:
+                with self.run_lock:
+                    result = handler(message)
+        except Exception as e:
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        result["ok"] = True
+        return result
+
+    def op_ping(self, message: Dict) -> Dict:
+        """Liveness and basic counters"""
+        return {
+            "pid": os.getpid(),
+            "root": str(self.root),
+            "uptime_s": round(time.time() - self.started, 1),
+            "requests": self.requests
+        }
+
+    def op_stop(self, message: Dict) -> Dict:
+        """Shut the daemon down after replying"""
+        threading.Thread(target=self.server.shutdown, daemon=True).start()
+        return {"stopping": True}
+
+    def op_run(self, message: Dict) -> Dict:
+        """Run a script's main() in-process and return its output and exit code"""
+        tool = message.get("tool")
+        if tool not in TOOLS:
+            raise ValueError(f"unknown tool: {tool!r}")
+        module = load_script(tool)
+        argv = [str(arg) for arg in message.get("argv", [])]
+        stdout, stderr = io.StringIO(), io.StringIO()
+
+        # Called with run_lock held (see handle)
+        saved_argv, saved_stdin = sys.argv, sys.stdin
+        saved_env = self._apply_env(message.get("env", {}))
+        sys.argv = [os.path.join(SCRIPTS_DIR, TOOLS[tool])] + argv
+        sys.stdin = io.StringIO(message.get("stdin") or "")
+        try:
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                try:
+                    code = module.main()
+                except SystemExit as e:
+                    code = e.code
+                finally:
+                    # Progress events still queued belong to this request's stderr
+                    load_script("progress").close_event_stream()
+        finally:
+            sys.argv, sys.stdin = saved_argv, saved_stdin
+            self._restore_env(saved_env)
+
+        if not isinstance(code, int):
+            if code is not None:
+                stderr.write(f"{code}\n")
+            code = 0 if code is None else 1
+        return {"exit": code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+    def op_recommend(self, message: Dict) -> Dict:
+        """Ranked commands for a goal"""
+        wizard = load_script("wizard")
+        ranked = wizard.search_commands(message["goal"], int(message.get("k", 5)))
+        return {"results": [{"subagent": s, "command": c, "score": round(score, 4)} for s, c, score in ranked]}
+
+    def op_resolve(self, message: Dict) -> Dict:
+        """Fuzzy matches for a command or subagent name"""
+        wizard = load_script("wizard")
+        matches = wizard.suggest_names(message["name"], int(message.get("k", 5)))
+        return {"matches": [{"name": m.name, "target": list(m.target), "distance": m.distance,
+                             "score": m.score} for m in matches]}
+
+    def op_error(self, message: Dict) -> Dict:
+        """Format an error from a template, optionally logging it to the error database"""
+        error = self.error_handler.create_error(message["template"], message.get("context"))
+        if message.get("log"):
+            self.error_handler.sink.write(error)
+            load_script("errors").ERRORS_TOTAL.inc(category=error.category.value, severity=error.severity.value)
+        return {"text": error.format(), "record": error.to_dict()}
+
+    def op_telemetry(self, message: Dict) -> Dict:
+        """Queue a telemetry record on the shared writer"""
+        load_script("progress").observe_telemetry(message["record"])
+        writer = get_writer()
+        return {"queued": bool(writer and writer.write(message["record"]))}
+
+    def serve(self, path: str):
+        """Listen on a Unix socket until stopped or idle for too long"""
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                line = self.rfile.readline()
+                if not line:
+                    return
+                try:
+                    response = daemon.handle(decode(line))
+                except ValueError as e:
+                    response = {"ok": False, "error": f"bad request: {e}"}
+                self.wfile.write(encode(response))
+
+        class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+            daemon_threads = True
+
+        if os.path.exists(path):
+            os.unlink(path)
+        old_umask = os.umask(0o177)
+        try:
+            self.server = Server(path, Handler)
+        finally:
+            os.umask(old_umask)
+
+        threading.Thread(target=self._watch_idle, name="bmad-idle", daemon=True).start()
+        try:
+            self.server.serve_forever(poll_interval=0.5)
+        finally:
+            self.server.server_close()
+            if os.path.exists(path):
+                os.unlink(path)
+            if self.metrics_server:
+                self.metrics_server.shutdown()
+            if self.error_handler:
+                self.error_handler.close()
+            writer = get_writer()
+            if writer:
+                writer.close()
+
+    def _watch_idle(self):
+        """Stop the server after idle_timeout seconds without requests"""
+        while self.idle_timeout > 0:
+            time.sleep(min(self.idle_timeout, 30.0))
+            if time.monotonic() - self.last_request >= self.idle_timeout:
+                self.server.shutdown()
+                return
+
+    def _rescan_skills(self, interval: float):
+        """Rescan skills every interval seconds"""
+        while True:
+            time.sleep(interval)
+            try:
+                self.scan_skills()
+            except Exception as e:
+                print(f"⚠️  Skill scan failed: {e}", file=sys.stderr)
+
+    @staticmethod
+    def _apply_env(env: Dict[str, str]) -> Dict[str, Optional[str]]:
+        """Apply a request's forwarded environment; returns the values to restore"""
+        saved = {}
+        keys = {key for key in os.environ if key.startswith(FORWARDED_ENV_PREFIXES)} | set(env)
+        for key in keys:
+            if not key.startswith(FORWARDED_ENV_PREFIXES):
+                continue
+            saved[key] = os.environ.get(key)
+            if key in env:
+                os.environ[key] = env[key]
+            else:
+                os.environ.pop(key, None)
+        return saved
+
+    @staticmethod
+    def _restore_env(saved: Dict[str, Optional[str]]):
+        """Undo _apply_env"""
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def start_detached(path: str, idle_timeout: float, extra_args: Optional[list] = None) -> int:
+    """Start the daemon in the background and wait for it to listen"""
+    import subprocess
+
+    log_path = Path(".claude/logs/daemon.log")
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_path, 'a') as log:
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "start", "--idle-timeout", str(idle_timeout)]
+            + (extra_args or []),
+            stdin=subprocess.DEVNULL, stdout=log, stderr=log, start_new_session=True
+        )
+    deadline = time.monotonic() + 10.0
+    while time.monotonic() < deadline:
+        try:
+            info = request({"op": "ping"}, path, timeout=1.0)
+            print(f"✓ BMAD daemon running (pid {info['pid']}, socket {path})", file=sys.stderr)
+            return 0
+        except OSError:
+            time.sleep(0.05)
+    print(f"❌ BMAD daemon did not start; see {log_path}", file=sys.stderr)
+    return 1
+
+
+def main():
+    """Main entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Resident BMAD daemon serving the scripts over a Unix socket"
+    )
+    parser.add_argument("--socket", help="Socket path (default: per project, see BMAD_DAEMON_SOCKET)")
+    subparsers = parser.add_subparsers(dest="command")
+
+    start_parser = subparsers.add_parser("start", help="Run the daemon in the foreground")
+    start_parser.add_argument("--detach", action="store_true", help="Run in the background")
+    start_parser.add_argument("--idle-timeout", type=float, default=1800.0,
+                              help="Exit after this many idle seconds, 0 to never exit (default: 1800)")
+    start_parser.add_argument("--metrics-port", type=int,
+                              help="Serve Prometheus metrics on http://HOST:PORT/metrics")
+    start_parser.add_argument("--metrics-host", default="127.0.0.1",
+                              help="Address for the metrics endpoint (default: 127.0.0.1)")
+    start_parser.add_argument("--metrics-interval", type=float, default=300.0,
+                              help="Seconds between skill rescans for metrics, 0 to only scan on "
+                                   "monitor requests (default: 300)")
+    subparsers.add_parser("stop", help="Stop a running daemon")
+    subparsers.add_parser("status", help="Show whether a daemon is running")
+
+    args = parser.parse_args()
+    root = Path.cwd().resolve()
+    path = args.socket or socket_path(str(root))
+
+    if args.command in ("stop", "status"):
+        try:
+            info = request({"op": "ping"}, path, timeout=2.0)
+        except OSError:
+            print(f"BMAD daemon not running ({path})")
+            return 0 if args.command == "stop" else 1
+        if args.command == "stop":
+            request({"op": "stop"}, path, timeout=2.0)
+            print(f"✓ Stopped BMAD daemon (pid {info['pid']})")
+        else:
+            print(f"BMAD daemon running: pid {info['pid']}, up {info['uptime_s']}s, "
+                  f"{info['requests']} requests, root {info['root']}")
+        return 0
+
+    if args.command != "start":
+        parser.print_help()
+        return 1
+
+    try:
+        request({"op": "ping"}, path, timeout=1.0)
+        print(f"⚠️  BMAD daemon already running on {path}", file=sys.stderr)
+        return 0
+    except OSError:
+        pass
+
+    metrics_args = []
+    if args.metrics_port is not None:
+        metrics_args = ["--metrics-port", str(args.metrics_port), "--metrics-host", args.metrics_host,
+                        "--metrics-interval", str(args.metrics_interval)]
+    if args.detach:
+        return start_detached(path, args.idle_timeout, metrics_args)
+
+    daemon = BMADDaemon(root, idle_timeout=args.idle_timeout)
+    start = time.perf_counter()
+    daemon.preload()
+    if args.metrics_port is not None:
+        try:
+            daemon.start_metrics(args.metrics_port, args.metrics_host, args.metrics_interval)
+        except OSError as e:
+            print(f"❌ Cannot serve metrics on {args.metrics_host}:{args.metrics_port}: {e}", file=sys.stderr)
+            return 1
+        print(f"✓ Metrics at http://{args.metrics_host}:{args.metrics_port}/metrics", file=sys.stderr)
+    print(f"✓ BMAD daemon ready in {(time.perf_counter() - start) * 1000:.0f}ms "
+          f"(pid {os.getpid()}, socket {path})", file=sys.stderr)
+    try:
+        daemon.serve(path)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
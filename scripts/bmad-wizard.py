@@ -4,20 +4,17 @@ BMAD Enhanced - Interactive Command Wizard
 Helps users select the right subagent and command for their task.
 """
 
+import re
 import sys
-from typing import Dict, List, Tuple
-
-# ANSI color codes for terminal output
-class Colors:
-    HEADER = '\033[95m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
-    UNDERLINE = '\033[4m'
+import json
+import time
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from bmadlib.fuzzy import FuzzyIndex, Match
+from bmadlib.output import Colors, Report, colors_for, limited
+from bmadlib.profiling import instrumented, phase
+from bmadlib.search import BM25Index, STOPWORDS, stem, tokenize
 
 # Command database with metadata
 COMMANDS = {
@@ -324,58 +321,380 @@ GOAL_MAPPING = {
 }
 
 
-def print_header(text: str):
+def print_header(text: str, c=Colors):
     """Print formatted header"""
-    print(f"\n{Colors.BOLD}{Colors.CYAN}{'=' * 70}{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.CYAN}{text.center(70)}{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.CYAN}{'=' * 70}{Colors.ENDC}\n")
+    print(f"\n{c.BOLD}{c.CYAN}{'=' * 70}{c.ENDC}")
+    print(f"{c.BOLD}{c.CYAN}{text.center(70)}{c.ENDC}")
+    print(f"{c.BOLD}{c.CYAN}{'=' * 70}{c.ENDC}\n")
 
 
-def print_section(text: str):
+def print_section(text: str, c=Colors):
     """Print section header"""
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{text}{Colors.ENDC}")
-    print(f"{Colors.BLUE}{'-' * len(text)}{Colors.ENDC}")
+    print(f"\n{c.BOLD}{c.BLUE}{text}{c.ENDC}")
+    print(f"{c.BLUE}{'-' * len(text)}{c.ENDC}")
 
 
-def print_command(subagent: str, command: str, details: Dict):
+def print_command(subagent: str, command: str, details: Dict, c=Colors):
     """Print formatted command details"""
-    print(f"\n{Colors.BOLD}{Colors.GREEN}Command: {command}{Colors.ENDC}")
-    print(f"{Colors.YELLOW}Description:{Colors.ENDC} {details['description']}")
-    print(f"{Colors.YELLOW}Complexity:{Colors.ENDC} {details['complexity']}")
-    print(f"{Colors.YELLOW}Duration:{Colors.ENDC} {details['duration']}")
+    print(f"\n{c.BOLD}{c.GREEN}Command: {command}{c.ENDC}")
+    print(f"{c.YELLOW}Description:{c.ENDC} {details['description']}")
+    print(f"{c.YELLOW}Complexity:{c.ENDC} {details['complexity']}")
+    print(f"{c.YELLOW}Duration:{c.ENDC} {details['duration']}")
 
-    print(f"\n{Colors.YELLOW}Use when:{Colors.ENDC}")
+    print(f"\n{c.YELLOW}Use when:{c.ENDC}")
     for use_case in details['use_when']:
         print(f"  • {use_case}")
 
-    print(f"\n{Colors.YELLOW}Example:{Colors.ENDC}")
-    print(f"  {Colors.CYAN}{details['example']}{Colors.ENDC}")
+    print(f"\n{c.YELLOW}Example:{c.ENDC}")
+    print(f"  {c.CYAN}{details['example']}{c.ENDC}")
+
+
+# Relative weight of each metadata field in the command index
+INDEX_WEIGHTS = {
+    "command": 3.0,
+    "keywords": 2.0,
+    "description": 2.0,
+    "use_when": 1.5,
+    "subagent": 1.0,
+    "example": 0.5
+}
+
+_command_index: Optional[BM25Index] = None
+
+
+def build_command_index() -> BM25Index:
+    """Build a BM25 index over all command metadata and goal keywords"""
+    keywords: Dict[Tuple[str, str], List[str]] = {}
+    for mapping in GOAL_MAPPING.values():
+        for cmd in mapping['recommended_commands']:
+            keywords.setdefault((mapping['subagent'], cmd), []).extend(mapping['keywords'])
+
+    index = BM25Index()
+    for subagent_key, subagent_info in COMMANDS.items():
+        for cmd, details in subagent_info['commands'].items():
+            index.add(f"{subagent_key}:{cmd}", {
+                "command": cmd.replace("-", " "),
+                "keywords": " ".join(keywords.get((subagent_key, cmd), [])),
+                "description": details['description'],
+                "use_when": " ".join(details['use_when']),
+                "subagent": f"{subagent_key} {subagent_info['name']}",
+                "example": details['example']
+            }, weights=INDEX_WEIGHTS, meta={"subagent": subagent_key, "command": cmd,
+                                            "name_terms": tokenize(cmd.replace("-", " "))})
+    return index
+
+
+def get_command_index() -> BM25Index:
+    """Return the command index, building it on first use"""
+    global _command_index
+    if _command_index is None:
+        with phase("indexing"):
+            _command_index = build_command_index()
+            _command_index.build()
+    return _command_index
+
+
+def search_commands(goal: str, k: int = 5) -> List[Tuple[str, str, float]]:
+    """Rank commands for a goal, returning (subagent, command, score), best first
+
+    A command named in full by the goal ("review code" names ``*review``)
+    gets the best plain BM25 score as a bonus, so it outranks commands that
+    only share words with its description.
+    """
+    index = get_command_index()
+    terms = set(tokenize(goal))
+    results = []
+    with phase("search"):
+        hits = index.search(goal, len(index))
+        bonus = hits[0][1] if hits else 0.0
+        for doc_id, score in hits:
+            meta = index.meta(doc_id)
+            if terms.issuperset(meta["name_terms"]):
+                score += bonus
+            results.append((meta["subagent"], meta["command"], score))
+        results.sort(key=lambda result: -result[2])
+    return results[:k]
+
+
+def recommend_by_goal(goal: str) -> Tuple[Optional[str], List[str]]:
+    """Recommend subagent and commands based on user goal
+
+    The subagent owning the best-scoring command is recommended, with its
+    matching commands in rank order.
+    """
+    ranked = search_commands(goal, k=5)
+    if not ranked:
+        # Default to showing all options
+        return None, []
+    subagent = ranked[0][0]
+    return subagent, [cmd for owner, cmd, _ in ranked if owner == subagent]
+
+
+# Role names people use for subagents
+SUBAGENT_ALIASES = {
+    "planner": "alex",
+    "developer": "james",
+    "dev": "james",
+    "quality": "quinn",
+    "qa": "quinn",
+    "orch": "orchestrator",
+}
+
+_name_index: Optional[FuzzyIndex] = None
+
+
+def get_name_index() -> FuzzyIndex:
+    """Fuzzy index over subagent names, aliases and commands
+
+    Targets are ``("subagent", key)`` or ``("command", subagent, command)``.
+    """
+    global _name_index
+    if _name_index is None:
+        index = FuzzyIndex()
+        for key, info in COMMANDS.items():
+            index.add(key, ("subagent", key))
+            for cmd in info['commands']:
+                index.add(cmd, ("command", key, cmd))
+        for alias, key in SUBAGENT_ALIASES.items():
+            index.add(alias, ("subagent", key))
+        _name_index = index
+    return _name_index
+
+
+def suggest_names(query: str, k: int = 5, kind: Optional[str] = None) -> List[Match]:
+    """Ranked fuzzy matches for a subagent or command name"""
+    matches = get_name_index().lookup(query, k=k * 2 if kind else k)
+    if kind:
+        matches = [m for m in matches if m.target[0] == kind]
+    return matches[:k]
 
 
-def recommend_by_goal(goal: str) -> Tuple[str, List[str]]:
-    """Recommend subagent and commands based on user goal"""
-    goal_lower = goal.lower()
+def resolve_subagent(name: str) -> Optional[str]:
+    """Subagent key for a possibly misspelt name or alias, if unambiguous"""
+    matches = suggest_names(name, kind="subagent")
+    if not matches:
+        return None
+    if matches[0].distance == 0 or len({m.target for m in matches if m.distance == matches[0].distance}) == 1:
+        return matches[0].target[1]
+    return None
 
-    # Check each goal category
-    for category, mapping in GOAL_MAPPING.items():
-        if any(keyword in goal_lower for keyword in mapping['keywords']):
-            return mapping['subagent'], mapping['recommended_commands']
 
-    # Default to showing all options
-    return None, []
+def resolve_command(name: str) -> Optional[Tuple[str, str]]:
+    """(subagent, command) for a possibly misspelt command name, if unambiguous"""
+    target = get_name_index().resolve(name)
+    if target and target[0] == "command":
+        return target[1], target[2]
+    return None
+
+
+def _did_you_mean(query: str, kind: str) -> str:
+    """A 'Did you mean ...?' hint, or an empty string"""
+    names = [m.name for m in suggest_names(query, k=3, kind=kind)]
+    return f" Did you mean {', '.join(names)}?" if names else ""
+
+
+def show_command(name: str, c=Colors):
+    """Show one command's details, tolerating typos in its name"""
+    resolved = resolve_command(name)
+    if not resolved:
+        print(f"{c.RED}Error: Unknown command '{name}'.{_did_you_mean(name, 'command')}{c.ENDC}")
+        return
+    subagent, cmd = resolved
+    if cmd.lstrip("*") != name.strip().lstrip("*"):
+        print(f"{c.YELLOW}Showing {cmd} for '{name}'{c.ENDC}")
+    print_command(subagent, cmd, COMMANDS[subagent]['commands'][cmd], c)
+
+
+def show_recommendations(goal: str, k: int = 5, c=Colors):
+    """Print ranked command recommendations with scores"""
+    get_command_index()
+    start = time.perf_counter()
+    ranked = search_commands(goal, k)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    with phase("rendering"):
+        print_section(f"Top {k} commands for: '{goal}'", c)
+        if not ranked:
+            print(f"{c.YELLOW}No matching commands. Try --list-all.{c.ENDC}")
+            return
+        for i, (subagent, cmd, score) in enumerate(ranked, 1):
+            details = COMMANDS[subagent]['commands'][cmd]
+            print(f"{c.BOLD}[{i}] {cmd}{c.ENDC} ({COMMANDS[subagent]['name']})  "
+                  f"{c.YELLOW}score {score:.2f}{c.ENDC}")
+            print(f"    {details['description']}")
+            print(f"    {c.CYAN}{details['example']}{c.ENDC}")
+        print(f"\n{c.BOLD}Search time:{c.ENDC} {elapsed_ms:.3f}ms")
+
+
+BATCH_CHUNK_SIZE = 2000
+
+
+def route_goal(line: str, number: int, k: int = 5) -> Dict:
+    """Rank commands for one JSONL goal record
+
+    A record is ``{"goal": "..."}`` (any other fields such as ``id`` are
+    passed through) or a bare JSON string. Unparseable records produce an
+    ``error`` entry instead of stopping the batch.
+    """
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError as e:
+        return {"line": number, "error": f"invalid JSON: {e}"}
+    if isinstance(record, str):
+        record = {"goal": record}
+    if not isinstance(record, dict) or not isinstance(record.get("goal"), str):
+        return {"line": number, "error": "expected an object with a 'goal' string"}
+
+    ranked = search_commands(record["goal"], k)
+    result = dict(record)
+    result["line"] = number
+    result["subagent"] = ranked[0][0] if ranked else None
+    result["recommendations"] = [
+        {"subagent": subagent, "command": cmd, "score": round(score, 4)}
+        for subagent, cmd, score in ranked
+    ]
+    return result
+
+
+def _route_chunk(chunk: List[Tuple[int, str]], k: int) -> Tuple[List[str], int]:
+    """Route a chunk of (line number, line) pairs; returns (JSONL lines, error count)"""
+    results = [route_goal(line, number, k) for number, line in chunk]
+    errors = sum(1 for result in results if "error" in result and "recommendations" not in result)
+    return [json.dumps(result, ensure_ascii=False) for result in results], errors
+
+
+def _read_chunks(stream: Iterable[str], size: int) -> Iterator[List[Tuple[int, str]]]:
+    """Non-blank input lines with their line numbers, in chunks"""
+    numbered = ((n, line) for n, line in enumerate(stream, 1) if line.strip())
+    while True:
+        chunk = list(islice(numbered, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_batch(source: TextIO, output: TextIO, k: int = 5, jobs: int = 1) -> Dict[str, int]:
+    """Route every goal in a JSONL stream, writing JSONL results in input order
+
+    The command index is built once per process. With jobs > 1, chunks of
+    input are scored in worker processes while the parent keeps reading,
+    holding at most a couple of chunks per worker in flight.
+    """
+    counts = {"goals": 0, "errors": 0}
+
+    def write(routed: Tuple[List[str], int]):
+        lines, errors = routed
+        counts["goals"] += len(lines)
+        counts["errors"] += errors
+        output.write("\n".join(lines) + "\n")
+
+    chunks = _read_chunks(source, BATCH_CHUNK_SIZE)
+    if jobs <= 1:
+        get_command_index()
+        for chunk in chunks:
+            write(_route_chunk(chunk, k))
+        return counts
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=get_command_index) as pool:
+        pending = []
+        for chunk in chunks:
+            pending.append(pool.submit(_route_chunk, chunk, k))
+            if len(pending) >= jobs * 2:
+                write(pending.pop(0).result())
+        for future in pending:
+            write(future.result())
+    return counts
+
+
+def batch_mode(path: Optional[str], k: int = 5, jobs: int = 1, output_path: Optional[str] = None) -> int:
+    """Route JSONL goals from a file (or stdin) and report throughput on stderr"""
+    start = time.perf_counter()
+    try:
+        source = sys.stdin if path in (None, "-") else open(path, encoding='utf-8')
+        output = sys.stdout if output_path in (None, "-") else open(output_path, 'w', encoding='utf-8')
+    except OSError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    try:
+        counts = run_batch(source, output, k, jobs)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+        else:
+            output.flush()
 
+    elapsed = time.perf_counter() - start
+    rate = counts["goals"] / elapsed if elapsed > 0 else 0.0
+    print(f"✓ Routed {counts['goals']} goals in {elapsed:.2f}s ({rate:,.0f}/s)", file=sys.stderr)
+    if counts["errors"]:
+        print(f"⚠️  {counts['errors']} record(s) could not be parsed", file=sys.stderr)
+    return 0
 
-def interactive_mode():
+
+def _option(name: str, default=None):
+    """Value following a command-line option, or default if absent"""
+    if name not in sys.argv:
+        return default
+    return sys.argv[sys.argv.index(name) + 1]
+
+
+def highlight(text: str, query: str, c=Colors) -> str:
+    """Highlight words of text that share a stem with a query word"""
+    terms = {stem(w) for w in re.findall(r"[a-z0-9]+", query.lower()) if w not in STOPWORDS}
+
+    def mark(match):
+        word = match.group(0)
+        return f"{c.BOLD}{word}{c.ENDC}" if stem(word.lower()) in terms else word
+
+    return re.sub(r"[A-Za-z0-9]+", mark, text)
+
+
+def search_docs(query: str, k: int = 10, reindex: bool = False, c=Colors):
+    """Search documentation and .bmad-core assets by section"""
+    from bmadlib.docsearch import DocsIndex, find_root, timed_search
+
+    index = DocsIndex(find_root())
+    try:
+        if reindex:
+            index.refresh(force=True)
+        changes, results, elapsed_ms = timed_search(index, query, k)
+    finally:
+        index.close()
+
+    with phase("rendering"):
+        print_section(f"Documentation matches for: '{query}'", c)
+        if not results:
+            print(f"{c.YELLOW}No matching sections.{c.ENDC}")
+        for i, hit in enumerate(results, 1):
+            where = " › ".join(part for part in (hit['resource'], hit['heading']) if part)
+            print(f"{c.BOLD}[{i}] {hit['path']}:{hit['line']}{c.ENDC}  "
+                  f"{c.YELLOW}score {hit['score']:.2f}{c.ENDC}")
+            if where:
+                print(f"    {c.GREEN}{where}{c.ENDC}")
+            if hit['snippet']:
+                print(f"    {highlight(hit['snippet'], query, c)}")
+
+        print(f"\n{c.BOLD}Search time:{c.ENDC} {elapsed_ms:.1f}ms")
+        if changes['updated'] or changes['removed']:
+            print(f"{c.CYAN}Reindexed {changes['updated']} file(s), removed {changes['removed']} "
+                  f"({changes['scanned']} scanned){c.ENDC}")
+
+
+def interactive_mode(c=Colors):
     """Run interactive wizard"""
-    print_header("BMAD Enhanced - Command Wizard")
+    print_header("BMAD Enhanced - Command Wizard", c)
 
-    print(f"{Colors.BOLD}Welcome to the BMAD Enhanced Command Wizard!{Colors.ENDC}")
+    print(f"{c.BOLD}Welcome to the BMAD Enhanced Command Wizard!{c.ENDC}")
     print("This tool helps you find the right command for your task.\n")
 
     # Step 1: Get user goal
-    print(f"{Colors.BOLD}What would you like to do?{Colors.ENDC}")
+    print(f"{c.BOLD}What would you like to do?{c.ENDC}")
     print("(Describe your goal in a few words, e.g., 'implement a new feature', 'fix a bug', 'review code')")
-    print(f"{Colors.YELLOW}> {Colors.ENDC}", end="")
+    print(f"{c.YELLOW}> {c.ENDC}", end="")
 
     try:
         user_goal = input().strip()
@@ -384,35 +703,40 @@ def interactive_mode():
         return
 
     if not user_goal:
-        print(f"\n{Colors.RED}No input provided. Exiting.{Colors.ENDC}")
+        print(f"\n{c.RED}No input provided. Exiting.{c.ENDC}")
+        return
+
+    # A command name (even misspelt) goes straight to its details
+    if user_goal.startswith("*") and len(user_goal.split()) == 1:
+        show_command(user_goal, c)
         return
 
     # Step 2: Get recommendations
     recommended_subagent, recommended_commands = recommend_by_goal(user_goal)
 
     if recommended_subagent:
-        print_section(f"Recommendation for: '{user_goal}'")
+        print_section(f"Recommendation for: '{user_goal}'", c)
 
         subagent_info = COMMANDS[recommended_subagent]
-        print(f"\n{Colors.BOLD}Recommended Subagent:{Colors.ENDC} {Colors.GREEN}{subagent_info['name']}{Colors.ENDC}")
-        print(f"{Colors.YELLOW}Description:{Colors.ENDC} {subagent_info['description']}")
-        print(f"{Colors.YELLOW}Documentation:{Colors.ENDC} {subagent_info['doc']}")
+        print(f"\n{c.BOLD}Recommended Subagent:{c.ENDC} {c.GREEN}{subagent_info['name']}{c.ENDC}")
+        print(f"{c.YELLOW}Description:{c.ENDC} {subagent_info['description']}")
+        print(f"{c.YELLOW}Documentation:{c.ENDC} {subagent_info['doc']}")
 
-        print(f"\n{Colors.BOLD}Recommended Commands:{Colors.ENDC}")
+        print(f"\n{c.BOLD}Recommended Commands:{c.ENDC}")
 
         for i, cmd in enumerate(recommended_commands, 1):
             if cmd in subagent_info['commands']:
                 cmd_details = subagent_info['commands'][cmd]
-                print(f"\n{Colors.BOLD}[{i}] {cmd}{Colors.ENDC}")
+                print(f"\n{c.BOLD}[{i}] {cmd}{c.ENDC}")
                 print(f"    {cmd_details['description']}")
-                print(f"    {Colors.CYAN}{cmd_details['example']}{Colors.ENDC}")
+                print(f"    {c.CYAN}{cmd_details['example']}{c.ENDC}")
 
         # Step 3: Ask if user wants more details
-        print(f"\n{Colors.BOLD}Would you like to:{Colors.ENDC}")
+        print(f"\n{c.BOLD}Would you like to:{c.ENDC}")
         print("  1. See detailed information about a command")
         print("  2. Browse all commands")
         print("  3. Exit")
-        print(f"{Colors.YELLOW}Choice (1-3): {Colors.ENDC}", end="")
+        print(f"{c.YELLOW}Choice (1-3): {c.ENDC}", end="")
 
         try:
             choice = input().strip()
@@ -421,107 +745,182 @@ def interactive_mode():
             return
 
         if choice == "1":
-            print(f"{Colors.YELLOW}Enter command number (1-{len(recommended_commands)}): {Colors.ENDC}", end="")
+            print(f"{c.YELLOW}Enter command number (1-{len(recommended_commands)}): {c.ENDC}", end="")
             try:
                 cmd_num = int(input().strip())
                 if 1 <= cmd_num <= len(recommended_commands):
                     cmd = recommended_commands[cmd_num - 1]
-                    print_command(recommended_subagent, cmd, subagent_info['commands'][cmd])
+                    print_command(recommended_subagent, cmd, subagent_info['commands'][cmd], c)
                 else:
-                    print(f"{Colors.RED}Invalid command number.{Colors.ENDC}")
+                    print(f"{c.RED}Invalid command number.{c.ENDC}")
             except (ValueError, EOFError, KeyboardInterrupt):
-                print(f"\n{Colors.RED}Invalid input.{Colors.ENDC}")
+                print(f"\n{c.RED}Invalid input.{c.ENDC}")
         elif choice == "2":
-            browse_all_commands()
+            browse_all_commands(c=c)
         else:
             print("\nExiting wizard.")
     else:
-        print(f"\n{Colors.YELLOW}No specific recommendation found. Showing all available commands.{Colors.ENDC}")
-        browse_all_commands()
+        print(f"\n{c.YELLOW}No specific recommendation found. Showing all available commands.{c.ENDC}")
+        browse_all_commands(c=c)
 
     # Final message
-    print(f"\n{Colors.BOLD}{Colors.GREEN}For more information, see:{Colors.ENDC}")
-    print(f"  • Documentation Index: {Colors.CYAN}docs/DOCUMENTATION-INDEX.md{Colors.ENDC}")
-    print(f"  • Quick Start Guides: {Colors.CYAN}docs/quickstart-*.md{Colors.ENDC}")
-    print(f"  • V2 Architecture: {Colors.CYAN}docs/V2-ARCHITECTURE.md{Colors.ENDC}\n")
-
-
-def browse_all_commands():
-    """Browse all available commands"""
-    print_section("All Available Commands")
-
-    for subagent_key, subagent_info in COMMANDS.items():
-        print(f"\n{Colors.BOLD}{Colors.GREEN}► {subagent_info['name']}{Colors.ENDC}")
-        print(f"  {subagent_info['description']}")
-        print(f"  {Colors.CYAN}{subagent_info['doc']}{Colors.ENDC}")
-
-        for cmd, details in subagent_info['commands'].items():
-            print(f"\n  {Colors.BOLD}{cmd}{Colors.ENDC}")
-            print(f"    {details['description']}")
-            print(f"    {Colors.YELLOW}Complexity:{Colors.ENDC} {details['complexity']} | {Colors.YELLOW}Duration:{Colors.ENDC} {details['duration']}")
-
-
-def list_by_subagent(subagent: str):
+    print(f"\n{c.BOLD}{c.GREEN}For more information, see:{c.ENDC}")
+    print(f"  • Documentation Index: {c.CYAN}docs/DOCUMENTATION-INDEX.md{c.ENDC}")
+    print(f"  • Quick Start Guides: {c.CYAN}docs/quickstart-*.md{c.ENDC}")
+    print(f"  • V2 Architecture: {c.CYAN}docs/V2-ARCHITECTURE.md{c.ENDC}\n")
+
+
+def browse_all_commands(limit: Optional[int] = None, summary: bool = False, pager: bool = False,
+                        c=Colors):
+    """Browse all available commands (at most limit per subagent, or only counts)"""
+    with phase("rendering"), Report(pager=pager, colors=c) as report:
+        line = report.line
+        title = "All Available Commands"
+        line(f"\n{c.BOLD}{c.BLUE}{title}{c.ENDC}")
+        line(f"{c.BLUE}{'-' * len(title)}{c.ENDC}")
+
+        width = max(len(info['name']) for info in COMMANDS.values())
+        for subagent_key, subagent_info in COMMANDS.items():
+            commands = list(subagent_info['commands'].items())
+            if summary:
+                line(f"{c.BOLD}{c.GREEN}► {subagent_info['name']:<{width}}{c.ENDC} {len(commands):>3} commands  "
+                     f"{c.CYAN}{subagent_info['doc']}{c.ENDC}")
+                continue
+            line(f"\n{c.BOLD}{c.GREEN}► {subagent_info['name']}{c.ENDC}")
+            line(f"  {subagent_info['description']}")
+            line(f"  {c.CYAN}{subagent_info['doc']}{c.ENDC}")
+
+            shown, hidden = limited(commands, limit)
+            for cmd, details in shown:
+                line(f"\n  {c.BOLD}{cmd}{c.ENDC}")
+                line(f"    {details['description']}")
+                line(f"    {c.YELLOW}Complexity:{c.ENDC} {details['complexity']} | "
+                     f"{c.YELLOW}Duration:{c.ENDC} {details['duration']}")
+            if hidden:
+                line()
+                report.more(hidden, "commands", indent="    ")
+
+
+def list_by_subagent(subagent: str, c=Colors):
     """List commands for a specific subagent"""
     if subagent not in COMMANDS:
-        print(f"{Colors.RED}Error: Unknown subagent '{subagent}'{Colors.ENDC}")
-        print(f"Available subagents: {', '.join(COMMANDS.keys())}")
-        return
+        resolved = resolve_subagent(subagent)
+        if not resolved:
+            print(f"{c.RED}Error: Unknown subagent '{subagent}'.{_did_you_mean(subagent, 'subagent')}{c.ENDC}")
+            print(f"Available subagents: {', '.join(COMMANDS.keys())}")
+            return
+        print(f"{c.YELLOW}Showing {resolved} for '{subagent}'{c.ENDC}")
+        subagent = resolved
 
     subagent_info = COMMANDS[subagent]
-    print_section(f"{subagent_info['name']} Commands")
+    print_section(f"{subagent_info['name']} Commands", c)
 
-    print(f"{Colors.BOLD}Description:{Colors.ENDC} {subagent_info['description']}")
-    print(f"{Colors.BOLD}Documentation:{Colors.ENDC} {subagent_info['doc']}\n")
+    print(f"{c.BOLD}Description:{c.ENDC} {subagent_info['description']}")
+    print(f"{c.BOLD}Documentation:{c.ENDC} {subagent_info['doc']}\n")
 
     for cmd, details in subagent_info['commands'].items():
-        print_command(subagent, cmd, details)
+        print_command(subagent, cmd, details, c)
 
 
-def show_help():
+def show_help(c=Colors):
     """Show help message"""
-    print_header("BMAD Enhanced - Command Wizard Help")
+    print_header("BMAD Enhanced - Command Wizard Help", c)
 
-    print(f"{Colors.BOLD}Usage:{Colors.ENDC}")
+    print(f"{c.BOLD}Usage:{c.ENDC}")
     print(f"  python scripts/bmad-wizard.py [options]\n")
 
-    print(f"{Colors.BOLD}Options:{Colors.ENDC}")
-    print(f"  {Colors.CYAN}(no arguments){Colors.ENDC}     Run interactive wizard")
-    print(f"  {Colors.CYAN}--list-all{Colors.ENDC}         List all commands")
-    print(f"  {Colors.CYAN}--subagent <name>{Colors.ENDC}  Show commands for specific subagent")
-    print(f"  {Colors.CYAN}--help{Colors.ENDC}             Show this help message\n")
-
-    print(f"{Colors.BOLD}Available Subagents:{Colors.ENDC}")
+    print(f"{c.BOLD}Options:{c.ENDC}")
+    print(f"  {c.CYAN}(no arguments){c.ENDC}     Run interactive wizard")
+    print(f"  {c.CYAN}--list-all{c.ENDC}         List all commands (--limit N per subagent, --summary, --pager)")
+    print(f"  {c.CYAN}--subagent <name>{c.ENDC}  Show commands for specific subagent")
+    print(f"  {c.CYAN}--command <name>{c.ENDC}   Show one command (typos are corrected)")
+    print(f"  {c.CYAN}--recommend <goal>{c.ENDC} Rank commands for a goal (--top N, default 5)")
+    print(f"  {c.CYAN}--search <query>{c.ENDC}   Search docs and .bmad-core (--top N, --reindex)")
+    print(f"  {c.CYAN}--batch [file]{c.ENDC}     Route JSONL goals from a file or stdin to JSONL")
+    print(f"                     (--top N, --jobs N worker processes, --output FILE)")
+    print(f"  {c.CYAN}--timings{c.ENDC}          Print time per phase (also --profile, --trace-memory)")
+    print(f"  {c.CYAN}--help{c.ENDC}             Show this help message\n")
+
+    print(f"{c.BOLD}Available Subagents:{c.ENDC}")
     for key, info in COMMANDS.items():
-        print(f"  {Colors.CYAN}{key:15}{Colors.ENDC} - {info['name']}")
+        print(f"  {c.CYAN}{key:15}{c.ENDC} - {info['name']}")
 
-    print(f"\n{Colors.BOLD}Examples:{Colors.ENDC}")
+    print(f"\n{c.BOLD}Examples:{c.ENDC}")
     print(f"  python scripts/bmad-wizard.py")
     print(f"  python scripts/bmad-wizard.py --list-all")
     print(f"  python scripts/bmad-wizard.py --subagent alex")
+    print(f"  python scripts/bmad-wizard.py --command '*validate-qualty-gate'")
+    print(f"  python scripts/bmad-wizard.py --recommend 'fix a memory leak in the worker'")
+    print(f"  python scripts/bmad-wizard.py --search 'quality gate decision'")
+    print(f"  python scripts/bmad-wizard.py --batch tickets.jsonl --jobs 4 --output routed.jsonl")
 
 
+@instrumented("bmad-wizard")
 def main():
     """Main entry point"""
+    # Chosen per run (not stored globally): the daemon calls main() in-process
+    c = colors_for(sys.stdout)
     if len(sys.argv) == 1:
         # No arguments - run interactive mode
-        interactive_mode()
+        interactive_mode(c)
     elif "--help" in sys.argv or "-h" in sys.argv:
-        show_help()
+        show_help(c)
     elif "--list-all" in sys.argv:
-        browse_all_commands()
+        try:
+            limit = int(_option("--limit", 0))
+        except (IndexError, ValueError):
+            print(f"{c.RED}Error: --limit requires a number{c.ENDC}")
+            return 1
+        browse_all_commands(limit, summary="--summary" in sys.argv, pager="--pager" in sys.argv, c=c)
     elif "--subagent" in sys.argv:
         try:
-            idx = sys.argv.index("--subagent")
-            subagent = sys.argv[idx + 1]
-            list_by_subagent(subagent)
+            subagent = _option("--subagent")
+        except IndexError:
+            print(f"{c.RED}Error: --subagent requires an argument{c.ENDC}")
+            show_help(c)
+        else:
+            list_by_subagent(subagent, c)
+    elif "--command" in sys.argv:
+        try:
+            name = _option("--command")
         except IndexError:
-            print(f"{Colors.RED}Error: --subagent requires an argument{Colors.ENDC}")
-            show_help()
+            print(f"{c.RED}Error: --command requires a name{c.ENDC}")
+            show_help(c)
+        else:
+            show_command(name, c)
+    elif "--recommend" in sys.argv:
+        try:
+            goal = _option("--recommend")
+            top = int(_option("--top", 5))
+        except (IndexError, ValueError):
+            print(f"{c.RED}Error: --recommend requires a goal (and --top a number){c.ENDC}")
+            show_help(c)
+        else:
+            show_recommendations(goal, top, c)
+    elif "--batch" in sys.argv:
+        idx = sys.argv.index("--batch")
+        path = sys.argv[idx + 1] if idx + 1 < len(sys.argv) and not sys.argv[idx + 1].startswith("--") else None
+        try:
+            top = int(_option("--top", 5))
+            jobs = int(_option("--jobs", 1))
+            output_path = _option("--output")
+        except (IndexError, ValueError):
+            print(f"{c.RED}Error: --top and --jobs require numbers, --output a path{c.ENDC}")
+            return 1
+        return batch_mode(path, top, jobs, output_path)
+    elif "--search" in sys.argv:
+        try:
+            query = _option("--search")
+            top = int(_option("--top", 10))
+        except (IndexError, ValueError):
+            print(f"{c.RED}Error: --search requires a query (and --top a number){c.ENDC}")
+            show_help(c)
+        else:
+            search_docs(query, top, reindex="--reindex" in sys.argv, c=c)
     else:
-        print(f"{Colors.RED}Error: Unknown option{Colors.ENDC}")
-        show_help()
+        print(f"{c.RED}Error: Unknown option{c.ENDC}")
+        show_help(c)
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
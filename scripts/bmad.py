@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+BMAD Enhanced - Command Line Entry Point
+
+One ``bmad`` command for the BMAD scripts. Each subcommand's script is
+imported only when that subcommand runs, so dispatching costs nothing
+beyond the interpreter itself. ``bmad zipapp`` packages everything into a
+single executable bmad.pyz; ``bmad startup`` checks import-time budgets.
+
+Usage:
+    bmad <command> [args...]
+    bmad <command> --help
+
+Commands:
+    monitor     Skill loading monitor (monitor-skills.py)
+    wizard      Command wizard and docs search (bmad-wizard.py)
+    errors      Error handler demos and error log (error-handler.py)
+    progress    Progress visualizer demo (progress-visualizer.py)
+    health      Health check (health-check.py)
+    analytics   Error analytics (error-analytics.py)
+    report      Performance report (performance-report.py)
+    warm        Cache warmer (warm-cache.py)
+    startup     Check import-time startup budgets
+    zipapp      Build bmad.pyz
+"""
+
+import os
+import sys
+
+
+COMMANDS = {
+    "monitor": "monitor-skills.py",
+    "wizard": "bmad-wizard.py",
+    "errors": "error-handler.py",
+    "progress": "progress-visualizer.py",
+    "health": "health-check.py",
+    "analytics": "error-analytics.py",
+    "report": "performance-report.py",
+    "warm": "warm-cache.py",
+}
+
+# Import-time budgets (ms, excluding the interpreter's own startup) for
+# loading each subcommand; "" is the dispatcher alone
+STARTUP_BUDGETS_MS = {
+    "": 5,
+    "monitor": 60,
+    "wizard": 40,
+    "errors": 40,
+    "progress": 60,
+    "health": 60,
+}
+
+# Must not be imported just to dispatch
+DISPATCH_FORBIDDEN = ("yaml", "json", "sqlite3", "asyncio", "concurrent", "argparse", "pathlib")
+
+ZIPAPP_EXCLUDE = {"bmad-client.py", "bmad-daemon.py", "benchmark.py", "deploy-projects.py"}
+
+
+def load(command: str):
+    """Import the script behind a subcommand"""
+    from bmadlib.loader import load_script
+
+    return load_script(COMMANDS[command])
+
+
+def run(command: str, argv: list) -> int:
+    """Import a subcommand's script and run its main()"""
+    module = load(command)
+    sys.argv = [f"bmad {command}"] + argv
+    code = module.main()
+    return code if isinstance(code, int) else 0
+
+
+def import_profile(command: str):
+    """Import a subcommand (or just this module) under -X importtime; returns (µs, modules)"""
+    import subprocess
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    code = f"import sys; sys.path.insert(0, {here!r}); import bmad"
+    if command:
+        code += f"; bmad.load({command!r})"
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    total = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, self_us, _, name = (part.strip() for part in line.replace("import time:", "|", 1).split("|"))
+        if self_us.isdigit():
+            total += int(self_us)
+            modules.append(name)
+    return total, modules
+
+
+def check_startup(argv: list) -> int:
+    """Measure import time per subcommand against STARTUP_BUDGETS_MS; 1 if any is over"""
+    import subprocess
+
+    scale = 1.0
+    if argv[:1] == ["--scale"] and len(argv) > 1:
+        scale, argv = float(argv[1]), argv[2:]
+    commands = argv or list(STARTUP_BUDGETS_MS)
+
+    # What the interpreter imports before running any code
+    baseline = subprocess.run([sys.executable, "-X", "importtime", "-c", "pass"],
+                              stderr=subprocess.PIPE, text=True).stderr
+    base_us = sum(int(line.split("|")[0].split(":")[1]) for line in baseline.splitlines()
+                  if line.startswith("import time:") and line.split("|")[0].split(":")[1].strip().isdigit())
+
+    failures = 0
+    print(f"{'command':<10} {'imports':>9} {'budget':>8}  status")
+    for command in commands:
+        if command and command not in COMMANDS:
+            print(f"❌ Unknown command: {command}", file=sys.stderr)
+            return 2
+        # Best of three runs, to keep scheduler noise out of the check
+        runs = [import_profile(command) for _ in range(3)]
+        total_us, modules = min(runs, key=lambda run: run[0])
+        ms = max(0.0, (total_us - base_us) / 1000)
+        budget = STARTUP_BUDGETS_MS.get(command, 50) * scale
+        problems = []
+        if ms > budget:
+            problems.append(f"over budget by {ms - budget:.1f}ms")
+        if not command:
+            eager = sorted({m.split(".")[0] for m in modules} & set(DISPATCH_FORBIDDEN))
+            if eager:
+                problems.append(f"imports {', '.join(eager)} before dispatching")
+        failures += bool(problems)
+        status = "❌ " + "; ".join(problems) if problems else "✓"
+        print(f"{command or '(bmad)':<10} {ms:>7.1f}ms {budget:>6.0f}ms  {status}")
+    return 1 if failures else 0
+
+
+def build_zipapp(argv: list) -> int:
+    """Package the CLI, its scripts and bmadlib into one executable archive"""
+    import time
+    import marshal
+    import zipfile
+    import importlib.util
+
+    target = argv[argv.index("-o") + 1] if "-o" in argv else "bmad.pyz"
+    scripts_dir = os.path.dirname(os.path.abspath(__file__))
+
+    def compiled(source: bytes, name: str) -> bytes:
+        # Unchecked hash-based pyc: valid inside a zip without mtime checks
+        code = compile(source, name, "exec", dont_inherit=True)
+        return (importlib.util.MAGIC_NUMBER + (1).to_bytes(4, "little")
+                + importlib.util.source_hash(source) + marshal.dumps(code))
+
+    files = sorted(name for name in os.listdir(scripts_dir)
+                   if name.endswith(".py") and name not in ZIPAPP_EXCLUDE)
+    files += sorted("bmadlib/" + name for name in os.listdir(os.path.join(scripts_dir, "bmadlib"))
+                    if name.endswith(".py"))
+    start = time.perf_counter()
+    tmp = target + ".tmp"
+    with open(tmp, "wb") as out:
+        out.write(b"#!/usr/bin/env python3\n")
+        with zipfile.ZipFile(out, "w") as archive:
+            archive.writestr("__main__.py", "import sys\nfrom bmad import main\nsys.exit(main())\n")
+            for name in files:
+                with open(os.path.join(scripts_dir, name), "rb") as f:
+                    source = f.read()
+                archive.writestr(name, source)
+                archive.writestr(name + "c", compiled(source, name))
+    os.chmod(tmp, 0o755)
+    os.replace(tmp, target)
+    print(f"✓ Built {target} ({len(files)} modules, {os.path.getsize(target) / 1024:.0f} KB) "
+          f"in {(time.perf_counter() - start) * 1000:.0f}ms")
+    return 0
+
+
+def main():
+    """Main entry point"""
+    if len(sys.argv) < 2 or sys.argv[1] in ("-h", "--help"):
+        print(__doc__.strip().split("\n\n", 1)[1])
+        return 0
+    command, argv = sys.argv[1], sys.argv[2:]
+    if command == "--version":
+        print("bmad (BMAD Enhanced scripts)")
+        return 0
+    if command == "startup":
+        return check_startup(argv)
+    if command == "zipapp":
+        return build_zipapp(argv)
+    if command not in COMMANDS:
+        print(f"❌ Unknown command '{command}'. Commands: {', '.join(COMMANDS)}, startup, zipapp",
+              file=sys.stderr)
+        return 2
+    return run(command, argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
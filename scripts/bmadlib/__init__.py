@@ -0,0 +1,8 @@
+"""
+BMAD Enhanced - Shared Script Library
+Helpers shared by the scripts in this directory.
+
+The scripts keep their hyphenated file names (``monitor-skills.py`` etc.), so
+code that more than one of them needs lives here as regular importable
+modules. Submodules are imported on demand; keep this file free of imports.
+"""
@@ -0,0 +1,309 @@
+"""
+BMAD Enhanced - Result Cache
+Content-addressed, size-bounded on-disk cache shared by the scripts, with
+hit/miss/eviction counters in .claude/cache/stats.json.
+"""
+
+import os
+import json
+import time
+import atexit
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from bmadlib.hashing import value_digest
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process safety only
+    fcntl = None
+
+
+DEFAULT_DIR = ".claude/cache"
+DEFAULT_MAX_SIZE_MB = 100
+CONFIG_FILE = ".claude/config.yaml"
+
+# Eviction trims the cache to this fraction of its limit, so it runs rarely
+EVICT_TO = 0.8
+
+COUNTERS = ("hits", "misses", "writes", "evictions", "expired")
+
+
+class FileLock:
+    """Exclusive advisory lock on a file, shared across processes"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._thread_lock = threading.Lock()
+        self._fd: Optional[int] = None
+
+    def __enter__(self):
+        self._thread_lock.acquire()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            if fcntl:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+        except BaseException:
+            self._thread_lock.release()
+            raise
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            if fcntl:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+        finally:
+            self._fd = None
+            self._thread_lock.release()
+
+
+def _atomic_write(path: Path, data: bytes):
+    """Write a file via a temporary file and rename"""
+    import tempfile
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=".tmp-", dir=path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class Cache:
+    """Content-addressed JSON value cache for one namespace
+
+    Keys are digests of their inputs (``key()`` hashes ``Path`` arguments
+    by file content), so a changed input simply misses and stale entries
+    age out. Entries are written atomically, so concurrent processes never
+    read partial values and need no lock to read. Each hit refreshes the
+    entry's mtime. Writers track the cache size (starting from the figure
+    in stats.json); once it passes ``max_size_mb``, the least recently used
+    entries across all namespaces are evicted under an exclusive file lock
+    until the cache is back to 80% of the limit. Counters are kept in
+    memory and merged into ``stats.json`` by ``flush()`` (also at exit).
+    """
+
+    def __init__(self,
+                 namespace: str = "default",
+                 directory: str = DEFAULT_DIR,
+                 max_size_mb: float = DEFAULT_MAX_SIZE_MB,
+                 ttl: Optional[float] = None,
+                 enabled: bool = True):
+        self.namespace = namespace
+        self.root = Path(directory)
+        self.path = self.root / namespace
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.ttl = ttl
+        self.enabled = enabled
+        self.counts = dict.fromkeys(COUNTERS, 0)
+        self._size_estimate: Optional[int] = None
+        self._lock = FileLock(self.root / ".lock")
+        self._counts_lock = threading.Lock()
+        atexit.register(self.flush)
+
+    @staticmethod
+    def key(*parts) -> str:
+        """Digest of the inputs a value depends on"""
+        return value_digest(list(parts))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Cached value for a key, or default"""
+        if not self.enabled:
+            return default
+        entry_path = self._entry(key)
+        try:
+            with open(entry_path, 'rb') as f:
+                entry = json.loads(f.read())
+        except (OSError, ValueError):
+            self._count("misses")
+            return default
+        if self.ttl is not None and time.time() - entry.get("created", 0) > self.ttl:
+            self._count("expired")
+            self._count("misses")
+            return default
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        self._count("hits")
+        return entry.get("value")
+
+    def put(self, key: str, value: Any):
+        """Store a JSON-serialisable value"""
+        if not self.enabled:
+            return
+        data = json.dumps({"created": time.time(), "value": value},
+                          separators=(",", ":"), default=str).encode('utf-8')
+        _atomic_write(self._entry(key), data)
+        self._count("writes")
+        with self._counts_lock:
+            if self._size_estimate is None:
+                self._size_estimate = self._recorded_size()
+            self._size_estimate += len(data)
+            over = self._size_estimate > self.max_bytes
+        if over:
+            self.evict()
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Cached value, computing and storing it on a miss"""
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def evict(self) -> int:
+        """Trim the cache directory to its size limit, least recently used first"""
+        with self._lock:
+            entries, total = self._scan()
+            removed = 0
+            if total > self.max_bytes:
+                entries.sort()
+                target = self.max_bytes * EVICT_TO
+                for _, size, path in entries:
+                    if total <= target:
+                        break
+                    try:
+                        os.unlink(path)
+                    except OSError:
+                        continue
+                    total -= size
+                    removed += 1
+            self._size_estimate = total
+            self._count("evictions", removed)
+            return removed
+
+    def clear(self):
+        """Remove every entry in this namespace"""
+        with self._lock:
+            for dirpath, _, files in os.walk(self.path):
+                for name in files:
+                    try:
+                        os.unlink(os.path.join(dirpath, name))
+                    except OSError:
+                        pass
+
+    def flush(self):
+        """Merge this process's counters into stats.json"""
+        with self._counts_lock:
+            counts, self.counts = self.counts, dict.fromkeys(COUNTERS, 0)
+        if not any(counts.values()):
+            return
+        stats_path = self.root / "stats.json"
+        try:
+            with self._lock:
+                try:
+                    stats = json.loads(stats_path.read_text(encoding='utf-8'))
+                except (OSError, ValueError):
+                    stats = {}
+                namespaces = stats.setdefault("namespaces", {})
+                ns = namespaces.setdefault(self.namespace, dict.fromkeys(COUNTERS, 0))
+                for name, value in counts.items():
+                    ns[name] = ns.get(name, 0) + value
+                for name in COUNTERS:
+                    stats[name] = sum(n.get(name, 0) for n in namespaces.values())
+                for target in [stats] + list(namespaces.values()):
+                    lookups = target["hits"] + target["misses"]
+                    target["hit_rate"] = round(target["hits"] / lookups, 4) if lookups else 0.0
+                _, stats["size_bytes"] = self._scan()
+                stats["max_size_mb"] = self.max_bytes / (1024 * 1024)
+                stats["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+                _atomic_write(stats_path, json.dumps(stats, indent=2).encode('utf-8'))
+        except OSError:
+            # Statistics are best effort; never fail the caller over them
+            with self._counts_lock:
+                for name, value in counts.items():
+                    self.counts[name] += value
+
+    def _recorded_size(self) -> int:
+        """Cache size as of the last stats.json update (a cheap starting estimate)"""
+        try:
+            return int(json.loads((self.root / "stats.json").read_text(encoding='utf-8')).get("size_bytes", 0))
+        except (OSError, ValueError, TypeError, AttributeError):
+            return 0
+
+    def _entry(self, key: str) -> Path:
+        """File holding an entry"""
+        return self.path / key[:2] / f"{key}.json"
+
+    def _scan(self) -> Tuple[list, int]:
+        """(mtime, size, path) of every entry under the cache root, and their total size"""
+        entries = []
+        total = 0
+        for dirpath, _, files in os.walk(self.root):
+            for name in files:
+                if not name.endswith(".json") or name == "stats.json" or name.startswith(".tmp-"):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+                total += st.st_size
+        return entries, total
+
+    def _count(self, name: str, n: int = 1):
+        with self._counts_lock:
+            self.counts[name] += n
+
+
+def load_config(root: Path = Path(".")) -> Dict:
+    """The ``caching`` section of .claude/config.yaml ({} if absent or unreadable)"""
+    path = root / CONFIG_FILE
+    if not path.is_file():
+        return {}
+    try:
+        import yaml
+        config = yaml.safe_load(path.read_text(encoding='utf-8')) or {}
+    except Exception:
+        return {}
+    caching = config.get("caching") if isinstance(config, dict) else None
+    return caching if isinstance(caching, dict) else {}
+
+
+_caches: Dict[Tuple[str, str], Cache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(namespace: str, root: Optional[Path] = None) -> Cache:
+    """Shared cache for a namespace, configured from .claude/config.yaml
+
+    Honours ``caching.enabled``, ``cache_dir``, ``max_size_mb`` and
+    ``ttl_by_type[namespace]`` (or ``ttl_seconds``). ``BMAD_CACHE=0``
+    disables caching and ``BMAD_CACHE_DIR`` overrides the directory.
+    """
+    root = Path(root or ".")
+    config = load_config(root)
+    directory = os.environ.get("BMAD_CACHE_DIR") or str(root / config.get("cache_dir", DEFAULT_DIR))
+    with _caches_lock:
+        cache = _caches.get((directory, namespace))
+        if cache is None:
+            enabled = bool(config.get("enabled", True)) and \
+                os.environ.get("BMAD_CACHE", "1").lower() not in ("0", "false", "off", "no")
+            ttl = (config.get("ttl_by_type") or {}).get(namespace, config.get("ttl_seconds"))
+            cache = _caches[(directory, namespace)] = Cache(
+                namespace, directory,
+                max_size_mb=float(config.get("max_size_mb", DEFAULT_MAX_SIZE_MB)),
+                ttl=float(ttl) if ttl is not None else None,
+                enabled=enabled
+            )
+    return cache
+
+
+def flush_caches():
+    """Write the counters of every shared cache to their stats.json"""
+    with _caches_lock:
+        caches = list(_caches.values())
+    for cache in caches:
+        cache.flush()
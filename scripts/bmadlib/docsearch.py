@@ -0,0 +1,344 @@
+"""
+BMAD Enhanced - Documentation Search
+Persistent, incrementally updated full-text index over documentation,
+.bmad-core assets and web bundles, searchable at heading granularity.
+"""
+
+import os
+import re
+import time
+import sqlite3
+import hashlib
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from bmadlib.hashing import file_digest
+from bmadlib.profiling import phase
+from bmadlib.search import _WORD, STOPWORDS, bm25, idf, stem, tokenize
+
+
+DEFAULT_DB = ".claude/cache/docs-search.db"
+
+# Searched relative to the project root when present
+DEFAULT_ROOTS = [
+    "docs",
+    ".bmad-core",
+    "BMAD/.bmad-core",
+    "BMAD/.bmad-infrastructure-devops",
+    "BMAD/web-bundles",
+]
+
+EXTENSIONS = {".md", ".txt", ".yaml", ".yml"}
+
+# Term weight of a section's heading and file name relative to its body
+HEADING_WEIGHT = 3.0
+PATH_WEIGHT = 1.0
+
+_HEADING = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+_BUNDLE_START = re.compile(r'^=+ START: (\S+) =+$')
+_BUNDLE_END = re.compile(r'^=+ END: (\S+) =+$')
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sections (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    resource TEXT,
+    heading TEXT,
+    line INTEGER NOT NULL,
+    length REAL NOT NULL,
+    digest TEXT NOT NULL,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sections_path ON sections(path);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    section INTEGER NOT NULL,
+    tf REAL NOT NULL,
+    PRIMARY KEY (term, section)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_postings_section ON postings(section);
+"""
+
+
+def split_sections(text: str) -> Iterator[Tuple[Optional[str], Optional[str], int, str]]:
+    """Split a document into (resource, heading, line, body) sections
+
+    Markdown headings start a new section (except inside code fences), and
+    web-bundle ``START:``/``END:`` markers set the embedded resource path.
+    """
+    resource = None
+    heading = None
+    start = 1
+    lines: List[str] = []
+    in_fence = False
+
+    for number, line in enumerate(text.splitlines(), 1):
+        stripped = line.strip()
+        if stripped.startswith(("```", "~~~")):
+            in_fence = not in_fence
+        marker = _BUNDLE_START.match(stripped) or _BUNDLE_END.match(stripped)
+        match = None if in_fence else _HEADING.match(line)
+        if marker or match:
+            if any(l.strip() for l in lines) or heading:
+                yield resource, heading, start, "\n".join(lines)
+            lines = []
+            start = number
+            if marker:
+                resource = marker.group(1) if stripped.split()[1] == "START:" else None
+                heading = None
+                in_fence = False
+                start = number + 1
+            else:
+                heading = match.group(2)
+            continue
+        lines.append(line)
+
+    if any(l.strip() for l in lines) or heading:
+        yield resource, heading, start, "\n".join(lines)
+
+
+def find_root(start: Optional[Path] = None) -> Path:
+    """Nearest directory at or above start (default cwd) holding a search root"""
+    start = Path(start or Path.cwd()).resolve()
+    for candidate in (start, *start.parents):
+        if any((candidate / name).is_dir() for name in DEFAULT_ROOTS):
+            return candidate
+    return start
+
+
+def make_snippet(body: str, terms: set, width: int = 200) -> str:
+    """The part of a section around its first line matching a query term"""
+    lines = [l.strip() for l in body.splitlines() if l.strip()]
+    if not lines:
+        return ""
+    hit = 0
+    for i, line in enumerate(lines):
+        if any(stem(w) in terms for w in _WORD.findall(line.lower()) if w not in STOPWORDS):
+            hit = i
+            break
+    snippet = lines[hit]
+    for line in lines[hit + 1:]:
+        if len(snippet) >= width:
+            break
+        snippet += " " + line
+    return snippet if len(snippet) <= width else snippet[:width - 1].rstrip() + "…"
+
+
+class DocsIndex:
+    """Heading-level BM25 search over project documentation, kept in SQLite
+
+    ``refresh()`` only re-parses files whose size or mtime changed and
+    whose content hash actually differs, and drops files that disappeared,
+    so keeping the index current costs a directory walk and a stat per
+    file. Searches read postings for the query terms only, so a cold start
+    needs no index loading.
+    """
+
+    def __init__(self, root: Path, db_path: Optional[str] = None, roots: Optional[List[str]] = None):
+        self.root = Path(root)
+        db_path = db_path or os.environ.get("BMAD_DOCS_INDEX") or str(self.root / DEFAULT_DB)
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.roots = roots or DEFAULT_ROOTS
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self.conn.executescript("DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS sections; "
+                                    "DROP TABLE IF EXISTS postings;")
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        """Close the database"""
+        self.conn.close()
+
+    def discover(self) -> Iterator[Path]:
+        """Yield indexable files under the configured roots"""
+        for name in self.roots:
+            base = self.root / name
+            if not base.is_dir():
+                continue
+            for path in sorted(base.rglob("*")):
+                if path.suffix.lower() in EXTENSIONS and path.is_file():
+                    yield path
+
+    def refresh(self, force: bool = False) -> Dict[str, int]:
+        """Bring the index up to date; returns counts of scanned/updated/removed files"""
+        stats = {"scanned": 0, "updated": 0, "removed": 0}
+        known = {row[0]: row[1:] for row in self.conn.execute("SELECT path, mtime, size, sha256 FROM files")}
+        seen = set()
+
+        with phase("indexing"), self.conn:
+            for path in self.discover():
+                rel = path.relative_to(self.root).as_posix()
+                seen.add(rel)
+                stats["scanned"] += 1
+                st = path.stat()
+                previous = known.get(rel)
+                if not force and previous and previous[0] == st.st_mtime and previous[1] == st.st_size:
+                    continue
+                digest = file_digest(path)
+                if not force and previous and previous[2] == digest:
+                    self.conn.execute("UPDATE files SET mtime = ?, size = ? WHERE path = ?",
+                                      (st.st_mtime, st.st_size, rel))
+                    continue
+                self._index_file(path, rel, digest)
+                self.conn.execute("INSERT OR REPLACE INTO files (path, mtime, size, sha256) VALUES (?, ?, ?, ?)",
+                                  (rel, st.st_mtime, st.st_size, digest))
+                stats["updated"] += 1
+
+            for rel in set(known) - seen:
+                self._remove_file(rel)
+                self.conn.execute("DELETE FROM files WHERE path = ?", (rel,))
+                stats["removed"] += 1
+        return stats
+
+    def search(self, query: str, k: int = 10) -> List[Dict]:
+        """Top-k sections for a query, best first, with snippets"""
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+        n, total = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(length), 0) FROM sections").fetchone()
+        if not n:
+            return []
+        avg = total / n or 1.0
+
+        postings = {}
+        for term in terms:
+            postings[term] = self.conn.execute(
+                "SELECT section, tf FROM postings WHERE term = ?", (term,)).fetchall()
+        candidates = {section for rows in postings.values() for section, _ in rows}
+        if not candidates:
+            return []
+        lengths = self._lengths(candidates)
+
+        scores: Dict[int, float] = {}
+        for term, rows in postings.items():
+            term_idf = idf(n, len(rows))
+            for section, tf in rows:
+                scores[section] = scores.get(section, 0.0) + bm25(tf, term_idf, lengths[section], avg)
+
+        results = []
+        seen_digests = set()
+        for section, score in sorted(scores.items(), key=lambda item: (-item[1], item[0])):
+            row = self.conn.execute(
+                "SELECT path, resource, heading, line, digest, body FROM sections WHERE id = ?",
+                (section,)).fetchone()
+            path, resource, heading, line, digest, body = row
+            # Bundles repeat .bmad-core files verbatim; show each text once
+            if digest in seen_digests:
+                continue
+            seen_digests.add(digest)
+            results.append({
+                "path": path,
+                "resource": resource,
+                "heading": heading,
+                "line": line,
+                "score": round(score, 3),
+                "snippet": make_snippet(body, terms)
+            })
+            if len(results) >= k:
+                break
+        return results
+
+    def stats(self) -> Dict[str, int]:
+        """Number of indexed files, sections and postings"""
+        return {
+            "files": self.conn.execute("SELECT COUNT(*) FROM files").fetchone()[0],
+            "sections": self.conn.execute("SELECT COUNT(*) FROM sections").fetchone()[0],
+            "postings": self.conn.execute("SELECT COUNT(*) FROM postings").fetchone()[0]
+        }
+
+    def _lengths(self, sections: set) -> Dict[int, float]:
+        """Lengths of the given sections"""
+        lengths = {}
+        ids = list(sections)
+        for i in range(0, len(ids), 900):
+            chunk = ids[i:i + 900]
+            placeholders = ",".join("?" * len(chunk))
+            lengths.update(self.conn.execute(
+                f"SELECT id, length FROM sections WHERE id IN ({placeholders})", chunk))
+        return lengths
+
+    def _index_file(self, path: Path, rel: str, digest: str):
+        """(Re)index every section of one file"""
+        self._remove_file(rel)
+        if self._copy_sections(path, rel, digest):
+            return
+        for resource, heading, line, body, section_digest, counts in self._analyze_file(path):
+            cursor = self.conn.execute(
+                "INSERT INTO sections (path, resource, heading, line, length, digest, body) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (rel, resource, heading, line, sum(counts.values()), section_digest, body))
+            section = cursor.lastrowid
+            self.conn.executemany("INSERT INTO postings (term, section, tf) VALUES (?, ?, ?)",
+                                  [(term, section, tf) for term, tf in counts.items()])
+
+    def _copy_sections(self, path: Path, rel: str, digest: str) -> bool:
+        """Reuse the sections of an indexed file with the same content and name
+
+        Web bundles and the ``.bmad-enhanced`` copy repeat files verbatim, so
+        these are indexed by copying rows instead of splitting and stemming
+        the text again. The name must match too: it adds path terms.
+        """
+        for (other,) in self.conn.execute("SELECT path FROM files WHERE sha256 = ? AND path != ?", (digest, rel)):
+            if Path(other).stem != path.stem:
+                continue
+            rows = self.conn.execute(
+                "SELECT id, resource, heading, line, length, digest, body FROM sections WHERE path = ? ORDER BY id",
+                (other,)).fetchall()
+            for section, resource, heading, line, length, section_digest, body in rows:
+                cursor = self.conn.execute(
+                    "INSERT INTO sections (path, resource, heading, line, length, digest, body) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (rel, resource, heading, line, length, section_digest, body))
+                self.conn.execute("INSERT INTO postings (term, section, tf) SELECT term, ?, tf FROM postings "
+                                  "WHERE section = ?", (cursor.lastrowid, section))
+            return True
+        return False
+
+    def _analyze_file(self, path: Path) -> List[list]:
+        """Sections of a file with their term counts"""
+        try:
+            text = path.read_text(encoding='utf-8', errors='replace')
+        except OSError:
+            return []
+        path_terms = tokenize(path.stem.replace("-", " ").replace("_", " "))
+        sections = []
+        for resource, heading, line, body in split_sections(text):
+            counts: Dict[str, float] = {}
+            for term in tokenize(body):
+                counts[term] = counts.get(term, 0.0) + 1.0
+            for term in tokenize(heading or ""):
+                counts[term] = counts.get(term, 0.0) + HEADING_WEIGHT
+            for term in tokenize(Path(resource).stem if resource else "") or path_terms:
+                counts[term] = counts.get(term, 0.0) + PATH_WEIGHT
+            if not counts:
+                continue
+            section_digest = hashlib.sha1(f"{heading}\0{body}".encode('utf-8')).hexdigest()
+            sections.append([resource, heading, line, body, section_digest, counts])
+        return sections
+
+    def _remove_file(self, rel: str):
+        """Drop a file's sections and postings"""
+        self.conn.execute(
+            "DELETE FROM postings WHERE section IN (SELECT id FROM sections WHERE path = ?)", (rel,))
+        self.conn.execute("DELETE FROM sections WHERE path = ?", (rel,))
+
+
+def timed_search(index: DocsIndex, query: str, k: int = 10) -> Tuple[Dict[str, int], List[Dict], float]:
+    """Refresh the index, then search; returns (refresh stats, results, elapsed ms)"""
+    start = time.perf_counter()
+    stats = index.refresh()
+    with phase("search"):
+        results = index.search(query, k)
+    return stats, results, (time.perf_counter() - start) * 1000
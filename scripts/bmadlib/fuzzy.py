@@ -0,0 +1,125 @@
+"""
+BMAD Enhanced - Fuzzy Name Matching
+Typo-tolerant lookup of short names (commands, subagents, aliases) using a
+trigram index for candidates and edit distance for ranking.
+"""
+
+from typing import Dict, Hashable, List, NamedTuple, Optional, Set
+
+
+class Match(NamedTuple):
+    """A fuzzy lookup result"""
+    name: str          # The indexed name or alias that matched
+    target: Hashable   # What the name refers to
+    distance: int      # Edit distance from the query
+    score: float       # 1.0 for an exact match, lower for worse matches
+
+
+def normalize(name: str) -> str:
+    """Canonical form for matching: lowercase, no command prefix or separators"""
+    return name.strip().lower().lstrip("*/").replace("_", "-").replace(" ", "-")
+
+
+def trigrams(text: str) -> Set[str]:
+    """Padded character trigrams of a string"""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a: str, b: str, limit: Optional[int] = None) -> int:
+    """Optimal string alignment distance (insert, delete, substitute, transpose)
+
+    With ``limit``, returns ``limit + 1`` as soon as the distance is known
+    to exceed it.
+    """
+    if a == b:
+        return 0
+    if limit is not None and abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if limit is not None and min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class FuzzyIndex:
+    """Trigram index over names and aliases, ranked by edit distance
+
+    Candidates are the names sharing at least one trigram with the query
+    (or prefixed by it); only those are compared with the exact, bounded
+    edit distance. The default tolerance grows with query length: one edit
+    for short names, up to a third of the characters for long ones.
+    """
+
+    def __init__(self):
+        self.names: Dict[str, Hashable] = {}
+        self._display: Dict[str, str] = {}
+        self._grams: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(self, name: str, target: Hashable):
+        """Index a name (or an alias) for a target"""
+        key = normalize(name)
+        if not key:
+            return
+        self.names[key] = target
+        self._display.setdefault(key, name)
+        for gram in trigrams(key):
+            self._grams.setdefault(gram, set()).add(key)
+
+    def lookup(self, query: str, k: int = 5, max_distance: Optional[int] = None) -> List[Match]:
+        """Up to k matches for a query, best first"""
+        key = normalize(query)
+        if not key:
+            return []
+        if max_distance is None:
+            max_distance = max(1, len(key) // 3)
+
+        shared: Dict[str, int] = {}
+        for gram in trigrams(key):
+            for name in self._grams.get(gram, ()):
+                shared[name] = shared.get(name, 0) + 1
+
+        matches = []
+        for name in shared:
+            if name.startswith(key) and name != key:
+                # Unambiguous abbreviations ("val" -> "validate-quality-gate") rank after typos
+                distance = max_distance
+                score = len(key) / len(name)
+            else:
+                distance = edit_distance(key, name, max_distance)
+                if distance > max_distance:
+                    continue
+                score = 1.0 - distance / max(len(key), len(name))
+            matches.append(Match(self._display[name], self.names[name], distance, round(score, 4)))
+
+        matches.sort(key=lambda m: (m.distance, -m.score, m.name))
+        return matches[:k]
+
+    def resolve(self, query: str, max_distance: Optional[int] = None) -> Optional[Hashable]:
+        """The target a query unambiguously refers to, or None
+
+        An exact match always resolves. Otherwise the best match resolves
+        only if no match for a different target is equally close.
+        """
+        key = normalize(query)
+        if key in self.names:
+            return self.names[key]
+        matches = self.lookup(query, k=10, max_distance=max_distance)
+        if not matches:
+            return None
+        best = matches[0]
+        if any(m.target != best.target and m.distance == best.distance for m in matches[1:]):
+            return None
+        return best.target
@@ -0,0 +1,69 @@
+"""
+BMAD Enhanced - Content Hashing
+Stable SHA-256 digests of files, directory trees and JSON-like values.
+"""
+
+import json
+import hashlib
+from pathlib import Path
+from typing import Union
+
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """SHA-256 of a file's contents"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def tree_digest(path: Union[str, Path]) -> str:
+    """SHA-256 over the relative paths and contents of every file in a tree"""
+    root = Path(path)
+    h = hashlib.sha256()
+    for file in sorted(p for p in root.rglob("*") if p.is_file()):
+        h.update(file.relative_to(root).as_posix().encode('utf-8') + b"\0")
+        h.update(file_digest(file).encode('ascii'))
+    return h.hexdigest()
+
+
+def value_digest(value) -> str:
+    """SHA-256 of a JSON-like value; Path values are hashed by content
+
+    Dict keys are sorted, so equal values always hash the same. Files and
+    directories given as ``pathlib.Path`` contribute their contents, so a
+    changed input file changes the digest even if its name does not.
+    """
+    h = hashlib.sha256()
+    _update(h, value)
+    return h.hexdigest()
+
+
+def _update(h, value):
+    """Feed a value into a hash in a type-tagged, unambiguous form"""
+    if isinstance(value, Path):
+        if value.is_file():
+            h.update(b"F" + file_digest(value).encode('ascii'))
+        elif value.is_dir():
+            h.update(b"D" + tree_digest(value).encode('ascii'))
+        else:
+            h.update(b"M" + str(value).encode('utf-8') + b"\0")
+    elif isinstance(value, bytes):
+        h.update(b"B" + str(len(value)).encode('ascii') + b"\0" + value)
+    elif isinstance(value, dict):
+        h.update(b"{")
+        for key in sorted(value, key=str):
+            _update(h, str(key))
+            _update(h, value[key])
+        h.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        h.update(b"[")
+        for item in value:
+            _update(h, item)
+        h.update(b"]")
+    else:
+        h.update(b"V" + json.dumps(value, sort_keys=True, default=str).encode('utf-8') + b"\0")
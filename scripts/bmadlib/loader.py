@@ -0,0 +1,64 @@
+"""
+BMAD Enhanced - Script Loader
+Import the hyphenated scripts in this directory as modules.
+"""
+
+import os
+import sys
+import importlib.machinery
+from types import ModuleType
+
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_script(filename: str):
+    """Import a script such as ``monitor-skills.py`` once, as ``bmad_monitor_skills``
+
+    Scripts are read through this package's loader when they are not
+    plain files, so the same code works from a bmad.pyz zipapp.
+    """
+    name = "bmad_" + os.path.splitext(filename)[0].replace("-", "_")
+    if name in sys.modules:
+        return sys.modules[name]
+    path = os.path.join(SCRIPTS_DIR, filename)
+    # Only modules loaded at interpreter startup are used here (no pathlib or
+    # importlib.util), so loading a script costs little beyond the script
+    loader = importlib.machinery.SourceFileLoader(name, path) if os.path.isfile(path) else _ArchiveLoader(path)
+    spec = importlib.machinery.ModuleSpec(name, loader, origin=path)
+    module = ModuleType(name)
+    module.__spec__, module.__loader__, module.__file__ = spec, loader, path
+    # Registered before execution so worker processes can unpickle its functions
+    sys.modules[name] = module
+    try:
+        loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+class _ArchiveLoader:
+    """Loader for a script stored in the archive this package was imported from"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def create_module(self, spec):
+        return None
+
+    def exec_module(self, module):
+        import marshal
+        import importlib.util
+
+        module.__file__ = self.path
+        try:
+            # Bytecode written next to the script by "bmad zipapp"
+            data = __loader__.get_data(self.path + "c")
+        except OSError:
+            data = b""
+        if data[:4] == importlib.util.MAGIC_NUMBER:
+            code = marshal.loads(data[16:])
+        else:
+            code = compile(__loader__.get_data(self.path), self.path, "exec")
+        exec(code, module.__dict__)
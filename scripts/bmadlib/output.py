@@ -0,0 +1,169 @@
+"""
+BMAD Enhanced - Report Output
+Terminal colors and a buffered report writer shared by the scripts.
+
+Reports are built line by line into a buffer and written in a few large
+chunks rather than one ``print()`` per line, which is what dominates
+rendering time for big reports on slow terminals and SSH sessions.
+"""
+
+import os
+import sys
+from typing import Iterable, List, Optional, Sequence, TextIO, Tuple
+
+
+# Lines buffered before a chunk is written (about 64 KB of report text)
+CHUNK_LINES = 1024
+
+
+class Colors:
+    """ANSI color codes"""
+    HEADER = '\033[95m'
+    BLUE = '\033[94m'
+    CYAN = '\033[96m'
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    ENDC = '\033[0m'
+    BOLD = '\033[1m'
+    UNDERLINE = '\033[4m'
+    DIM = '\033[2m'
+
+
+class NoColors(Colors):
+    """Empty color codes for files, pipes and NO_COLOR"""
+    HEADER = BLUE = CYAN = GREEN = YELLOW = RED = ENDC = BOLD = UNDERLINE = DIM = ''
+
+
+def _isatty(stream: TextIO) -> bool:
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def use_color(stream: Optional[TextIO] = None) -> bool:
+    """True unless NO_COLOR is set or the stream is not a terminal
+
+    ``BMAD_COLOR=1`` forces colors, e.g. for ``less -R`` or when the daemon
+    runs a script for a client whose output is a terminal.
+    """
+    if os.environ.get("NO_COLOR"):
+        return False
+    return os.environ.get("BMAD_COLOR") == "1" or _isatty(stream or sys.stdout)
+
+
+def colors_for(stream: Optional[TextIO] = None):
+    """Colors or NoColors, whichever suits the stream"""
+    return Colors if use_color(stream) else NoColors
+
+
+def limited(items: Sequence, limit: Optional[int]) -> Tuple[Sequence, int]:
+    """The first ``limit`` items (all of them for None or 0) and how many were left out"""
+    if not limit or len(items) <= limit:
+        return items, 0
+    return items[:limit], len(items) - limit
+
+
+class Report:
+    """Buffered report output
+
+    ``line()`` appends to an in-memory buffer that is written CHUNK_LINES
+    lines at a time, and the rest on ``close()``. With
+    ``pager=True`` the whole report is kept and, if it is taller than the
+    terminal, shown through ``$PAGER`` (default ``less -FRX``).
+
+    Used as a context manager it closes when the outermost ``with`` block
+    ends, so a function can write to a caller's report or to its own with
+    ``with out or Report() as report:``.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, pager: bool = False, colors=None,
+                 chunk_lines: int = CHUNK_LINES):
+        self.stream = stream or sys.stdout
+        self.colors = colors or colors_for(self.stream)
+        self.pager = pager and _isatty(self.stream)
+        # Paging needs the whole report before deciding whether it fits
+        self.chunk_lines = 0 if self.pager else chunk_lines
+        self._parts: List[str] = []
+        self._written = 0
+        self._depth = 0
+        self._broken = False
+
+    @property
+    def lines(self) -> int:
+        """Lines added so far"""
+        return self._written + len(self._parts)
+
+    def line(self, text: str = ""):
+        """Add one line"""
+        parts = self._parts
+        parts.append(text)
+        if len(parts) == self.chunk_lines:
+            self.flush()
+
+    def lines_from(self, texts: Iterable[str]):
+        """Add several lines"""
+        self._parts.extend(texts)
+        if self.chunk_lines and len(self._parts) >= self.chunk_lines:
+            self.flush()
+
+    def more(self, hidden: int, what: str = "rows", indent: str = "  "):
+        """Note how many entries --limit left out"""
+        if hidden:
+            noun = what[:-1] if hidden == 1 and what.endswith("s") else what
+            self.line(f"{indent}{self.colors.DIM}… {hidden} more {noun} (--limit 0 shows all){self.colors.ENDC}")
+
+    def flush(self):
+        """Write what has been buffered so far"""
+        parts, self._parts = self._parts, []
+        if self._broken:
+            return
+        self._written += len(parts)
+        try:
+            if parts:
+                parts.append("")
+                self.stream.write("\n".join(parts))
+            self.stream.flush()
+        except BrokenPipeError:
+            # The reader went away (e.g. "| head"): drop the rest quietly
+            self._broken = True
+            try:
+                os.dup2(os.open(os.devnull, os.O_WRONLY), self.stream.fileno())
+            except (OSError, ValueError):
+                pass
+
+    def close(self):
+        """Write (or page) the rest of the report"""
+        if self.pager and self._parts:
+            try:
+                import shutil
+                rows = shutil.get_terminal_size().lines
+            except OSError:
+                rows = 0
+            if rows and self.lines > rows - 1 and _page("\n".join(self._parts) + "\n"):
+                self._parts = []
+                return
+        self.flush()
+
+    def __enter__(self) -> "Report":
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc):
+        self._depth -= 1
+        if self._depth == 0:
+            self.close()
+        return False
+
+
+def _page(text: str) -> bool:
+    """Show text through the user's pager; False if no pager could be run"""
+    import subprocess
+
+    command = os.environ.get("PAGER") or "less -FRX"
+    try:
+        subprocess.run(command, shell=True, input=text, text=True, check=False)
+    except OSError:
+        return False
+    return True
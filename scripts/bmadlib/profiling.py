@@ -0,0 +1,289 @@
+"""
+BMAD Enhanced - Profiling Instrumentation
+Shared --profile, --trace-memory and --timings options for the scripts, and
+phase timers around their discovery, parsing, rendering and export work.
+
+Decorate a script's ``main()`` with ``@instrumented("name")``; the options
+are taken out of ``sys.argv`` before the script parses its own arguments,
+so they work however the script is started (directly, through ``bmad`` or
+the daemon). Without them, a phase costs two clock reads.
+"""
+
+import os
+import sys
+import time
+import functools
+from typing import Callable, Dict, List, Optional
+
+
+DEFAULT_PROFILE_DIR = ".claude/profiles"
+DEFAULT_TOP = 10
+
+# name -> [calls, total ns], in first-seen order
+_phases: Dict[str, List[int]] = {}
+# Phases currently open; a phase's time excludes the phases nested in it
+_open: List["_Phase"] = []
+
+
+class _Phase:
+    """Context manager adding a block's duration to a named phase
+
+    Phases are meant for the main thread: time spent in a nested phase is
+    subtracted from the enclosing one so the shares add up to the run.
+    """
+
+    __slots__ = ("name", "start", "nested")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.nested = 0
+
+    def __enter__(self):
+        _open.append(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        total = time.perf_counter_ns() - self.start
+        elapsed = total - self.nested
+        if _open and _open[-1] is self:
+            _open.pop()
+            if _open:
+                _open[-1].nested += total
+        entry = _phases.get(self.name)
+        if entry is None:
+            _phases[self.name] = [1, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
+        return False
+
+
+def phase(name: str) -> _Phase:
+    """Time a block as part of a phase (calls accumulate)"""
+    return _Phase(name)
+
+
+def phase_totals() -> Dict[str, List[int]]:
+    """Phases recorded so far: name -> [calls, total ns]"""
+    return {name: list(entry) for name, entry in _phases.items()}
+
+
+class Options:
+    """Profiling options taken from the command line"""
+
+    def __init__(self):
+        self.profile_dir: Optional[str] = None
+        self.trace_memory: Optional[int] = None
+        self.timings = False
+
+    @property
+    def active(self) -> bool:
+        return self.profile_dir is not None or self.trace_memory is not None or self.timings
+
+
+def take_options(argv: List[str]) -> Options:
+    """Remove --profile[=DIR], --trace-memory[=N] and --timings from argv"""
+    options = Options()
+    kept = []
+    for arg in argv:
+        name, eq, value = arg.partition("=")
+        if name == "--profile":
+            options.profile_dir = value if eq else DEFAULT_PROFILE_DIR
+        elif name == "--trace-memory":
+            # Only the =N form: a separate number may be the script's own argument
+            options.trace_memory = int(value) if value.isdigit() else DEFAULT_TOP
+        elif arg == "--timings":
+            options.timings = True
+        else:
+            kept.append(arg)
+    argv[:] = kept
+    return options
+
+
+def _frame_label(func: tuple) -> str:
+    filename, line, name = func
+    if filename == "~":
+        return name
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def stats_to_speedscope(stats, name: str) -> Dict:
+    """Approximate speedscope profile from cProfile statistics
+
+    cProfile keeps caller -> callee edges, not full stacks, so each
+    function's self time is split by direct caller (exact) and placed
+    under the caller's heaviest call path (approximate).
+    """
+    frames: List[Dict] = []
+    index: Dict[tuple, int] = {}
+
+    def frame(func: tuple) -> int:
+        if func not in index:
+            index[func] = len(frames)
+            filename, line, fname = func
+            entry = {"name": _frame_label(func)}
+            if filename != "~":
+                entry.update(file=filename, line=line)
+            frames.append(entry)
+        return index[func]
+
+    raw = stats.stats
+    heaviest = {func: max(callers, key=lambda c: callers[c][3]) for func, (_, _, _, _, callers) in raw.items()
+                if callers}
+    paths: Dict[tuple, List[int]] = {}
+
+    def path(func: tuple) -> List[int]:
+        if func not in paths:
+            chain = []
+            seen = set()
+            current = func
+            while current is not None and current not in seen:
+                seen.add(current)
+                chain.append(current)
+                current = heaviest.get(current)
+            paths[func] = [frame(f) for f in reversed(chain)]
+        return paths[func]
+
+    samples = []
+    weights = []
+    for func, (_, _, tottime, _, callers) in raw.items():
+        if tottime <= 0:
+            continue
+        if not callers:
+            samples.append(path(func))
+            weights.append(tottime)
+            continue
+        for caller, (_, _, caller_tt, _) in callers.items():
+            if caller_tt > 0:
+                samples.append(path(caller) + [frame(func)])
+                weights.append(caller_tt)
+
+    total = sum(weights)
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "bmad-enhanced",
+        "shared": {"frames": frames},
+        "profiles": [{
+            "type": "sampled",
+            "name": name,
+            "unit": "seconds",
+            "startValue": 0,
+            "endValue": total,
+            "samples": samples,
+            "weights": weights
+        }]
+    }
+
+
+def format_ms(ns: float) -> str:
+    """Nanoseconds as a short millisecond string"""
+    return f"{ns / 1e6:.1f}ms"
+
+
+def print_timings(total_ns: int, out=None):
+    """Compact table of phase times as a share of the whole run"""
+    out = out or sys.stderr
+    total_ns = max(total_ns, 1)
+    lines = ["", "⏱️  Timings", f"  {'phase':<14} {'calls':>6} {'time':>10} {'share':>6}"]
+    accounted = 0
+    for name, (calls, ns) in _phases.items():
+        accounted += ns
+        lines.append(f"  {name:<14} {calls:>6} {format_ms(ns):>10} {ns / total_ns:>6.0%}")
+    other = total_ns - accounted
+    if _phases and other > 0:
+        lines.append(f"  {'(other)':<14} {'':>6} {format_ms(other):>10} {other / total_ns:>6.0%}")
+    lines.append(f"  {'total':<14} {'':>6} {format_ms(total_ns):>10}")
+    out.write("\n".join(lines) + "\n")
+
+
+class Instrumentation:
+    """Profiles and/or memory-traces a block according to Options"""
+
+    def __init__(self, name: str, options: Options, out=None):
+        self.name = name
+        self.options = options
+        self.out = out or sys.stderr
+        self.profiler = None
+        self.start_ns = 0
+
+    def __enter__(self):
+        if self.options.trace_memory is not None:
+            import tracemalloc
+            tracemalloc.start(1)
+        if self.options.profile_dir is not None:
+            import cProfile
+            self.profiler = cProfile.Profile()
+        _phases.clear()
+        del _open[:]
+        self.start_ns = time.perf_counter_ns()
+        if self.profiler:
+            self.profiler.enable()
+        return self
+
+    def __exit__(self, *exc):
+        if self.profiler:
+            self.profiler.disable()
+        total_ns = time.perf_counter_ns() - self.start_ns
+        # Reports must never turn a successful run into a failure
+        try:
+            self.out.flush()
+            sys.stdout.flush()
+            print_timings(total_ns, self.out)
+            if self.options.trace_memory is not None:
+                self._report_memory()
+            if self.profiler:
+                self._report_profile()
+        except OSError as e:
+            self.out.write(f"⚠️  Could not write profiling output: {e}\n")
+        return False
+
+    def _report_memory(self):
+        import tracemalloc
+
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+        lines = ["", f"🧠 Memory: peak {peak / 1024 / 1024:.1f} MB, {current / 1024 / 1024:.1f} MB still allocated",
+                 f"  {'size':>10} {'blocks':>8}  allocated at"]
+        cwd = os.getcwd() + os.sep
+        for stat in snapshot.statistics("lineno")[:self.options.trace_memory]:
+            where = stat.traceback[0]
+            filename = where.filename[len(cwd):] if where.filename.startswith(cwd) else where.filename
+            lines.append(f"  {stat.size / 1024:>8.1f}KB {stat.count:>8}  {filename}:{where.lineno}")
+        self.out.write("\n".join(lines) + "\n")
+
+    def _report_profile(self):
+        import json
+        import pstats
+
+        os.makedirs(self.options.profile_dir, exist_ok=True)
+        base = os.path.join(self.options.profile_dir, f"{self.name}-{time.strftime('%Y%m%d-%H%M%S')}")
+        stats = pstats.Stats(self.profiler, stream=self.out)
+        stats.dump_stats(base + ".prof")
+        with open(base + ".speedscope.json", "w", encoding="utf-8") as f:
+            json.dump(stats_to_speedscope(stats, self.name), f)
+
+        lines = ["", f"🔬 Top functions by own time ({len(stats.stats)} profiled)",
+                 f"  {'own':>9} {'cumulative':>11} {'calls':>8}  function"]
+        ranked = sorted(stats.stats.items(), key=lambda item: -item[1][2])
+        for func, (_, calls, tottime, cumtime, _) in ranked[:DEFAULT_TOP]:
+            lines.append(f"  {tottime * 1000:>7.1f}ms {cumtime * 1000:>9.1f}ms {calls:>8}  {_frame_label(func)}")
+        lines.append(f"  Saved {base}.prof (python3 -m pstats) and {base}.speedscope.json (speedscope.app)")
+        self.out.write("\n".join(lines) + "\n")
+
+
+def instrumented(name: str) -> Callable:
+    """Decorator giving a script's main() the shared profiling options"""
+    def decorator(main: Callable) -> Callable:
+        @functools.wraps(main)
+        def wrapper(*args, **kwargs):
+            options = take_options(sys.argv)
+            if not options.active:
+                return main(*args, **kwargs)
+            with Instrumentation(name, options):
+                return main(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,77 @@
+"""
+BMAD Enhanced - Daemon Protocol
+Socket location and newline-delimited JSON framing shared by the bmad
+daemon and its thin client. Standard library only and cheap to import
+(no typing or hashlib), so the client can run under ``python -S``.
+"""
+
+import os
+import json
+import zlib
+import socket
+
+
+SOCKET_ENV = "BMAD_DAEMON_SOCKET"
+
+# Scripts the daemon serves, by client tool name
+TOOLS = {
+    "wizard": "bmad-wizard.py",
+    "monitor": "monitor-skills.py",
+    "errors": "error-handler.py",
+    "analytics": "error-analytics.py",
+    "report": "performance-report.py",
+    "progress": "progress-visualizer.py",
+    "health": "health-check.py",
+}
+
+
+def socket_path(root: str = None) -> str:
+    """Socket of the daemon serving a project root (default: cwd)
+
+    ``BMAD_DAEMON_SOCKET`` overrides the location. Otherwise the socket
+    lives in ``$XDG_RUNTIME_DIR`` (or /tmp) and is named after the user and
+    the project root, so each project gets its own daemon.
+    """
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return override
+    root = os.path.realpath(root or os.getcwd())
+    digest = f"{zlib.crc32(root.encode('utf-8')):08x}"
+    base = os.environ.get("XDG_RUNTIME_DIR") or "/tmp"
+    return os.path.join(base, f"bmad-{os.getuid()}-{digest}.sock")
+
+
+def encode(message: dict) -> bytes:
+    """One protocol frame: compact JSON followed by a newline"""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False).encode('utf-8') + b"\n"
+
+
+def decode(line: bytes) -> dict:
+    """Parse one protocol frame"""
+    return json.loads(line.decode('utf-8'))
+
+
+def request(message: dict, path: str = None, timeout: float = None) -> dict:
+    """Send one request to the daemon and wait for its response
+
+    Raises OSError (e.g. FileNotFoundError, ConnectionRefusedError) when no
+    daemon is listening, so callers can fall back to running locally.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(path or socket_path())
+        sock.sendall(encode(message))
+        sock.shutdown(socket.SHUT_WR)
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        sock.close()
+    data = b"".join(chunks)
+    if not data:
+        raise ConnectionResetError("daemon closed the connection without a response")
+    return decode(data)
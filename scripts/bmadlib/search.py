@@ -0,0 +1,243 @@
+"""
+BMAD Enhanced - Text Search
+Tokenizer with Porter stemming and a BM25 inverted index shared by the
+wizard's command search and the documentation search.
+"""
+
+import math
+import re
+import heapq
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
+
+
+STOPWORDS = frozenset("""
+a about all an and any are as at be been but by can could do does for from get
+has have help how i if in into is it its just like make me my need needs new of
+on or our please should so some that the their them then there these this to
+too up us want was we what when where which while who will with would you your
+""".split())
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, split on non-alphanumerics, drop stopwords and stem"""
+    return [stem(word) for word in _WORD.findall(text.lower()) if word not in STOPWORDS]
+
+
+# Porter stemmer (M.F. Porter, 1980)
+
+def _is_consonant(word: str, i: int) -> bool:
+    char = word[i]
+    if char in "aeiou":
+        return False
+    if char == "y":
+        return i == 0 or not _is_consonant(word, i - 1)
+    return True
+
+
+def _measure(stem_: str) -> int:
+    """Number of vowel-consonant sequences, m in [C](VC)^m[V]"""
+    n, i, length = 0, 0, len(stem_)
+    while i < length and _is_consonant(stem_, i):
+        i += 1
+    while i < length:
+        while i < length and not _is_consonant(stem_, i):
+            i += 1
+        if i >= length:
+            break
+        while i < length and _is_consonant(stem_, i):
+            i += 1
+        n += 1
+    return n
+
+
+def _has_vowel(stem_: str) -> bool:
+    return any(not _is_consonant(stem_, i) for i in range(len(stem_)))
+
+
+def _ends_double(word: str) -> bool:
+    return len(word) >= 2 and word[-1] == word[-2] and _is_consonant(word, len(word) - 1)
+
+
+def _cvc(word: str) -> bool:
+    """Ends consonant-vowel-consonant, the last not w, x or y"""
+    return (len(word) >= 3 and _is_consonant(word, len(word) - 3)
+            and not _is_consonant(word, len(word) - 2)
+            and _is_consonant(word, len(word) - 1) and word[-1] not in "wxy")
+
+
+_STEP2 = [("ational", "ate"), ("tional", "tion"), ("enci", "ence"), ("anci", "ance"),
+          ("izer", "ize"), ("bli", "ble"), ("alli", "al"), ("entli", "ent"), ("eli", "e"),
+          ("ousli", "ous"), ("ization", "ize"), ("ation", "ate"), ("ator", "ate"),
+          ("alism", "al"), ("iveness", "ive"), ("fulness", "ful"), ("ousness", "ous"),
+          ("aliti", "al"), ("iviti", "ive"), ("biliti", "ble"), ("logi", "log")]
+_STEP3 = [("icate", "ic"), ("ative", ""), ("alize", "al"), ("iciti", "ic"),
+          ("ical", "ic"), ("ful", ""), ("ness", "")]
+_STEP4 = ["al", "ance", "ence", "er", "ic", "able", "ible", "ant", "ement", "ment",
+          "ent", "ion", "ou", "ism", "ate", "iti", "ous", "ive", "ize"]
+
+for _table in (_STEP2, _STEP3):
+    _table.sort(key=lambda pair: -len(pair[0]))
+_STEP4.sort(key=len, reverse=True)
+
+
+def _replace(word: str, table: List[Tuple[str, str]], min_measure: int) -> str:
+    for suffix, replacement in table:
+        if word.endswith(suffix):
+            base = word[:-len(suffix)]
+            return base + replacement if _measure(base) > min_measure else word
+    return word
+
+
+@lru_cache(maxsize=20000)
+def stem(word: str) -> str:
+    """Reduce an English word to its Porter stem"""
+    if len(word) <= 2 or not word.isalpha():
+        return word
+
+    # Step 1a: plurals
+    if word.endswith("sses"):
+        word = word[:-2]
+    elif word.endswith("ies"):
+        word = word[:-2]
+    elif word.endswith("s") and not word.endswith("ss"):
+        word = word[:-1]
+
+    # Step 1b: -eed, -ed, -ing
+    if word.endswith("eed"):
+        if _measure(word[:-3]) > 0:
+            word = word[:-1]
+    else:
+        for suffix in ("ed", "ing"):
+            if word.endswith(suffix) and _has_vowel(word[:-len(suffix)]):
+                word = word[:-len(suffix)]
+                if word.endswith(("at", "bl", "iz")):
+                    word += "e"
+                elif _ends_double(word) and word[-1] not in "lsz":
+                    word = word[:-1]
+                elif _measure(word) == 1 and _cvc(word):
+                    word += "e"
+                break
+
+    # Step 1c: y -> i
+    if word.endswith("y") and _has_vowel(word[:-1]):
+        word = word[:-1] + "i"
+
+    word = _replace(word, _STEP2, 0)
+    word = _replace(word, _STEP3, 0)
+
+    # Step 4: drop derivational suffixes from long stems
+    for suffix in _STEP4:
+        if word.endswith(suffix):
+            base = word[:-len(suffix)]
+            if _measure(base) > 1 and (suffix != "ion" or base.endswith(("s", "t"))):
+                word = base
+            break
+
+    # Step 5: tidy up -e and -ll
+    if word.endswith("e"):
+        base = word[:-1]
+        if _measure(base) > 1 or (_measure(base) == 1 and not _cvc(base)):
+            word = base
+    if word.endswith("ll") and _measure(word) > 1:
+        word = word[:-1]
+    return word
+
+
+def idf(n: int, df: int) -> float:
+    """BM25 inverse document frequency (always positive)"""
+    return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+
+def bm25(tf: float, term_idf: float, length: float, avg_length: float,
+         k1: float = 1.2, b: float = 0.75) -> float:
+    """BM25 contribution of one term to one document's score"""
+    return term_idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * length / avg_length))
+
+
+class BM25Index:
+    """Inverted index with Okapi BM25 ranking
+
+    Documents are added as text or as ``{field: text}`` with per-field
+    weights (BM25F-style: a term in a weight-3 field counts three times).
+    Postings and IDF are rebuilt lazily after changes, so bulk loading
+    costs one rebuild. Per-document term counts are kept, so an index can
+    be saved with ``to_dict()`` and updated document by document later
+    without re-tokenizing unchanged documents.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.docs: Dict[str, Dict] = {}
+        self._postings: Optional[Dict[str, List[Tuple[str, float]]]] = None
+        self._idf: Dict[str, float] = {}
+        self._avg_length = 0.0
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def add(self, doc_id: str, text: Union[str, Dict[str, str]],
+            weights: Optional[Dict[str, float]] = None, meta: Optional[Dict] = None):
+        """Index a document, replacing any previous version"""
+        fields = {"text": text} if isinstance(text, str) else text
+        counts: Dict[str, float] = {}
+        for field, value in fields.items():
+            weight = (weights or {}).get(field, 1.0)
+            for term in tokenize(value or ""):
+                counts[term] = counts.get(term, 0.0) + weight
+        self.add_terms(doc_id, counts, meta)
+
+    def add_terms(self, doc_id: str, counts: Dict[str, float], meta: Optional[Dict] = None):
+        """Index a document from precomputed (weighted) term counts"""
+        self.docs[doc_id] = {"terms": counts, "length": sum(counts.values()), "meta": meta or {}}
+        self._postings = None
+
+    def remove(self, doc_id: str):
+        """Drop a document from the index"""
+        if self.docs.pop(doc_id, None) is not None:
+            self._postings = None
+
+    def search(self, query: str, k: int = 10) -> List[Tuple[str, float]]:
+        """Top-k (doc_id, score) pairs for a query, best first"""
+        if self._postings is None:
+            self.build()
+        scores: Dict[str, float] = {}
+        avg = self._avg_length or 1.0
+        for term in set(tokenize(query)):
+            idf = self._idf.get(term)
+            if idf is None:
+                continue
+            for doc_id, tf in self._postings[term]:
+                weight = bm25(tf, idf, self.docs[doc_id]["length"], avg, self.k1, self.b)
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight
+        return heapq.nsmallest(k, scores.items(), key=lambda item: (-item[1], item[0]))
+
+    def meta(self, doc_id: str) -> Dict:
+        """Metadata stored with a document"""
+        return self.docs[doc_id]["meta"]
+
+    def to_dict(self) -> Dict:
+        """Serialise documents and their term counts"""
+        return {"k1": self.k1, "b": self.b, "docs": self.docs}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "BM25Index":
+        """Restore an index written by to_dict"""
+        index = cls(data.get("k1", 1.2), data.get("b", 0.75))
+        index.docs = data.get("docs", {})
+        return index
+
+    def build(self):
+        """Rebuild postings, IDF and average length (done lazily by search)"""
+        postings: Dict[str, List[Tuple[str, float]]] = {}
+        for doc_id, doc in self.docs.items():
+            for term, tf in doc["terms"].items():
+                postings.setdefault(term, []).append((doc_id, tf))
+        n = len(self.docs)
+        self._idf = {term: idf(n, len(docs)) for term, docs in postings.items()}
+        self._avg_length = sum(doc["length"] for doc in self.docs.values()) / n if n else 0.0
+        self._postings = postings
+
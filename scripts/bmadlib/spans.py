@@ -0,0 +1,265 @@
+"""
+BMAD Enhanced - Span Profiler
+Hierarchical span recording with monotonic nanosecond timing, exportable to
+Chrome trace-event JSON (chrome://tracing, Perfetto) and speedscope.
+"""
+
+import os
+import json
+import random
+import functools
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+
+class Span:
+    """A timed, named interval; children nest inside their parent"""
+
+    __slots__ = ("name", "start_ns", "end_ns", "parent", "root", "tid", "args")
+
+    def __init__(self, name: str, parent: Optional["Span"], tid: int, args: Optional[Dict]):
+        self.name = name
+        self.parent = parent
+        self.root = parent.root if parent is not None else self
+        self.tid = tid
+        self.args = args
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: Optional[int] = None
+
+    @property
+    def duration_ns(self) -> Optional[int]:
+        return None if self.end_ns is None else self.end_ns - self.start_ns
+
+
+class _Unsampled:
+    """Stand-in span for roots skipped by sampling (and their children)"""
+
+    name = "unsampled"
+    parent = None
+    root = None
+    end_ns = None
+
+
+_UNSAMPLED = _Unsampled()
+
+
+class _SpanContext:
+    """Context manager returned by SpanRecorder.span()"""
+
+    __slots__ = ("recorder", "name", "args", "span")
+
+    def __init__(self, recorder: "SpanRecorder", name: str, args: Optional[Dict]):
+        self.recorder = recorder
+        self.name = name
+        self.args = args
+        self.span = None
+
+    def __enter__(self):
+        self.span = self.recorder.begin(self.name, args=self.args)
+        self.recorder._stack().append(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        stack = self.recorder._stack()
+        if stack and stack[-1] is self.span:
+            stack.pop()
+        if exc_type is not None and isinstance(self.span, Span):
+            self.span.args = dict(self.span.args or {}, error=exc_type.__name__)
+        self.recorder.end(self.span)
+        return False
+
+
+class SpanRecorder:
+    """Records nested spans for later export
+
+    Use ``with recorder.span("name"):`` or ``@recorder.traced()`` for lexical
+    nesting (tracked per thread), or ``begin()``/``end()`` with an explicit
+    parent for spans that don't follow the call stack, such as workflow
+    steps. With ``sample_rate`` < 1 only that fraction of root spans (with
+    all their children) is recorded. At most ``max_spans`` spans are kept;
+    later ones are counted in ``dropped``.
+    """
+
+    def __init__(self, sample_rate: float = 1.0, max_spans: int = 100000):
+        self.sample_rate = sample_rate
+        self.max_spans = max_spans
+        self.spans: List[Span] = []
+        self.dropped = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def span(self, name: str, **args) -> _SpanContext:
+        """Context manager timing a span nested under the current one"""
+        return _SpanContext(self, name, args or None)
+
+    def traced(self, name: Optional[str] = None) -> Callable:
+        """Decorator timing every call of a function as a span"""
+        def decorator(func: Callable) -> Callable:
+            span_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(span_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def begin(self, name: str, parent=None, args: Optional[Dict] = None):
+        """Open a span under ``parent`` (default: the thread's current span)"""
+        if parent is None:
+            stack = self._stack()
+            parent = stack[-1] if stack else None
+        if parent is _UNSAMPLED:
+            return _UNSAMPLED
+        if parent is None and self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return _UNSAMPLED
+        return Span(name, parent, threading.get_ident(), args)
+
+    def end(self, span):
+        """Close a span opened with begin()"""
+        if span is _UNSAMPLED or span is None or span.end_ns is not None:
+            return
+        span.end_ns = time.perf_counter_ns()
+        with self._lock:
+            if len(self.spans) < self.max_spans:
+                self.spans.append(span)
+            else:
+                self.dropped += 1
+
+    def clear(self):
+        """Forget all recorded spans"""
+        with self._lock:
+            self.spans = []
+            self.dropped = 0
+
+    def to_chrome_trace(self) -> Dict:
+        """Export as Chrome trace-event JSON ("X" complete events, microseconds)"""
+        events = []
+        pid = os.getpid()
+        lanes = self._lanes()
+        origin = self._origin()
+        for lane, (label, spans) in enumerate(lanes, 1):
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": lane,
+                           "args": {"name": label}})
+            for span in spans:
+                event = {
+                    "name": span.name,
+                    "ph": "X",
+                    "pid": pid,
+                    "tid": lane,
+                    "ts": (span.start_ns - origin) / 1000,
+                    "dur": span.duration_ns / 1000
+                }
+                if span.args:
+                    event["args"] = span.args
+                events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def to_speedscope(self, name: str = "BMAD trace") -> Dict:
+        """Export as a speedscope evented profile, one profile per span tree"""
+        frames: List[Dict] = []
+        frame_index: Dict[str, int] = {}
+        profiles = []
+        origin = self._origin()
+
+        for label, spans in self._lanes():
+            events = []
+            open_spans: List[Span] = []
+            for span in spans:
+                # Close spans that ended before this one starts
+                while open_spans and open_spans[-1].end_ns <= span.start_ns:
+                    done = open_spans.pop()
+                    events.append({"type": "C", "frame": frame_index[done.name], "at": done.end_ns - origin})
+                if span.name not in frame_index:
+                    frame_index[span.name] = len(frames)
+                    frames.append({"name": span.name})
+                events.append({"type": "O", "frame": frame_index[span.name], "at": span.start_ns - origin})
+                open_spans.append(span)
+            while open_spans:
+                done = open_spans.pop()
+                events.append({"type": "C", "frame": frame_index[done.name], "at": done.end_ns - origin})
+
+            profiles.append({
+                "type": "evented",
+                "name": label,
+                "unit": "nanoseconds",
+                "startValue": spans[0].start_ns - origin,
+                "endValue": max(s.end_ns for s in spans) - origin,
+                "events": events
+            })
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "bmad-enhanced",
+            "shared": {"frames": frames},
+            "profiles": profiles
+        }
+
+    def export(self, path: str, fmt: Optional[str] = None) -> Path:
+        """Write a trace file; format is 'chrome' or 'speedscope' (default: by file name)"""
+        path = Path(path)
+        if fmt is None:
+            fmt = "speedscope" if path.name.endswith(".speedscope.json") else "chrome"
+        data = self.to_speedscope(path.stem) if fmt == "speedscope" else self.to_chrome_trace()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data), encoding='utf-8')
+        return path
+
+    def _stack(self) -> List:
+        """The calling thread's stack of open context-managed spans"""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _origin(self) -> int:
+        """Earliest recorded start, used as time zero in exports"""
+        with self._lock:
+            return min((s.start_ns for s in self.spans), default=0)
+
+    def _lanes(self) -> List[tuple]:
+        """Group finished spans into properly nested lanes, one per span tree"""
+        with self._lock:
+            spans = list(self.spans)
+        trees: Dict[int, List[Span]] = {}
+        for span in spans:
+            trees.setdefault(id(span.root), []).append(span)
+        lanes = []
+        for tree in trees.values():
+            tree.sort(key=lambda s: (s.start_ns, -s.end_ns))
+            root = tree[0].root
+            lanes.append((f"{root.name} (thread {root.tid})", tree))
+        lanes.sort(key=lambda lane: lane[1][0].start_ns)
+        return lanes
+
+
+_recorder: Optional[SpanRecorder] = None
+
+
+def get_recorder() -> SpanRecorder:
+    """Return the process-wide span recorder"""
+    global _recorder
+    if _recorder is None:
+        _recorder = SpanRecorder(sample_rate=float(os.environ.get("BMAD_TRACE_SAMPLE", "1.0")))
+    return _recorder
+
+
+def span(name: str, **args) -> _SpanContext:
+    """Time a block on the process-wide recorder"""
+    return get_recorder().span(name, **args)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """Decorator timing a function on the process-wide recorder"""
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with get_recorder().span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
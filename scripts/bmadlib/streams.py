@@ -0,0 +1,158 @@
+"""
+BMAD Enhanced - Streaming Log Readers
+Read JSON records from (rotated, optionally gzip-compressed) log files one
+record at a time, without loading whole files into memory.
+"""
+
+import gzip
+import json
+import re
+from datetime import datetime
+from json.decoder import WHITESPACE
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+
+CHUNK_SIZE = 64 * 1024
+MAX_RECORD_BYTES = 4 * 1024 * 1024
+
+# errors.log.1, errors.log.2.gz (logrotate numbered style)
+_NUMBERED = re.compile(r'^\.(\d+)(\.gz)?$')
+# errors.log-20250105, errors.log-20250105.gz (logrotate dateext style)
+_DATED = re.compile(r'^-(\d{8,14})(\.gz)?$')
+
+
+def rotated_logs(path: Union[str, Path]) -> List[Path]:
+    """Return a log file and its rotated siblings, oldest first"""
+    path = Path(path)
+    parent = path.parent if str(path.parent) else Path(".")
+    if not parent.is_dir():
+        return []
+
+    numbered = []
+    dated = []
+    for candidate in parent.iterdir():
+        name = candidate.name
+        if not name.startswith(path.name) or name == path.name:
+            continue
+        suffix = name[len(path.name):]
+        match = _NUMBERED.match(suffix)
+        if match:
+            numbered.append((int(match.group(1)), candidate))
+            continue
+        match = _DATED.match(suffix)
+        if match:
+            dated.append((match.group(1), candidate))
+
+    # Date-stamped archives sort chronologically; numbered ones count
+    # backwards (.1 is the most recent); the live file is always newest.
+    files = [p for _, p in sorted(dated)]
+    files.extend(p for _, p in sorted(numbered, reverse=True))
+    if path.is_file():
+        files.append(path)
+    return files
+
+
+def open_log(path: Union[str, Path]):
+    """Open a plain or gzip-compressed log file for text reading"""
+    path = Path(path)
+    if path.suffix == ".gz":
+        return gzip.open(path, 'rt', encoding='utf-8', errors='replace')
+    return open(path, 'r', encoding='utf-8', errors='replace')
+
+
+def parse_timestamp(value) -> Optional[float]:
+    """Parse an ISO 8601 timestamp into epoch seconds"""
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def format_epoch(seconds: float) -> str:
+    """Format epoch seconds as a local ISO 8601 timestamp"""
+    return datetime.fromtimestamp(seconds).isoformat()
+
+
+class JSONRecordReader:
+    """Stream JSON objects from one or more log files
+
+    Handles both JSON Lines and the concatenated, pretty-printed records
+    written by ``ErrorHandler``. Memory use is bounded by the read chunk size
+    plus the largest single record; records larger than ``max_record_bytes``
+    or that fail to parse are skipped and counted in ``malformed``.
+    """
+
+    def __init__(self,
+                 paths: Iterable[Union[str, Path]],
+                 chunk_size: int = CHUNK_SIZE,
+                 max_record_bytes: int = MAX_RECORD_BYTES):
+        self.paths = [Path(p) for p in paths]
+        self.chunk_size = chunk_size
+        self.max_record_bytes = max_record_bytes
+        self.records = 0
+        self.malformed = 0
+        self.files_read = 0
+
+    def __iter__(self) -> Iterator[Dict]:
+        for path in self.paths:
+            try:
+                handle = open_log(path)
+            except OSError:
+                continue
+            with handle:
+                self.files_read += 1
+                yield from self._decode(handle)
+
+    def _decode(self, handle) -> Iterator[Dict]:
+        """Decode consecutive JSON values from a text stream"""
+        decoder = json.JSONDecoder()
+        buf = ""
+        pos = 0
+        eof = False
+        # Discarding the rest of a record already counted as malformed
+        resyncing = False
+
+        while True:
+            pos = WHITESPACE.match(buf, pos).end()
+            if pos >= len(buf):
+                if eof:
+                    return
+                buf, pos = handle.read(self.chunk_size), 0
+                eof = not buf
+                continue
+
+            try:
+                obj, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                # Records never contain a line starting with "{" (nested
+                # objects are indented), so one after pos ends this record
+                nxt = buf.find("\n{", pos + 1)
+                if nxt == -1 and not eof and len(buf) - pos < self.max_record_bytes:
+                    # Possibly just incomplete: read on
+                    chunk = handle.read(self.chunk_size)
+                    if chunk:
+                        buf, pos = buf[pos:] + chunk, 0
+                    else:
+                        eof = True
+                    continue
+                # Unparseable: resynchronise on the next line opening a record
+                if not resyncing:
+                    self.malformed += 1
+                if nxt == -1:
+                    buf, pos = "", 0
+                    resyncing = True
+                else:
+                    pos = nxt + 1
+                    resyncing = False
+                continue
+
+            pos = end
+            resyncing = False
+            if isinstance(obj, dict):
+                self.records += 1
+                yield obj
+            else:
+                self.malformed += 1
@@ -0,0 +1,163 @@
+"""
+BMAD Enhanced - Telemetry Writer
+Non-blocking, buffered JSON Lines writer for telemetry records.
+"""
+
+import os
+import json
+import queue
+import atexit
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+
+DEFAULT_PATH = ".claude/logs/telemetry.jsonl"
+
+
+class TelemetryWriter:
+    """Append telemetry records to a JSONL file from a background thread
+
+    ``write()`` only appends the record to an in-memory queue, so recording
+    telemetry never waits on serialisation or disk I/O. A writer thread
+    serialises queued records and appends them in batches, at least every
+    ``flush_interval`` seconds. When the queue is full, new records are
+    dropped and counted in ``dropped`` rather than blocking the caller.
+    ``flush()`` queues a marker behind the pending records and waits for
+    the writer to reach it, so it returns once everything queued before it
+    is on disk, however busy other writing threads are.
+    Pending records are written on ``close()`` and at interpreter exit.
+    """
+
+    def __init__(self,
+                 path: str = DEFAULT_PATH,
+                 flush_interval: float = 1.0,
+                 batch_size: int = 256,
+                 max_queue: int = 10000):
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_queue = max_queue
+        self.written = 0
+        self.dropped = 0
+        self.errors = 0
+        self._queue: queue.Queue = queue.Queue(max_queue)
+        self._wake = threading.Event()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        atexit.register(self.close)
+
+    def write(self, record: Dict) -> bool:
+        """Queue a record; returns False if it was dropped"""
+        if self._closed:
+            self.dropped += 1
+            return False
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return False
+        if self._thread is None:
+            self._start()
+        if self._queue.qsize() >= self.batch_size:
+            self._wake.set()
+        return True
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until every record queued so far has been written"""
+        if self._thread is None or self._closed:
+            if self._thread is not None:
+                self._thread.join(timeout)
+            return self._queue.unfinished_tasks == 0
+        written = threading.Event()
+        try:
+            self._queue.put(written, timeout=timeout)
+        except queue.Full:
+            return False
+        self._wake.set()
+        return written.wait(timeout)
+
+    def close(self):
+        """Write pending records and stop the writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=5.0)
+        atexit.unregister(self.close)
+
+    def _start(self):
+        """Start the writer thread on first use"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="bmad-telemetry", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        """Writer loop: drain the queue in batches"""
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self._drain()
+            if self._closed:
+                self._drain()
+                return
+
+    def _drain(self):
+        """Serialise and append everything currently queued"""
+        taken = 0
+        lines = []
+        # Bounded, so busy writers cannot keep one batch growing forever
+        for _ in range(self._queue.qsize()):
+            try:
+                record = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            taken += 1
+            if isinstance(record, threading.Event):
+                # A flush() marker: write what came before it, then release it
+                self._append(lines, taken)
+                taken, lines = 0, []
+                record.set()
+                continue
+            try:
+                lines.append(json.dumps(record, separators=(",", ":"), default=str))
+            except (TypeError, ValueError):
+                self.errors += 1
+        self._append(lines, taken)
+
+    def _append(self, lines, taken: int):
+        """Append serialised records, then mark the taken queue items done"""
+        if lines:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write("\n".join(lines) + "\n")
+                self.written += len(lines)
+            except OSError:
+                self.errors += len(lines)
+        for _ in range(taken):
+            self._queue.task_done()
+
+
+_writers: Dict[str, TelemetryWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_writer(path: Optional[str] = None) -> Optional[TelemetryWriter]:
+    """Return the shared writer for a telemetry file
+
+    The path defaults to ``BMAD_TELEMETRY_FILE`` or ``.claude/logs/telemetry.jsonl``.
+    Returns None when telemetry is disabled with ``BMAD_TELEMETRY=0``.
+    """
+    if os.environ.get("BMAD_TELEMETRY", "1").lower() in ("0", "false", "off", "no"):
+        return None
+    path = path or os.environ.get("BMAD_TELEMETRY_FILE", DEFAULT_PATH)
+    with _writers_lock:
+        writer = _writers.get(path)
+        if writer is None or writer._closed:
+            writer = _writers[path] = TelemetryWriter(path)
+    return writer
@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+"""
+BMAD Enhanced - Delta Deployment
+
+Deploy BMAD Enhanced to many projects at once. Source files are hashed
+once; each target's install-manifest.yaml records what was deployed there
+last time, so only new or changed files are copied (atomically, via a
+temporary file and rename), and files edited in the target are left alone
+unless --force is given.
+"""
+
+import os
+import sys
+import stat
+import time
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from bmadlib.cache import Cache, get_cache
+from bmadlib.hashing import file_digest
+from bmadlib.output import Colors, colors_for
+from bmadlib.profiling import instrumented, phase
+
+
+BMAD_ROOT = Path(__file__).resolve().parent.parent
+
+# Same truncated SHA-256 as the BMAD installer's install-manifest.yaml
+HASH_LENGTH = 16
+
+MINIMAL_DOCS = ["QUICK-START.md", "TROUBLESHOOTING.md", "ERROR-CODES.md", "COMMAND-REFERENCE-SUMMARY.md"]
+
+# Manifest location in the target, per payload
+MANIFESTS = {
+    "minimal": ".claude/install-manifest.yaml",
+    "full": ".bmad-enhanced/install-manifest.yaml",
+    "core": ".bmad-core/install-manifest.yaml",
+}
+
+SKIP_DIRS = {"__pycache__", ".git"}
+# Runtime state of the source checkout, relative to its root; never deployed
+STATE_DIRS = {".claude/cache", ".claude/logs", ".claude/telemetry", ".claude/checkpoints", ".claude/profiles"}
+SKIP_SUFFIXES = (".pyc", ".pyo", ".db", ".db-wal", ".db-shm", ".sock")
+
+
+@dataclass
+class SourceFile:
+    """A file in the deployment payload"""
+    src: Path
+    hash: str
+
+
+@dataclass
+class DeployedFile:
+    """A file recorded in a target's install manifest"""
+    hash: str
+    # Size and mtime (ns) of the target file when it was last hashed
+    size: Optional[int] = None
+    mtime: Optional[int] = None
+
+    def matches(self, st: os.stat_result) -> bool:
+        """Whether the file on disk still has the recorded size and mtime"""
+        return self.size == st.st_size and self.mtime == st.st_mtime_ns
+
+
+@dataclass
+class TargetResult:
+    """What a deployment did (or would do) to one project"""
+    target: str
+    added: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    conflicts: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    bytes_copied: int = 0
+    duration_ms: float = 0.0
+    error: Optional[str] = None
+
+
+def short_hash(path: Path) -> str:
+    """Manifest hash of a file"""
+    return file_digest(path)[:HASH_LENGTH]
+
+
+def _walk(base: Path, prefix: str, root: Path = BMAD_ROOT) -> List[Tuple[Path, str]]:
+    """(source, relative destination) for every deployable file under base"""
+    files = []
+    for dirpath, dirnames, filenames in os.walk(base):
+        here = Path(dirpath)
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS and
+                             (here / d).relative_to(root).as_posix() not in STATE_DIRS)
+        for name in sorted(filenames):
+            if name.endswith(SKIP_SUFFIXES) or name == "install-manifest.yaml":
+                continue
+            src = Path(dirpath) / name
+            files.append((src, f"{prefix}/{src.relative_to(base).as_posix()}"))
+    return files
+
+
+def plan_payload(mode: str, root: Path = BMAD_ROOT) -> Tuple[List[Tuple[Path, str]], List[str]]:
+    """Files to deploy for a mode, as (source, destination), plus warnings"""
+    files: List[Tuple[Path, str]] = []
+    warnings = []
+
+    def add_tree(src: Path, prefix: str):
+        if src.is_dir():
+            files.extend(_walk(src, prefix, root))
+        else:
+            warnings.append(f"Skipped (not found): {src.relative_to(root)}")
+
+    if mode == "minimal":
+        add_tree(root / ".claude", ".claude")
+        add_tree(root / "scripts", "scripts")
+        docs = [root / "docs" / name for name in MINIMAL_DOCS]
+        docs += sorted((root / "docs").glob("quickstart-*.md"))
+        for doc in docs:
+            if doc.is_file():
+                files.append((doc, f"docs/{doc.name}"))
+            else:
+                warnings.append(f"Skipped (not found): {doc.relative_to(root)}")
+    elif mode == "full":
+        for name in (".claude", "scripts", "docs"):
+            add_tree(root / name, f".bmad-enhanced/{name}")
+    elif mode == "core":
+        add_tree(root / "BMAD" / ".bmad-core", ".bmad-core")
+    else:
+        raise ValueError(f"unknown mode: {mode}")
+    return files, warnings
+
+
+def hash_sources(files: List[Tuple[Path, str]], jobs: int = 8, cache: Optional[Cache] = None) -> Dict[str, SourceFile]:
+    """Hash every payload file once, in parallel
+
+    Hashes are remembered in the ``digests`` cache with each file's size
+    and mtime, so files unchanged since the last run (or since
+    warm-cache.py) are not read again.
+    """
+    cache = cache if cache is not None else get_cache("digests", BMAD_ROOT)
+    key = Cache.key("payload-digests", HASH_LENGTH, str(BMAD_ROOT))
+    known: Dict[str, list] = cache.get(key) or {}
+    fresh: Dict[str, list] = {}
+
+    def digest(src: Path) -> str:
+        st = src.stat()
+        stamp = [st.st_size, st.st_mtime_ns]
+        entry = known.get(str(src))
+        if entry and entry[:2] == stamp:
+            return entry[2]
+        h = short_hash(src)
+        fresh[str(src)] = stamp + [h]
+        return h
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        hashes = list(pool.map(lambda item: digest(item[0]), files))
+    if fresh:
+        known = {path: entry for path, entry in known.items() if os.path.exists(path)}
+        known.update(fresh)
+        cache.put(key, known)
+    return {dst: SourceFile(src, h) for (src, dst), h in zip(files, hashes)}
+
+
+def read_manifest(path: Path) -> Tuple[Dict[str, DeployedFile], List[str]]:
+    """Deployed files and the header lines (before ``files:``) of an install-manifest.yaml
+
+    Only the file list is needed, so the manifest is scanned line by line
+    rather than parsed as YAML; with dozens of targets sharing one process,
+    a full YAML parse per target cost more than the deployment itself.
+    """
+    try:
+        text = path.read_text(encoding='utf-8')
+    except OSError:
+        return {}, []
+    deployed: Dict[str, DeployedFile] = {}
+    header = []
+    in_files = False
+    current = None
+    for line in text.splitlines():
+        if not in_files:
+            if line.startswith("files:"):
+                in_files = True
+            elif not line.startswith(("installed_at:", "install_type:", "installed_by:")):
+                header.append(line)
+            continue
+        key, _, value = line.strip().lstrip("- ").partition(":")
+        value = value.strip().strip("'\"")
+        if key == "path":
+            current = value
+        elif current is None:
+            continue
+        elif key == "hash":
+            deployed[current] = DeployedFile(value)
+        elif key in ("size", "mtime") and current in deployed and value.isdigit():
+            setattr(deployed[current], key, int(value))
+    return deployed, header
+
+
+def write_manifest(path: Path, mode: str, files: Dict[str, DeployedFile], modified: set,
+                   header: Optional[List[str]] = None):
+    """Write install-manifest.yaml in the BMAD installer's layout, atomically
+
+    Header fields of an existing manifest (``version``, ``ides_setup``, ...)
+    are kept. Each file's size and mtime are added so the next run can tell
+    whether it changed without reading it.
+    """
+    lines = list(header or []) + [
+        f"installed_at: '{datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')}'",
+        f"install_type: {mode}",
+        "installed_by: deploy-projects.py",
+        "files:",
+    ]
+    for rel in sorted(files):
+        entry = files[rel]
+        lines.append(f"  - path: {rel}")
+        lines.append(f"    hash: {entry.hash}")
+        lines.append(f"    modified: {'true' if rel in modified else 'false'}")
+        if entry.size is not None and entry.mtime is not None:
+            lines.append(f"    size: {entry.size}")
+            lines.append(f"    mtime: {entry.mtime}")
+    atomic_write(path, ("\n".join(lines) + "\n").encode('utf-8'))
+
+
+def atomic_write(path: Path, data: bytes):
+    """Replace a file's contents atomically"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def atomic_copy(src: Path, dst: Path) -> int:
+    """Copy a file via a temporary file in the destination directory and rename"""
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{dst.name}.", suffix=".tmp", dir=dst.parent)
+    os.close(fd)
+    try:
+        shutil.copyfile(src, tmp)
+        shutil.copymode(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return src.stat().st_size
+
+
+def _stat(path: Path) -> Optional[os.stat_result]:
+    """stat() of a regular file, or None"""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
+
+
+def _recorded(digest: str, path: Path) -> DeployedFile:
+    """Manifest entry for a file just written"""
+    st = _stat(path)
+    return DeployedFile(digest, st.st_size, st.st_mtime_ns) if st else DeployedFile(digest)
+
+
+def deploy_target(target: Path, mode: str, sources: Dict[str, SourceFile],
+                  dry_run: bool = False, force: bool = False, prune: bool = False,
+                  create: bool = False) -> TargetResult:
+    """Bring one project up to date with the payload
+
+    For each payload file: unchanged since the last deployment (manifest
+    hash equals source hash, and the target file still has the size and
+    mtime recorded with it) → skipped without reading it; otherwise the
+    target file is hashed and copied unless it was edited locally (its hash
+    matches neither the manifest nor the source), which is a conflict
+    unless ``force``. ``force`` always re-hashes. Files deployed previously
+    but no longer in the payload are removed with ``prune`` if unedited.
+    """
+    start = time.perf_counter()
+    result = TargetResult(str(target))
+    try:
+        if not target.is_dir():
+            if not create:
+                raise FileNotFoundError(f"target does not exist (use --create): {target}")
+            if not dry_run:
+                target.mkdir(parents=True)
+
+        manifest_path = target / MANIFESTS[mode]
+        deployed, header = read_manifest(manifest_path)
+        files: Dict[str, DeployedFile] = {}
+        modified = set()
+
+        for rel, source in sources.items():
+            dst = target / rel
+            entry = deployed.get(rel)
+            previous = entry.hash if entry else None
+            st = _stat(dst)
+            if st and previous == source.hash and not force and entry.matches(st):
+                result.unchanged += 1
+                files[rel] = entry
+                continue
+            current = short_hash(dst) if st else None
+            if current == source.hash:
+                result.unchanged += 1
+                files[rel] = DeployedFile(source.hash, st.st_size, st.st_mtime_ns)
+                continue
+            if st and current != previous and not force:
+                result.conflicts.append(rel)
+                # No size/mtime: the file is hashed again next time
+                files[rel] = DeployedFile(previous or current)
+                modified.add(rel)
+                continue
+            (result.updated if st else result.added).append(rel)
+            if dry_run:
+                continue
+            result.bytes_copied += atomic_copy(source.src, dst)
+            files[rel] = _recorded(source.hash, dst)
+
+        for rel, entry in deployed.items():
+            if rel in sources:
+                continue
+            dst = target / rel
+            if not dst.is_file():
+                continue
+            if prune and (force or short_hash(dst) == entry.hash):
+                result.removed.append(rel)
+                if not dry_run:
+                    dst.unlink()
+            else:
+                # Still present; keep tracking it so a later --prune can remove it
+                files[rel] = entry
+
+        if not dry_run:
+            if mode == "full":
+                _link_full(target)
+            write_manifest(manifest_path, mode, files, modified, header)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    result.duration_ms = (time.perf_counter() - start) * 1000
+    return result
+
+
+def _link_full(target: Path):
+    """Point .claude, scripts and docs at the .bmad-enhanced copies"""
+    for name in (".claude", "scripts", "docs"):
+        link = target / name
+        if link.is_symlink():
+            link.unlink()
+        if not link.exists():
+            link.symlink_to(Path(".bmad-enhanced") / name)
+
+
+def read_targets(args) -> List[Path]:
+    """Targets from the command line and --targets-file"""
+    targets = [Path(t) for t in args.targets]
+    if args.targets_file:
+        with open(args.targets_file, encoding='utf-8') as f:
+            for line in f:
+                line = line.split("#", 1)[0].strip()
+                if line:
+                    targets.append(Path(line).expanduser())
+    return targets
+
+
+def print_diff(result: TargetResult, colors=Colors):
+    """Per-file changes for one target"""
+    for rel in result.added:
+        print(f"  {colors.GREEN}+ {rel}{colors.ENDC}")
+    for rel in result.updated:
+        print(f"  {colors.BLUE}~ {rel}{colors.ENDC}")
+    for rel in result.removed:
+        print(f"  {colors.RED}- {rel}{colors.ENDC}")
+    for rel in result.conflicts:
+        print(f"  {colors.YELLOW}! {rel} (edited in target; kept, use --force to overwrite){colors.ENDC}")
+
+
+def print_summary(results: List[TargetResult], dry_run: bool, colors=Colors):
+    """Per-target counts and timings"""
+    width = max([len(r.target) for r in results] + [6])
+    verb = "would copy" if dry_run else "copied"
+    print(f"\n{'Target':<{width}}  {'added':>6} {'updated':>7} {'removed':>7} {'same':>6} {'conflict':>8} {'ms':>8}")
+    print("─" * (width + 50))
+    for r in results:
+        if r.error:
+            print(f"{r.target:<{width}}  {colors.RED}❌ {r.error}{colors.ENDC}")
+            continue
+        print(f"{r.target:<{width}}  {len(r.added):>6} {len(r.updated):>7} {len(r.removed):>7} "
+              f"{r.unchanged:>6} {len(r.conflicts):>8} {r.duration_ms:>8.1f}")
+    ok = [r for r in results if not r.error]
+    copied = sum(len(r.added) + len(r.updated) for r in ok)
+    mb = sum(r.bytes_copied for r in ok) / (1024 * 1024)
+    print(f"\n{len(ok)}/{len(results)} targets, {copied} file(s) {verb}"
+          + (f" ({mb:.1f} MB)" if not dry_run else ""))
+
+
+def warm_targets(targets: List[str], colors):
+    """Start one background warm-cache.py run over freshly deployed targets"""
+    import subprocess
+
+    if not targets:
+        return
+    script = Path(__file__).resolve().parent / "warm-cache.py"
+    result = subprocess.run([sys.executable, str(script), "--background", "--targets", "skills,search"] + targets,
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    if result.returncode != 0:
+        print(f"{colors.YELLOW}⚠️  Cache warming not started: {result.stdout.strip()}{colors.ENDC}")
+    else:
+        print(result.stdout.strip())
+
+
+@instrumented("deploy-projects")
+def main():
+    """Main entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Deploy BMAD Enhanced to one or more projects, copying only changed files"
+    )
+    parser.add_argument("targets", nargs="*", help="Target project directories")
+    parser.add_argument("--targets-file", help="File with one target directory per line (# comments)")
+    parser.add_argument("--mode", choices=sorted(MANIFESTS), default="minimal",
+                        help="minimal (.claude, scripts, essential docs), full (.bmad-enhanced + symlinks) "
+                             "or core (.bmad-core) (default: minimal)")
+    parser.add_argument("--dry-run", action="store_true", help="Show the per-file diff without copying")
+    parser.add_argument("--force", action="store_true", help="Overwrite files edited in the target")
+    parser.add_argument("--prune", action="store_true", help="Remove deployed files no longer in the source")
+    parser.add_argument("--create", action="store_true", help="Create missing target directories")
+    parser.add_argument("--jobs", type=int, default=8, help="Targets deployed concurrently (default: 8)")
+    parser.add_argument("--quiet", action="store_true", help="Only print the summary")
+    parser.add_argument("--warm", action="store_true",
+                        help="Warm the caches of updated targets in the background (warm-cache.py)")
+    args = parser.parse_args()
+
+    colors = colors_for(sys.stdout)
+    targets = read_targets(args)
+    if not targets:
+        print(f"{colors.RED}Error: at least one target directory required{colors.ENDC}", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    with phase("discovery"):
+        files, warnings = plan_payload(args.mode)
+    for warning in warnings:
+        print(f"{colors.YELLOW}⚠️  {warning}{colors.ENDC}")
+    with phase("hashing"):
+        sources = hash_sources(files, jobs=max(1, args.jobs))
+    hashed_ms = (time.perf_counter() - start) * 1000
+    print(f"📦 {args.mode} payload: {len(sources)} files hashed in {hashed_ms:.0f}ms "
+          f"→ {len(targets)} target(s){' [DRY RUN]' if args.dry_run else ''}")
+
+    with phase("deploy"), ThreadPoolExecutor(max_workers=max(1, min(args.jobs, len(targets)))) as pool:
+        results = list(pool.map(
+            lambda t: deploy_target(t, args.mode, sources, args.dry_run, args.force, args.prune, args.create),
+            targets))
+
+    with phase("rendering"):
+        if not args.quiet:
+            for result in results:
+                if result.added or result.updated or result.removed or result.conflicts:
+                    print(f"\n{colors.BLUE}{result.target}{colors.ENDC}")
+                    print_diff(result, colors)
+
+        print_summary(results, args.dry_run, colors)
+    print(f"Total: {(time.perf_counter() - start) * 1000:.0f}ms")
+    if args.warm and not args.dry_run:
+        warm_targets([r.target for r in results if not r.error and (r.added or r.updated)], colors)
+    return 1 if any(r.error for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
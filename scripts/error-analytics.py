@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+BMAD Enhanced - Error Analytics
+Streams ErrorHandler logs (including rotated and gzip-compressed archives)
+and reports error rates by category and severity over time.
+"""
+
+import sys
+import csv
+import json
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple
+
+from bmadlib.profiling import instrumented, phase
+from bmadlib.streams import JSONRecordReader, format_epoch, parse_timestamp, rotated_logs
+
+
+DEFAULT_LOG = ".claude/logs/errors.log"
+
+BUCKET_SIZES = {
+    "5m": 300,
+    "15m": 900,
+    "hour": 3600,
+    "day": 86400,
+    "week": 604800,
+}
+
+# Severities that count as failures for MTBF
+FAILURE_SEVERITIES = {"critical", "error"}
+
+CSV_SECTIONS = ["buckets", "templates", "context_keys", "categories", "severities"]
+
+
+class TopK:
+    """Approximate top-k counter (Space-Saving) with fixed memory
+
+    Keeps at most ``capacity`` keys. Counts for keys that survive are upper
+    bounds; ``error`` records how much of a count may be inherited from an
+    evicted key.
+    """
+
+    def __init__(self, capacity: int = 100):
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+
+    def add(self, key: str, count: int = 1):
+        """Count one occurrence of key"""
+        if key in self.counts:
+            self.counts[key] += count
+            return
+        if len(self.counts) < self.capacity:
+            self.counts[key] = count
+            self.errors[key] = 0
+            return
+        victim = min(self.counts, key=self.counts.get)
+        floor = self.counts.pop(victim)
+        del self.errors[victim]
+        self.counts[key] = floor + count
+        self.errors[key] = floor
+
+    def top(self, n: int) -> List[Tuple[str, int, int]]:
+        """Return the n most frequent keys as (key, count, error)"""
+        ranked = sorted(self.counts.items(), key=lambda kv: (-kv[1], kv[0]))[:n]
+        return [(key, count, self.errors[key]) for key, count in ranked]
+
+
+class ErrorAnalytics:
+    """Single-pass aggregation over BMADError.to_dict records"""
+
+    def __init__(self,
+                 bucket_seconds: int = 3600,
+                 top_n: int = 10,
+                 since: Optional[float] = None,
+                 until: Optional[float] = None):
+        self.bucket_seconds = bucket_seconds
+        self.top_n = top_n
+        self.since = since
+        self.until = until
+
+        self.total = 0
+        self.untimed = 0
+        self.by_category: Dict[str, int] = {}
+        self.by_severity: Dict[str, int] = {}
+        self.buckets: Dict[int, Dict[Tuple[str, str], int]] = {}
+        capacity = max(top_n * 10, 100)
+        self.templates = TopK(capacity)
+        self.context_keys = TopK(capacity)
+
+        self.failures = 0
+        self.first_failure: Optional[float] = None
+        self.last_failure: Optional[float] = None
+        self.first_seen: Optional[float] = None
+        self.last_seen: Optional[float] = None
+
+    def consume(self, records: Iterable[Dict]) -> int:
+        """Aggregate a stream of records, returning how many were counted"""
+        before = self.total
+        for record in records:
+            self.add(record)
+        return self.total - before
+
+    def add(self, record: Dict):
+        """Aggregate a single error record"""
+        ts = parse_timestamp(record.get("timestamp"))
+        if ts is not None:
+            if self.since is not None and ts < self.since:
+                return
+            if self.until is not None and ts >= self.until:
+                return
+
+        category = str(record.get("category", "unknown"))
+        severity = str(record.get("severity", "unknown"))
+
+        self.total += 1
+        self.by_category[category] = self.by_category.get(category, 0) + 1
+        self.by_severity[severity] = self.by_severity.get(severity, 0) + 1
+
+        # Logs written before templates were recorded fall back to the
+        # message, which is fixed per template
+        template = record.get("template") or record.get("message") or "unknown"
+        self.templates.add(str(template))
+
+        context = record.get("context")
+        if isinstance(context, dict):
+            for key in context:
+                self.context_keys.add(str(key))
+
+        if ts is None:
+            self.untimed += 1
+            return
+
+        self.first_seen = ts if self.first_seen is None else min(self.first_seen, ts)
+        self.last_seen = ts if self.last_seen is None else max(self.last_seen, ts)
+
+        bucket_start = int(ts // self.bucket_seconds) * self.bucket_seconds
+        bucket = self.buckets.setdefault(bucket_start, {})
+        bucket[(category, severity)] = bucket.get((category, severity), 0) + 1
+
+        if severity in FAILURE_SEVERITIES:
+            self.failures += 1
+            self.first_failure = ts if self.first_failure is None else min(self.first_failure, ts)
+            self.last_failure = ts if self.last_failure is None else max(self.last_failure, ts)
+
+    def mtbf_seconds(self) -> Optional[float]:
+        """Mean time between failures across the analysed window"""
+        if self.failures < 2:
+            return None
+        return (self.last_failure - self.first_failure) / (self.failures - 1)
+
+    def bucket_rows(self) -> List[Dict]:
+        """Time-bucketed counts, one row per bucket/category/severity"""
+        rows = []
+        for bucket_start in sorted(self.buckets):
+            counts = self.buckets[bucket_start]
+            for (category, severity), count in sorted(counts.items()):
+                rows.append({
+                    "bucket_start": format_epoch(bucket_start),
+                    "category": category,
+                    "severity": severity,
+                    "count": count
+                })
+        return rows
+
+    def report(self) -> Dict:
+        """Build the full analytics report"""
+        mtbf = self.mtbf_seconds()
+        return {
+            "generated_at": datetime.now().isoformat(),
+            "bucket_seconds": self.bucket_seconds,
+            "summary": {
+                "total_errors": self.total,
+                "untimed_errors": self.untimed,
+                "failures": self.failures,
+                "first_seen": format_epoch(self.first_seen) if self.first_seen is not None else None,
+                "last_seen": format_epoch(self.last_seen) if self.last_seen is not None else None,
+                "mtbf_seconds": round(mtbf, 3) if mtbf is not None else None
+            },
+            "by_category": dict(sorted(self.by_category.items(), key=lambda kv: -kv[1])),
+            "by_severity": dict(sorted(self.by_severity.items(), key=lambda kv: -kv[1])),
+            "top_templates": [
+                {"template": key, "count": count, "error": error}
+                for key, count, error in self.templates.top(self.top_n)
+            ],
+            "top_context_keys": [
+                {"key": key, "count": count, "error": error}
+                for key, count, error in self.context_keys.top(self.top_n)
+            ],
+            "buckets": self.bucket_rows()
+        }
+
+    def write_json(self, out: TextIO, extra: Optional[Dict] = None):
+        """Write the report as JSON"""
+        data = self.report()
+        if extra:
+            data.update(extra)
+        json.dump(data, out, indent=2)
+        out.write("\n")
+
+    def write_csv(self, out: TextIO, section: str = "buckets"):
+        """Write one report section as CSV"""
+        writer = csv.writer(out)
+        if section == "buckets":
+            writer.writerow(["bucket_start", "category", "severity", "count"])
+            for row in self.bucket_rows():
+                writer.writerow([row["bucket_start"], row["category"], row["severity"], row["count"]])
+        elif section == "templates":
+            writer.writerow(["template", "count", "error"])
+            writer.writerows(self.templates.top(self.top_n))
+        elif section == "context_keys":
+            writer.writerow(["key", "count", "error"])
+            writer.writerows(self.context_keys.top(self.top_n))
+        elif section == "categories":
+            writer.writerow(["category", "count"])
+            writer.writerows(sorted(self.by_category.items(), key=lambda kv: -kv[1]))
+        elif section == "severities":
+            writer.writerow(["severity", "count"])
+            writer.writerows(sorted(self.by_severity.items(), key=lambda kv: -kv[1]))
+        else:
+            raise ValueError(f"Unknown CSV section: {section}")
+
+
+@instrumented("error-analytics")
+def main():
+    """Main entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Analyse BMAD Enhanced error logs (rotated and gzip-compressed logs included)"
+    )
+    parser.add_argument(
+        "logs",
+        nargs="*",
+        default=[DEFAULT_LOG],
+        help=f"Error log files; rotated siblings are picked up automatically (default: {DEFAULT_LOG})"
+    )
+    parser.add_argument(
+        "--no-rotated",
+        action="store_true",
+        help="Only read the named files, not their rotated archives"
+    )
+    parser.add_argument(
+        "--bucket",
+        choices=sorted(BUCKET_SIZES, key=BUCKET_SIZES.get),
+        default="hour",
+        help="Time bucket size (default: hour)"
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Number of templates and context keys to report (default: 10)"
+    )
+    parser.add_argument("--since", help="Only include errors at or after this ISO timestamp")
+    parser.add_argument("--until", help="Only include errors before this ISO timestamp")
+    parser.add_argument(
+        "--format",
+        choices=["json", "csv"],
+        default="json",
+        help="Output format (default: json)"
+    )
+    parser.add_argument(
+        "--section",
+        choices=CSV_SECTIONS,
+        default="buckets",
+        help="Report section to write in CSV mode (default: buckets)"
+    )
+    parser.add_argument(
+        "--output",
+        metavar="FILE",
+        help="Write the report to FILE instead of stdout"
+    )
+
+    args = parser.parse_args()
+
+    since = parse_timestamp(args.since) if args.since else None
+    until = parse_timestamp(args.until) if args.until else None
+    if (args.since and since is None) or (args.until and until is None):
+        print("❌ --since/--until must be ISO 8601 timestamps", file=sys.stderr)
+        return 2
+
+    paths = []
+    for log in args.logs:
+        found = [log] if args.no_rotated else rotated_logs(log)
+        if not found:
+            print(f"⚠️  Log not found: {log}", file=sys.stderr)
+        paths.extend(found)
+
+    reader = JSONRecordReader(paths)
+    analytics = ErrorAnalytics(
+        bucket_seconds=BUCKET_SIZES[args.bucket],
+        top_n=args.top,
+        since=since,
+        until=until
+    )
+    with phase("parsing"):
+        analytics.consume(reader)
+
+    if reader.malformed:
+        print(f"⚠️  Skipped {reader.malformed} malformed records", file=sys.stderr)
+
+    out = open(args.output, 'w', newline='') if args.output else sys.stdout
+    try:
+        with phase("export"):
+            if args.format == "csv":
+                analytics.write_csv(out, args.section)
+            else:
+                analytics.write_json(out, extra={
+                    "sources": [str(p) for p in paths],
+                    "malformed_records": reader.malformed
+                })
+    finally:
+        if args.output:
+            out.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
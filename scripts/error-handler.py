@@ -6,9 +6,16 @@ Provides helpful, actionable error messages with remediation guidance.
 
 import sys
 import json
+import time
+import atexit
+import threading
 from enum import Enum
 from typing import List, Optional, Dict
-from datetime import datetime
+from datetime import datetime, timedelta
+
+from bmadlib import metrics
+from bmadlib.output import Colors
+from bmadlib.profiling import instrumented
 
 
 class ErrorCategory(Enum):
@@ -33,18 +40,7 @@ class ErrorSeverity(Enum):
     INFO = "info"          # Informational only
 
 
-class Colors:
-    """ANSI color codes"""
-    HEADER = '\033[95m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
-    UNDERLINE = '\033[4m'
-    DIM = '\033[2m'
+ERRORS_TOTAL = metrics.counter("bmad_errors_total", "Errors handled", ["category", "severity"])
 
 
 class BMADError:
@@ -57,7 +53,8 @@ class BMADError:
                  context: Optional[Dict] = None,
                  remediation_steps: Optional[List[str]] = None,
                  documentation_links: Optional[List[str]] = None,
-                 related_errors: Optional[List[str]] = None):
+                 related_errors: Optional[List[str]] = None,
+                 template: Optional[str] = None):
         self.category = category
         self.severity = severity
         self.message = message
@@ -65,6 +62,7 @@ class BMADError:
         self.remediation_steps = remediation_steps or []
         self.documentation_links = documentation_links or []
         self.related_errors = related_errors or []
+        self.template = template
         self.timestamp = datetime.now().isoformat()
 
     def format(self) -> str:
@@ -148,6 +146,7 @@ class BMADError:
             "remediation_steps": self.remediation_steps,
             "documentation_links": self.documentation_links,
             "related_errors": self.related_errors,
+            "template": self.template,
             "timestamp": self.timestamp
         }
 
@@ -315,11 +314,232 @@ ERROR_TEMPLATES = {
 }
 
 
+class SQLiteErrorSink:
+    """Queryable SQLite store for error records
+
+    Records are buffered and written in batched transactions on a WAL-mode
+    database, so logging stays cheap while readers can query concurrently.
+    Buffered records are flushed when the batch fills, by a background
+    timer ``flush_interval`` seconds after the first record of a batch
+    (so a process that goes quiet still writes its last errors), on
+    ``flush()``, on ``close()`` and at interpreter exit.
+    """
+
+    SCHEMA = [
+        """CREATE TABLE IF NOT EXISTS errors (
+            id INTEGER PRIMARY KEY,
+            ts REAL NOT NULL,
+            timestamp TEXT NOT NULL,
+            category TEXT NOT NULL,
+            severity TEXT NOT NULL,
+            template TEXT,
+            message TEXT NOT NULL,
+            context TEXT,
+            record TEXT NOT NULL
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_errors_ts ON errors (ts)",
+        "CREATE INDEX IF NOT EXISTS idx_errors_category ON errors (category, ts)",
+        "CREATE INDEX IF NOT EXISTS idx_errors_severity ON errors (severity, ts)",
+        "CREATE INDEX IF NOT EXISTS idx_errors_template ON errors (template, ts)",
+    ]
+
+    GROUP_COLUMNS = ("category", "severity", "template")
+
+    def __init__(self,
+                 db_path: str = ".claude/logs/errors.db",
+                 batch_size: int = 50,
+                 flush_interval: float = 2.0):
+        import sqlite3
+        from pathlib import Path
+
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending: List[tuple] = []
+        self._oldest_pending: Optional[float] = None
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        # auto_vacuum must be chosen before the first table is created
+        self._conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute("PRAGMA busy_timeout = 5000")
+        for statement in self.SCHEMA:
+            self._conn.execute(statement)
+
+        atexit.register(self.close)
+
+    def write(self, error: BMADError):
+        """Buffer an error, flushing if the batch is full or stale"""
+        record = error.to_dict()
+        try:
+            ts = datetime.fromisoformat(error.timestamp).timestamp()
+        except ValueError:
+            ts = time.time()
+        row = (
+            ts,
+            error.timestamp,
+            record["category"],
+            record["severity"],
+            record["template"],
+            record["message"],
+            json.dumps(record["context"], default=str),
+            json.dumps(record, default=str)
+        )
+
+        with self._lock:
+            self._pending.append(row)
+            now = time.monotonic()
+            if self._oldest_pending is None:
+                self._oldest_pending = now
+                self._start_timer()
+            due = (len(self._pending) >= self.batch_size or
+                   now - self._oldest_pending >= self.flush_interval)
+        if due:
+            self.flush()
+
+    def _start_timer(self):
+        """Flush the batch that just started once it is flush_interval old"""
+        if self.flush_interval <= 0 or (self._timer is not None and self._timer.is_alive()):
+            return
+        self._timer = threading.Timer(self.flush_interval, self._timed_flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _timed_flush(self):
+        """Timer callback: a failed write stays pending for the next flush"""
+        try:
+            self.flush()
+        except Exception as e:
+            print(f"Warning: Could not write to error database: {e}", file=sys.stderr)
+
+    def flush(self):
+        """Write all buffered records in a single transaction"""
+        with self._lock:
+            if not self._pending or self._conn is None:
+                return
+            # Rows stay pending until the commit succeeds, so a busy or
+            # failed write is retried on the next flush instead of lost
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO errors (ts, timestamp, category, severity, template, "
+                    "message, context, record) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    self._pending
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                raise
+            self._pending = []
+            self._oldest_pending = None
+
+    def query(self,
+              category: Optional[str] = None,
+              severity: Optional[str] = None,
+              template: Optional[str] = None,
+              since: Optional[datetime] = None,
+              until: Optional[datetime] = None,
+              limit: int = 100) -> List[Dict]:
+        """Return the most recent matching error records"""
+        self.flush()
+        where, params = self._filters(category, severity, template, since, until)
+        rows = self._conn.execute(
+            f"SELECT record FROM errors{where} ORDER BY ts DESC LIMIT ?",
+            params + [limit]
+        ).fetchall()
+        return [json.loads(row["record"]) for row in rows]
+
+    def counts(self,
+               group_by: str = "category",
+               since: Optional[datetime] = None,
+               until: Optional[datetime] = None) -> Dict[str, int]:
+        """Count errors grouped by category, severity or template"""
+        if group_by not in self.GROUP_COLUMNS:
+            raise ValueError(f"Cannot group by {group_by!r}; use one of {', '.join(self.GROUP_COLUMNS)}")
+        self.flush()
+        where, params = self._filters(None, None, None, since, until)
+        rows = self._conn.execute(
+            f"SELECT {group_by} AS key, COUNT(*) AS n FROM errors{where} "
+            f"GROUP BY {group_by} ORDER BY n DESC",
+            params
+        ).fetchall()
+        return {row["key"] or "unknown": row["n"] for row in rows}
+
+    def apply_retention(self,
+                        max_age_days: Optional[float] = None,
+                        max_rows: Optional[int] = None) -> int:
+        """Delete records older than max_age_days or beyond the newest max_rows"""
+        self.flush()
+        deleted = 0
+        with self._lock:
+            if max_age_days is not None:
+                cutoff = (datetime.now() - timedelta(days=max_age_days)).timestamp()
+                deleted += self._conn.execute("DELETE FROM errors WHERE ts < ?", (cutoff,)).rowcount
+            if max_rows is not None:
+                deleted += self._conn.execute(
+                    "DELETE FROM errors WHERE id NOT IN "
+                    "(SELECT id FROM errors ORDER BY ts DESC LIMIT ?)",
+                    (max_rows,)
+                ).rowcount
+        return deleted
+
+    def compact(self, full: bool = False):
+        """Reclaim free pages, refresh planner statistics and truncate the WAL"""
+        self.flush()
+        with self._lock:
+            if full:
+                self._conn.execute("VACUUM")
+            else:
+                # execute() would only step the pragma once, freeing one page
+                self._conn.executescript("PRAGMA incremental_vacuum;")
+            self._conn.execute("PRAGMA optimize")
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self):
+        """Flush pending records and close the database"""
+        if self._conn is None:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        self.flush()
+        with self._lock:
+            self._conn.close()
+            self._conn = None
+        atexit.unregister(self.close)
+
+    def _filters(self, category, severity, template, since, until):
+        """Build a WHERE clause for the indexed columns"""
+        clauses = []
+        params: List = []
+        for column, value in (("category", category), ("severity", severity), ("template", template)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(since.timestamp())
+        if until is not None:
+            clauses.append("ts < ?")
+            params.append(until.timestamp())
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+
 class ErrorHandler:
     """Main error handler for BMAD operations"""
 
-    def __init__(self, log_file: Optional[str] = None):
+    def __init__(self,
+                 log_file: Optional[str] = None,
+                 db_path: Optional[str] = None):
         self.log_file = log_file
+        self.sink = SQLiteErrorSink(db_path) if db_path else None
 
     def create_error(self,
                      template_name: str,
@@ -347,13 +567,16 @@ class ErrorHandler:
             context=context or {},
             remediation_steps=remediation,
             documentation_links=template.get("documentation_links", []),
-            related_errors=template.get("related_errors", [])
+            related_errors=template.get("related_errors", []),
+            template=template_name
         )
 
         return error
 
     def handle_error(self, error: BMADError, exit_on_error: bool = False):
         """Handle and display error"""
+        ERRORS_TOTAL.inc(category=error.category.value, severity=error.severity.value)
+
         # Print formatted error
         print(error.format(), file=sys.stderr)
 
@@ -365,10 +588,23 @@ class ErrorHandler:
             except Exception as e:
                 print(f"Warning: Could not write to error log: {e}", file=sys.stderr)
 
+        # Store in the error database if configured
+        if self.sink:
+            try:
+                self.sink.write(error)
+            except Exception as e:
+                print(f"Warning: Could not write to error database: {e}", file=sys.stderr)
+
         # Exit if critical or requested
         if exit_on_error or error.severity == ErrorSeverity.CRITICAL:
+            self.close()
             sys.exit(1)
 
+    def close(self):
+        """Flush and close the error database, if any"""
+        if self.sink:
+            self.sink.close()
+
 
 def demo_errors():
     """Demo the error handling system"""
@@ -431,5 +667,82 @@ def demo_errors():
     handler.handle_error(error)
 
 
+def iso_datetime(value: str) -> datetime:
+    """argparse type for ISO 8601 timestamps"""
+    import argparse
+
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not an ISO 8601 timestamp: {value!r}")
+
+
+@instrumented("error-handler")
+def main():
+    """Main entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="BMAD Enhanced error handler (runs the demo when no command is given)"
+    )
+    parser.add_argument(
+        "--db",
+        default=".claude/logs/errors.db",
+        help="Error database (default: .claude/logs/errors.db)"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    query_parser = subparsers.add_parser("query", help="Show recent errors from the database")
+    query_parser.add_argument("--category", choices=[c.value for c in ErrorCategory])
+    query_parser.add_argument("--severity", choices=[s.value for s in ErrorSeverity])
+    query_parser.add_argument("--template", choices=sorted(ERROR_TEMPLATES))
+    query_parser.add_argument("--since", type=iso_datetime, help="ISO timestamp lower bound")
+    query_parser.add_argument("--until", type=iso_datetime, help="ISO timestamp upper bound")
+    query_parser.add_argument("--limit", type=int, default=20, help="Maximum records (default: 20)")
+
+    stats_parser = subparsers.add_parser("stats", help="Count errors by category, severity or template")
+    stats_parser.add_argument("--by", choices=SQLiteErrorSink.GROUP_COLUMNS, default="category")
+    stats_parser.add_argument("--since", type=iso_datetime, help="ISO timestamp lower bound")
+
+    retain_parser = subparsers.add_parser("retain", help="Delete old errors and compact the database")
+    retain_parser.add_argument("--max-age-days", type=float, help="Delete errors older than this")
+    retain_parser.add_argument("--max-rows", type=int, help="Keep only the newest N errors")
+    retain_parser.add_argument("--full-vacuum", action="store_true", help="Rebuild the database file")
+
+    args = parser.parse_args()
+
+    if not args.command:
+        demo_errors()
+        return 0
+
+    sink = SQLiteErrorSink(args.db)
+    try:
+        if args.command == "query":
+            errors = sink.query(
+                category=args.category,
+                severity=args.severity,
+                template=args.template,
+                since=args.since,
+                until=args.until,
+                limit=args.limit
+            )
+            for record in errors:
+                print(json.dumps(record))
+        elif args.command == "stats":
+            counts = sink.counts(
+                group_by=args.by,
+                since=args.since
+            )
+            for key, count in counts.items():
+                print(f"{key:<25} {count:>8}")
+        elif args.command == "retain":
+            deleted = sink.apply_retention(max_age_days=args.max_age_days, max_rows=args.max_rows)
+            sink.compact(full=args.full_vacuum)
+            print(f"Deleted {deleted} errors and compacted {args.db}")
+    finally:
+        sink.close()
+    return 0
+
+
 if __name__ == "__main__":
-    demo_errors()
+    sys.exit(main())
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+BMAD Enhanced - Health Check
+
+Validates that the system is properly configured and skills are loaded.
+Checks are declared with @check, run concurrently on worker threads with
+per-check timeouts, and share a single walk of the skills and docs trees.
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import shutil
+import platform
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, TextIO, Tuple
+
+from bmadlib.loader import load_script
+from bmadlib.output import Colors, colors_for
+from bmadlib.profiling import instrumented, phase
+
+
+SKILLS_DIR = Path(".claude/skills")
+DOCS_DIR = Path("docs")
+CATEGORIES = ["planning", "development", "quality", "architecture", "brownfield", "implementation"]
+EXPECTED_SKILLS = 30
+EXPECTED_DOCS = 35
+DEFAULT_TIMEOUT = 5.0
+
+
+# Outcome of a check line: "pass", "warn", "fail", "info" for plain detail, or
+# "item" for a passing entry in a list (counted as a pass)
+Line = Tuple[str, str]
+
+
+@dataclass
+class Check:
+    """A declared health check"""
+    number: int
+    title: str
+    func: Callable[["ProjectScan"], List[Line]]
+    timeout: float = DEFAULT_TIMEOUT
+
+
+@dataclass
+class CheckResult:
+    """Lines reported by one check, with its timing"""
+    number: int
+    title: str
+    lines: List[Line] = field(default_factory=list)
+    duration_ms: float = 0.0
+    timed_out: bool = False
+
+    @property
+    def status(self) -> str:
+        """Worst status among the check's lines"""
+        statuses = {status for status, _ in self.lines}
+        for status in ("fail", "warn", "pass"):
+            if status in statuses:
+                return status
+        return "pass" if "item" in statuses else "info"
+
+
+CHECKS: List[Check] = []
+
+
+def check(title: str, timeout: float = DEFAULT_TIMEOUT):
+    """Register a check; checks are numbered and reported in declaration order"""
+    def decorator(func):
+        # Number 1 is the project-root gate in main()
+        CHECKS.append(Check(len(CHECKS) + 2, title, func, timeout))
+        return func
+    return decorator
+
+
+class ProjectScan:
+    """One shared walk of the skills and docs trees
+
+    The first check to need file listings performs the walk; concurrent
+    callers wait for it instead of walking again.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._lock = threading.Lock()
+        self._done = False
+        self.skill_files: List[Path] = []
+        self.doc_files: List[Path] = []
+        self.walk_ms = 0.0
+
+    def ensure(self) -> "ProjectScan":
+        """Walk the trees once"""
+        with self._lock:
+            if not self._done:
+                start = time.perf_counter()
+                self.skill_files = [Path(d) / "SKILL.md" for d, _, files in os.walk(self.root / SKILLS_DIR)
+                                    if "SKILL.md" in files]
+                self.doc_files = [Path(d) / f for d, _, files in os.walk(self.root / DOCS_DIR)
+                                  for f in files if f.endswith(".md")]
+                self.walk_ms = (time.perf_counter() - start) * 1000
+                self._done = True
+        return self
+
+    def skills_in(self, category: str) -> List[Path]:
+        """Skill files under one category directory"""
+        base = self.root / SKILLS_DIR / category
+        return [p for p in self.ensure().skill_files if base in p.parents]
+
+
+@check("Checking skills directory...")
+def check_skills_dir(scan: ProjectScan) -> List[Line]:
+    ok = (scan.root / SKILLS_DIR).is_dir()
+    return [("pass" if ok else "fail", "Skills directory exists")]
+
+
+@check("Counting skills...")
+def check_skill_count(scan: ProjectScan) -> List[Line]:
+    count = len(scan.ensure().skill_files)
+    lines = [("info", f"Found: {count} skills")]
+    if count == 0:
+        lines.append(("fail", "No skills found!"))
+    elif count < EXPECTED_SKILLS:
+        lines.append(("warn", f"Expected ~32 skills, found {count}"))
+    else:
+        lines.append(("pass", f"Skill count reasonable ({count} skills)"))
+    return lines
+
+
+@check("Checking skills by category...")
+def check_categories(scan: ProjectScan) -> List[Line]:
+    lines = []
+    for category in CATEGORIES:
+        count = len(scan.skills_in(category))
+        if count:
+            lines.append(("item", f"{category}: {count} skills"))
+        else:
+            lines.append(("warn", f"{category}: {count} skills (empty category)"))
+    return lines
+
+
+@check("Checking Python environment...")
+def check_python(scan: ProjectScan) -> List[Line]:
+    return [("info", f"Python {platform.python_version()}"), ("pass", "Python 3 available")]
+
+
+@check("Checking Python packages...")
+def check_packages(scan: ProjectScan) -> List[Line]:
+    try:
+        import yaml  # noqa: F401
+    except ImportError:
+        return [("fail", "PyYAML not installed"), ("info", "Install: pip install pyyaml")]
+    return [("pass", "PyYAML installed")]
+
+
+@check("Validating skills...", timeout=10.0)
+def check_skill_validity(scan: ProjectScan) -> List[Line]:
+    try:
+        monitor = load_script("monitor-skills.py").SkillMonitor(str(scan.root / SKILLS_DIR))
+    except ImportError as e:
+        return [("warn", f"Skill validation skipped ({e})")]
+    skill_files = scan.ensure().skill_files
+    invalid = [info for info in map(monitor.analyze_skill, sorted(skill_files)) if not info.valid]
+    if skill_files and not invalid:
+        return [("pass", "All skills valid")]
+    lines = [("warn", "Some skills may be invalid (run: python3 scripts/monitor-skills.py for details)")]
+    lines += [("info", f"{info.category}/{info.name}: {info.errors[0]}") for info in invalid[:5]]
+    return lines
+
+
+@check("Checking configuration...")
+def check_config(scan: ProjectScan) -> List[Line]:
+    if (scan.root / ".claude/config.yaml").is_file():
+        return [("pass", "Config file exists")]
+    return [("warn", "Config file not found (.claude/config.yaml)"),
+            ("info", "You may need to copy from config.yaml.template")]
+
+
+@check("Checking documentation...")
+def check_docs(scan: ProjectScan) -> List[Line]:
+    count = sum(1 for p in scan.ensure().doc_files if "archive" not in p.as_posix())
+    lines = [("info", f"Found: {count} documentation files")]
+    if count >= EXPECTED_DOCS:
+        lines.append(("pass", "Documentation present"))
+    else:
+        lines.append(("warn", f"Expected ~40 docs, found {count}"))
+    return lines
+
+
+@check("Checking disk space...")
+def check_disk(scan: ProjectScan) -> List[Line]:
+    usage = shutil.disk_usage(scan.root / ".claude")
+    # Same figure as df's Use%: used / (used + available), rounded up
+    percent = math.ceil(usage.used * 100 / ((usage.used + usage.free) or 1))
+    lines = [("info", f"Disk usage: {percent}%")]
+    if percent < 90:
+        lines.append(("pass", "Sufficient disk space"))
+    else:
+        lines.append(("warn", f"Disk usage high: {percent}%"))
+    return lines
+
+
+def _run_check(item: Check, scan: ProjectScan) -> CheckResult:
+    """Run one check, turning exceptions into a failure line"""
+    start = time.perf_counter()
+    try:
+        lines = item.func(scan)
+    except Exception as e:
+        lines = [("fail", f"Check raised {type(e).__name__}: {e}")]
+    return CheckResult(item.number, item.title, lines, (time.perf_counter() - start) * 1000)
+
+
+def run_checks(root: Path, checks: Optional[List[Check]] = None,
+               jobs: Optional[int] = None, timeout_scale: float = 1.0) -> List[CheckResult]:
+    """Run checks concurrently; results are returned in declaration order
+
+    Each check runs on its own daemon thread (at most ``jobs`` at a time)
+    and gets its own timeout, measured from the start of the run. A check
+    that times out is reported as failed and its thread is abandoned, so a
+    hung filesystem call can't hold up the report or the exit.
+    """
+    checks = checks if checks is not None else CHECKS
+    scan = ProjectScan(root)
+    slots = threading.BoundedSemaphore(jobs or len(checks) or 1)
+    outcomes: Dict[int, CheckResult] = {}
+
+    def worker(item: Check):
+        with slots:
+            outcomes[item.number] = _run_check(item, scan)
+
+    start = time.monotonic()
+    threads = []
+    for item in checks:
+        thread = threading.Thread(target=worker, args=(item,), name=f"bmad-health-{item.number}", daemon=True)
+        thread.start()
+        threads.append((item, thread))
+
+    results = []
+    for item, thread in threads:
+        timeout = item.timeout * timeout_scale
+        thread.join(max(0.0, timeout - (time.monotonic() - start)))
+        result = outcomes.get(item.number)
+        if result is None:
+            result = CheckResult(item.number, item.title, [("fail", f"Timed out after {timeout:.1f}s")],
+                                 timeout * 1000, timed_out=True)
+        results.append(result)
+    return results
+
+
+def print_results(results: List[CheckResult], colors=Colors, out: TextIO = sys.stdout):
+    """Print check results in the health-check.sh format"""
+    icons = {"pass": f"{colors.GREEN}✅", "warn": f"{colors.YELLOW}⚠️ ", "fail": f"{colors.RED}❌"}
+    for result in results:
+        print(f"\n{result.number}. {result.title}", file=out)
+        for status, message in result.lines:
+            if status == "info":
+                print(f"   {message}", file=out)
+            elif status == "item":
+                print(f"   {colors.GREEN}✅{colors.ENDC} {message}", file=out)
+            else:
+                print(f"{icons[status]} {message}{colors.ENDC}", file=out)
+
+
+def summarize(results: List[CheckResult]) -> Dict[str, int]:
+    """Count failed, warning and passed lines"""
+    counts = {"errors": 0, "warnings": 0, "passed": 0}
+    key = {"fail": "errors", "warn": "warnings", "pass": "passed", "item": "passed"}
+    for result in results:
+        for status, _ in result.lines:
+            if status in key:
+                counts[key[status]] += 1
+    return counts
+
+
+def write_json(path: str, results: List[CheckResult], counts: Dict[str, int], duration_ms: float):
+    """Write a JSON report with per-check status and timings"""
+    data = {
+        "timestamp": datetime.now().isoformat(),
+        "duration_ms": round(duration_ms, 2),
+        "summary": counts,
+        "checks": [
+            {
+                "number": r.number,
+                "title": r.title,
+                "status": r.status,
+                "duration_ms": round(r.duration_ms, 2),
+                "timed_out": r.timed_out,
+                "lines": [{"status": status, "message": message} for status, message in r.lines]
+            }
+            for r in results
+        ]
+    }
+    out = sys.stdout if path == "-" else open(path, 'w')
+    try:
+        json.dump(data, out, indent=2)
+        out.write("\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+@instrumented("health-check")
+def main():
+    """Main entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="BMAD Enhanced health check")
+    parser.add_argument("--json", metavar="FILE", help="Write a JSON report with per-check timings ('-' for stdout)")
+    parser.add_argument("--jobs", type=int, help="Worker threads (default: one per check)")
+    parser.add_argument("--timeout-scale", type=float, default=1.0,
+                        help="Multiply every check's timeout, e.g. 3 on slow CI machines")
+    parser.add_argument("--quiet", action="store_true", help="Only print the summary")
+    args = parser.parse_args()
+
+    colors = colors_for(sys.stdout)
+    to_stdout = args.json == "-"
+    out = sys.stderr if to_stdout else sys.stdout
+
+    def say(*lines):
+        for line in lines:
+            print(line, file=out)
+
+    start = time.perf_counter()
+    root = Path.cwd()
+    say("🏥 BMAD Enhanced Health Check", "==============================", "", "1. Checking project structure...")
+
+    # Everything else assumes the project root, so this check gates the rest
+    if not (root / ".claude").is_dir():
+        say(f"{colors.RED}❌ CRITICAL: Not in project root (no .claude/ directory){colors.ENDC}",
+            "   Run this script from the BMAD Enhanced root directory")
+        return 1
+    say(f"{colors.GREEN}✅ Project root directory{colors.ENDC}")
+
+    with phase("checks"):
+        results = run_checks(root, jobs=args.jobs, timeout_scale=args.timeout_scale)
+    duration_ms = (time.perf_counter() - start) * 1000
+    counts = summarize(results)
+    counts["passed"] += 1
+
+    if not args.quiet:
+        with phase("rendering"):
+            print_results(results, colors, out)
+
+    errors, warnings = counts["errors"], counts["warnings"]
+    say("", "==============================", "📊 Health Check Summary", "==============================")
+    if errors == 0 and warnings == 0:
+        say(f"{colors.GREEN}✅ All checks passed!{colors.ENDC}", "", "System is healthy and ready to use.")
+    elif errors == 0:
+        say(f"{colors.YELLOW}⚠️  {warnings} warnings found{colors.ENDC}", "",
+            "System is functional but some warnings need attention.")
+    else:
+        say(f"{colors.RED}❌ {errors} errors found{colors.ENDC}")
+        if warnings:
+            say(f"{colors.YELLOW}⚠️  {warnings} warnings found{colors.ENDC}")
+        say("", "System has issues that need to be fixed.")
+    say(f"\nCompleted {len(results) + 1} checks in {duration_ms:.0f}ms")
+
+    if args.json:
+        with phase("export"):
+            write_json(args.json, results, counts, duration_ms)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
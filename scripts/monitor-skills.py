@@ -9,13 +9,26 @@ Provides visibility into skill loading status, errors, and diagnostics.
 import os
 import sys
 import json
-import yaml
+import time
+import heapq
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 import re
 
+from bmadlib import metrics
+from bmadlib.cache import Cache, get_cache
+from bmadlib.output import Report, limited
+from bmadlib.profiling import instrumented, phase
+
+# Bump when the analysis changes so cached results from older runs miss
+ANALYSIS_VERSION = 1
+
+SKILLS_GAUGE = metrics.gauge("bmad_skills", "Skills found by the last scan", ["category", "status"])
+SCAN_DURATION = metrics.histogram("bmad_skill_scan_duration_seconds", "Time to discover and validate all skills")
+LAST_SCAN = metrics.gauge("bmad_skill_last_scan_timestamp_seconds", "When the last skill scan finished")
+
 
 @dataclass
 class SkillInfo:
@@ -35,10 +48,11 @@ class SkillInfo:
 class SkillMonitor:
     """Monitor skill loading and validation"""
 
-    def __init__(self, skills_dir: str = ".claude/skills"):
+    def __init__(self, skills_dir: str = ".claude/skills", cache: Optional[Cache] = None):
         self.skills_dir = Path(skills_dir)
         self.skills: List[SkillInfo] = []
         self.categories: Dict[str, List[str]] = {}
+        self.cache = cache if cache is not None else get_cache("skills")
 
     def discover_skills(self) -> int:
         """Discover all skills in the skills directory"""
@@ -48,22 +62,62 @@ class SkillMonitor:
             print(f"❌ Skills directory not found: {self.skills_dir}")
             return 0
 
-        skill_files = list(self.skills_dir.rglob("SKILL.md"))
+        start = time.perf_counter()
+        with phase("discovery"):
+            skill_files = sorted(self.skills_dir.rglob("SKILL.md"))
         print(f"📁 Found {len(skill_files)} skill definition files\n")
 
-        for skill_file in sorted(skill_files):
-            skill_info = self._analyze_skill(skill_file)
-            self.skills.append(skill_info)
+        with phase("parsing"):
+            for skill_file in skill_files:
+                skill_info = self._analyze_skill(skill_file)
+                self.skills.append(skill_info)
 
-            # Organize by category
-            if skill_info.category not in self.categories:
-                self.categories[skill_info.category] = []
-            self.categories[skill_info.category].append(skill_info.name)
+                # Organize by category
+                if skill_info.category not in self.categories:
+                    self.categories[skill_info.category] = []
+                self.categories[skill_info.category].append(skill_info.name)
 
+        self._record_metrics(time.perf_counter() - start)
         return len(self.skills)
 
+    def _record_metrics(self, seconds: float):
+        """Publish this scan's results to the metrics registry"""
+        counts: Dict[Tuple[str, str], int] = {}
+        for skill in self.skills:
+            key = (skill.category, "valid" if skill.valid else "invalid")
+            counts[key] = counts.get(key, 0) + 1
+        for category in self.categories:
+            for status in ("valid", "invalid"):
+                counts.setdefault((category, status), 0)
+        SKILLS_GAUGE.replace(counts)
+        SCAN_DURATION.observe(seconds)
+        LAST_SCAN.set(time.time())
+
+    def analyze_skill(self, skill_file: Path) -> SkillInfo:
+        """Analyze one skill file without adding it to the discovered skills"""
+        return self._analyze_skill(skill_file)
+
     def _analyze_skill(self, skill_file: Path) -> SkillInfo:
-        """Analyze a single skill file"""
+        """Analyze a single skill file, reusing the cached result for unchanged content"""
+        try:
+            content = skill_file.read_bytes()
+        except OSError:
+            return self._analyze_uncached(skill_file)
+
+        # Paths in the result are relative to the working directory
+        key = Cache.key("skill", ANALYSIS_VERSION, os.path.abspath(skill_file), str(Path.cwd()), content)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return SkillInfo(**cached)
+        info = self._analyze_uncached(skill_file)
+        self.cache.put(key, asdict(info))
+        return info
+
+    def _analyze_uncached(self, skill_file: Path) -> SkillInfo:
+        """Read and validate a single skill file"""
+        # Imported here so runs served from the cache skip loading PyYAML
+        import yaml
+
         # Extract category and name from path
         # Expected: .claude/skills/category/skill-name/SKILL.md
         parts = skill_file.parts
@@ -136,77 +190,78 @@ class SkillMonitor:
             errors=errors
         )
 
-    def print_summary(self):
+    def print_summary(self, out: Optional[Report] = None):
         """Print summary of skill loading status"""
         total = len(self.skills)
         valid = sum(1 for s in self.skills if s.valid)
         invalid = total - valid
         with_frontmatter = sum(1 for s in self.skills if s.has_frontmatter)
 
-        print("=" * 70)
-        print("📊 SKILL LOADING SUMMARY")
-        print("=" * 70)
-        print()
-        print(f"Total Skills Discovered:  {total}")
-        print(f"Valid Skills:             {valid} ✅")
-        print(f"Invalid Skills:           {invalid} {'❌' if invalid > 0 else '✅'}")
-        print(f"With YAML Frontmatter:    {with_frontmatter}")
-        print(f"Categories:               {len(self.categories)}")
-        print()
-
-        if invalid > 0:
-            print(f"⚠️  {invalid} skills have issues that need attention")
-        else:
-            print("✅ All skills are valid and properly formatted!")
-        print()
-
-    def print_by_category(self):
-        """Print skills organized by category"""
-        print("=" * 70)
-        print("📁 SKILLS BY CATEGORY")
-        print("=" * 70)
-        print()
-
-        for category in sorted(self.categories.keys()):
-            skills = self.categories[category]
-            print(f"📂 {category.upper()} ({len(skills)} skills)")
-
-            # Get skill details for this category
-            category_skills = [s for s in self.skills if s.category == category]
-
-            for skill in sorted(category_skills, key=lambda s: s.name):
-                status = "✅" if skill.valid else "❌"
-                size_kb = skill.size_bytes / 1024
-                print(f"  {status} {skill.name:<30} ({skill.line_count:>4} lines, {size_kb:>6.1f} KB)")
-
-                if not skill.valid:
-                    for error in skill.errors:
-                        print(f"      ⚠️  {error}")
-
-            print()
-
-    def print_invalid_skills(self):
-        """Print details of invalid skills"""
+        with out or Report() as report:
+            report.lines_from([
+                "=" * 70,
+                "📊 SKILL LOADING SUMMARY",
+                "=" * 70,
+                "",
+                f"Total Skills Discovered:  {total}",
+                f"Valid Skills:             {valid} ✅",
+                f"Invalid Skills:           {invalid} {'❌' if invalid > 0 else '✅'}",
+                f"With YAML Frontmatter:    {with_frontmatter}",
+                f"Categories:               {len(self.categories)}",
+                "",
+                f"⚠️  {invalid} skills have issues that need attention" if invalid > 0
+                else "✅ All skills are valid and properly formatted!",
+                ""
+            ])
+
+    def print_by_category(self, out: Optional[Report] = None, limit: Optional[int] = None):
+        """Print skills organized by category (at most limit per category)"""
+        by_category: Dict[str, List[SkillInfo]] = {}
+        for skill in self.skills:
+            by_category.setdefault(skill.category, []).append(skill)
+
+        with out or Report() as report:
+            report.lines_from(["=" * 70, "📁 SKILLS BY CATEGORY", "=" * 70, ""])
+            line = report.line
+            for category in sorted(self.categories.keys()):
+                line(f"📂 {category.upper()} ({len(self.categories[category])} skills)")
+
+                shown, hidden = limited(sorted(by_category.get(category, []), key=lambda s: s.name), limit)
+                for skill in shown:
+                    status = "✅" if skill.valid else "❌"
+                    size_kb = skill.size_bytes / 1024
+                    line(f"  {status} {skill.name:<30} ({skill.line_count:>4} lines, {size_kb:>6.1f} KB)")
+
+                    if not skill.valid:
+                        for error in skill.errors:
+                            line(f"      ⚠️  {error}")
+                report.more(hidden, "skills")
+                line()
+
+    def print_invalid_skills(self, out: Optional[Report] = None, limit: Optional[int] = None):
+        """Print details of invalid skills (at most limit)"""
         invalid = [s for s in self.skills if not s.valid]
 
         if not invalid:
             return
 
-        print("=" * 70)
-        print("❌ INVALID SKILLS - DETAILS")
-        print("=" * 70)
-        print()
-
-        for skill in invalid:
-            print(f"Skill: {skill.name}")
-            print(f"Path:  {skill.path}")
-            print(f"Category: {skill.category}")
-            print(f"Errors:")
-            for error in skill.errors:
-                print(f"  • {error}")
-            print()
-
-    def print_statistics(self):
+        with out or Report() as report:
+            report.lines_from(["=" * 70, "❌ INVALID SKILLS - DETAILS", "=" * 70, ""])
+            shown, hidden = limited(invalid, limit)
+            for skill in shown:
+                report.lines_from([
+                    f"Skill: {skill.name}",
+                    f"Path:  {skill.path}",
+                    f"Category: {skill.category}",
+                    "Errors:"
+                ])
+                report.lines_from(f"  • {error}" for error in skill.errors)
+                report.line()
+            report.more(hidden, "invalid skills", indent="")
+            if hidden:
+                report.line()
+
+    def print_statistics(self, out: Optional[Report] = None):
         """Print detailed statistics"""
         if not self.skills:
             return
@@ -215,23 +270,23 @@ class SkillMonitor:
         total_size = sum(s.size_bytes for s in self.skills)
         avg_lines = total_lines / len(self.skills)
         avg_size = total_size / len(self.skills)
-
-        print("=" * 70)
-        print("📈 STATISTICS")
-        print("=" * 70)
-        print()
-        print(f"Total Lines:        {total_lines:,}")
-        print(f"Total Size:         {total_size / 1024:.1f} KB")
-        print(f"Average Lines:      {avg_lines:.0f} lines/skill")
-        print(f"Average Size:       {avg_size / 1024:.1f} KB/skill")
-        print()
-
-        # Largest skills
-        print("Largest Skills:")
-        largest = sorted(self.skills, key=lambda s: s.line_count, reverse=True)[:5]
-        for skill in largest:
-            print(f"  • {skill.name:<30} {skill.line_count:>4} lines")
-        print()
+        largest = heapq.nlargest(5, self.skills, key=lambda s: s.line_count)
+
+        with out or Report() as report:
+            report.lines_from([
+                "=" * 70,
+                "📈 STATISTICS",
+                "=" * 70,
+                "",
+                f"Total Lines:        {total_lines:,}",
+                f"Total Size:         {total_size / 1024:.1f} KB",
+                f"Average Lines:      {avg_lines:.0f} lines/skill",
+                f"Average Size:       {avg_size / 1024:.1f} KB/skill",
+                "",
+                "Largest Skills:"
+            ])
+            report.lines_from(f"  • {skill.name:<30} {skill.line_count:>4} lines" for skill in largest)
+            report.line()
 
     def export_json(self, output_file: str):
         """Export skill information to JSON"""
@@ -247,7 +302,7 @@ class SkillMonitor:
             "skills": [asdict(s) for s in self.skills]
         }
 
-        with open(output_file, 'w') as f:
+        with phase("export"), open(output_file, 'w') as f:
             json.dump(data, f, indent=2)
 
         print(f"📄 Exported skill information to {output_file}")
@@ -265,6 +320,7 @@ class SkillMonitor:
         return None
 
 
+@instrumented("monitor-skills")
 def main():
     """Main entry point"""
     import argparse
@@ -295,6 +351,22 @@ def main():
         "--skill",
         help="Show details for specific skill"
     )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        metavar="N",
+        help="Show at most N skills per category and N invalid skills (0: all)"
+    )
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="Only print the summary and statistics"
+    )
+    parser.add_argument(
+        "--pager",
+        action="store_true",
+        help="Page long reports through $PAGER when writing to a terminal"
+    )
 
     args = parser.parse_args()
 
@@ -353,10 +425,12 @@ def main():
             return 1
 
     # Print reports
-    monitor.print_summary()
-    monitor.print_by_category()
-    monitor.print_invalid_skills()
-    monitor.print_statistics()
+    with phase("rendering"), Report(pager=args.pager) as report:
+        monitor.print_summary(report)
+        if not args.summary:
+            monitor.print_by_category(report, args.limit)
+            monitor.print_invalid_skills(report, args.limit)
+        monitor.print_statistics(report)
 
     # Export JSON if requested
     if args.json:
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+BMAD Enhanced - Performance Report
+Streams workflow telemetry (including rotated and gzip-compressed archives)
+and reports latency percentiles, slowest commands, regressions against a
+stored baseline, and throughput per hour.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, TextIO
+
+from bmadlib.output import Colors, NoColors, use_color
+from bmadlib.profiling import instrumented, phase
+from bmadlib.sketch import QuantileSketch
+from bmadlib.streams import JSONRecordReader, format_epoch, parse_timestamp, rotated_logs
+from bmadlib.telemetry import DEFAULT_PATH as DEFAULT_TELEMETRY
+
+
+PERIOD_UNITS = {"m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def parse_period(value: str) -> Optional[float]:
+    """Parse a period like '30m', '24h', '7d' or '2w' into seconds"""
+    match = re.fullmatch(r'(\d+(?:\.\d+)?)([mhdw])', value.strip().lower())
+    if not match:
+        return None
+    return float(match.group(1)) * PERIOD_UNITS[match.group(2)]
+
+
+def format_ms(value: Optional[float]) -> str:
+    """Format a duration in milliseconds for display"""
+    if value is None:
+        return "-"
+    if value < 1000:
+        return f"{value:.0f}ms"
+    if value < 60000:
+        return f"{value / 1000:.1f}s"
+    return f"{value / 60000:.1f}m"
+
+
+class LatencyStats:
+    """Duration sketch plus outcome counts for one command or step"""
+
+    def __init__(self):
+        self.sketch = QuantileSketch()
+        self.errors = 0
+
+    def add(self, duration_ms: float, failed: bool = False):
+        """Record one run"""
+        self.sketch.add(duration_ms)
+        if failed:
+            self.errors += 1
+
+    def merge(self, other: "LatencyStats"):
+        """Fold in stats from another partial report"""
+        self.sketch.merge(other.sketch)
+        self.errors += other.errors
+
+    def summary(self) -> Dict:
+        """Count, percentiles, mean, max and error rate"""
+        sketch = self.sketch
+        data = {"count": sketch.count}
+        for q in QUANTILES:
+            value = sketch.quantile(q)
+            data[f"p{int(q * 100)}_ms"] = round(value, 3) if value is not None else None
+        data["mean_ms"] = round(sketch.mean, 3) if sketch.count else None
+        data["max_ms"] = sketch.max
+        data["error_rate"] = round(self.errors / sketch.count, 4) if sketch.count else 0.0
+        return data
+
+
+class TelemetryReport:
+    """Single-pass, bounded-memory aggregation over telemetry records
+
+    Memory grows with the number of distinct commands, steps and hours,
+    never with the number of records. Partial reports built from separate
+    files merge exactly, so large histories can be processed in parallel.
+    """
+
+    def __init__(self, since: Optional[float] = None, until: Optional[float] = None):
+        self.since = since
+        self.until = until
+        self.total = 0
+        self.errors = 0
+        self.skipped = 0
+        self.overall = LatencyStats()
+        self.commands: Dict[str, LatencyStats] = {}
+        self.steps: Dict[str, Dict[str, LatencyStats]] = {}
+        self.hourly: Dict[int, int] = {}
+        self.first_seen: Optional[float] = None
+        self.last_seen: Optional[float] = None
+
+    def add(self, record: Dict):
+        """Aggregate one workflow telemetry record"""
+        duration = record.get("duration_ms")
+        if not isinstance(duration, (int, float)):
+            self.skipped += 1
+            return
+        ts = parse_timestamp(record.get("timestamp"))
+        if ts is not None:
+            if self.since is not None and ts < self.since:
+                return
+            if self.until is not None and ts >= self.until:
+                return
+        elif self.since is not None or self.until is not None:
+            return
+
+        command = str(record.get("command") or "unknown")
+        failed = record.get("outcome") == "error"
+        self.total += 1
+        if failed:
+            self.errors += 1
+        self.overall.add(duration, failed)
+        self.commands.setdefault(command, LatencyStats()).add(duration, failed)
+
+        steps = record.get("steps")
+        if isinstance(steps, list):
+            command_steps = self.steps.setdefault(command, {})
+            for step in steps:
+                if (isinstance(step, dict) and isinstance(step.get("duration_ms"), (int, float))
+                        and step.get("outcome") != "skipped"):
+                    name = str(step.get("step") or step.get("name") or "unknown")
+                    command_steps.setdefault(name, LatencyStats()).add(step["duration_ms"],
+                                                                       step.get("outcome") == "error")
+
+        if ts is not None:
+            hour = int(ts // 3600) * 3600
+            self.hourly[hour] = self.hourly.get(hour, 0) + 1
+            self.first_seen = ts if self.first_seen is None else min(self.first_seen, ts)
+            self.last_seen = ts if self.last_seen is None else max(self.last_seen, ts)
+
+    def merge(self, other: "TelemetryReport"):
+        """Fold in a partial report built from other records"""
+        self.total += other.total
+        self.errors += other.errors
+        self.skipped += other.skipped
+        self.overall.merge(other.overall)
+        for command, stats in other.commands.items():
+            self.commands.setdefault(command, LatencyStats()).merge(stats)
+        for command, steps in other.steps.items():
+            mine = self.steps.setdefault(command, {})
+            for name, stats in steps.items():
+                mine.setdefault(name, LatencyStats()).merge(stats)
+        for hour, count in other.hourly.items():
+            self.hourly[hour] = self.hourly.get(hour, 0) + count
+        for ts in (other.first_seen, other.last_seen):
+            if ts is not None:
+                self.first_seen = ts if self.first_seen is None else min(self.first_seen, ts)
+                self.last_seen = ts if self.last_seen is None else max(self.last_seen, ts)
+
+    def step_totals(self) -> Dict[str, LatencyStats]:
+        """Step stats merged across all commands"""
+        totals: Dict[str, LatencyStats] = {}
+        for steps in self.steps.values():
+            for name, stats in steps.items():
+                totals.setdefault(name, LatencyStats()).merge(stats)
+        return totals
+
+    def slowest(self, n: int) -> List[tuple]:
+        """Commands ranked by p95 duration, slowest first"""
+        ranked = sorted(self.commands.items(), key=lambda kv: -(kv[1].sketch.quantile(0.95) or 0))
+        return ranked[:n]
+
+    def regressions(self, baseline: Dict, threshold: float, min_samples: int) -> List[Dict]:
+        """Commands and steps whose p50 or p95 grew by more than threshold"""
+        found = []
+
+        def compare(name: str, stats: LatencyStats, stored: Optional[Dict]):
+            if not stored or stats.sketch.count < min_samples:
+                return
+            before = QuantileSketch.from_dict(stored)
+            if before.count < min_samples:
+                return
+            for q in (0.5, 0.95):
+                old, new = before.quantile(q), stats.sketch.quantile(q)
+                if old and new and new / old > threshold:
+                    found.append({
+                        "name": name,
+                        "quantile": f"p{int(q * 100)}",
+                        "baseline_ms": round(old, 3),
+                        "current_ms": round(new, 3),
+                        "ratio": round(new / old, 3)
+                    })
+
+        for command, stats in self.commands.items():
+            compare(command, stats, baseline.get("commands", {}).get(command))
+            stored_steps = baseline.get("steps", {}).get(command, {})
+            for name, step_stats in self.steps.get(command, {}).items():
+                compare(f"{command} / {name}", step_stats, stored_steps.get(name))
+        found.sort(key=lambda r: -r["ratio"])
+        return found
+
+    def baseline(self) -> Dict:
+        """Serialise per-command and per-step sketches as a baseline"""
+        return {
+            "version": 1,
+            "generated_at": datetime.now().isoformat(),
+            "records": self.total,
+            "commands": {c: s.sketch.to_dict() for c, s in self.commands.items()},
+            "steps": {c: {n: s.sketch.to_dict() for n, s in steps.items()}
+                      for c, steps in self.steps.items()}
+        }
+
+    def report(self, top_n: int = 10, regressions: Optional[List[Dict]] = None) -> Dict:
+        """Build the full report"""
+        data = {
+            "generated_at": datetime.now().isoformat(),
+            "summary": dict(self.overall.summary(),
+                            operations=self.total,
+                            errors=self.errors,
+                            skipped_records=self.skipped,
+                            first_seen=format_epoch(self.first_seen) if self.first_seen is not None else None,
+                            last_seen=format_epoch(self.last_seen) if self.last_seen is not None else None),
+            "slowest_commands": [dict(stats.summary(), command=command)
+                                 for command, stats in self.slowest(top_n)],
+            "commands": {command: dict(stats.summary(),
+                                       steps={n: s.summary() for n, s in self.steps.get(command, {}).items()})
+                         for command, stats in sorted(self.commands.items())},
+            "steps": {name: stats.summary() for name, stats in sorted(self.step_totals().items())},
+            "throughput_per_hour": [{"hour": format_epoch(hour), "operations": count}
+                                    for hour, count in sorted(self.hourly.items())]
+        }
+        if regressions is not None:
+            data["regressions"] = regressions
+        return data
+
+
+def _build_partial(path: str, since: Optional[float], until: Optional[float]) -> tuple:
+    """Aggregate a single file (runs in a worker process)"""
+    reader = JSONRecordReader([path])
+    partial = TelemetryReport(since, until)
+    for record in reader:
+        partial.add(record)
+    return partial, reader.malformed
+
+
+def build_report(paths: List[Path], since: Optional[float] = None, until: Optional[float] = None,
+                 jobs: int = 1) -> tuple:
+    """Aggregate telemetry files, one worker process per file when jobs > 1"""
+    report = TelemetryReport(since, until)
+    malformed = 0
+    if jobs > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(paths))) as pool:
+            futures = [pool.submit(_build_partial, str(p), since, until) for p in paths]
+            for future in futures:
+                partial, bad = future.result()
+                report.merge(partial)
+                malformed += bad
+    else:
+        reader = JSONRecordReader(paths)
+        for record in reader:
+            report.add(record)
+        malformed = reader.malformed
+    return report, malformed
+
+
+def write_text(report: TelemetryReport, out: TextIO, period_label: str, top_n: int,
+               hours: int, regressions: Optional[List[Dict]], color: bool):
+    """Write the human-readable report"""
+    c = Colors if color else NoColors
+    overall = report.overall.summary()
+    error_rate = report.errors / report.total * 100 if report.total else 0.0
+
+    width = 40
+    lines = [
+        "╔" + "═" * width + "╗",
+        "║" + "  BMAD Enhanced Performance Report".ljust(width) + "║",
+        "╠" + "═" * width + "╣",
+        "║" + f" Period: {period_label}".ljust(width) + "║",
+        "║" + f" Total Operations: {report.total}".ljust(width) + "║",
+        "║" + f" Avg Response Time: {format_ms(overall['mean_ms'])}".ljust(width) + "║",
+        "║" + f" p50 / p95 / p99: {format_ms(overall['p50_ms'])} / {format_ms(overall['p95_ms'])}"
+                f" / {format_ms(overall['p99_ms'])}".ljust(width) + "║",
+        "║" + f" Error Rate: {error_rate:.1f}%".ljust(width) + "║",
+        "╚" + "═" * width + "╝",
+    ]
+    out.write("\n".join(lines) + "\n")
+
+    def table(title: str, rows: List[tuple]):
+        out.write(f"\n{c.BOLD}{title}{c.ENDC}\n")
+        out.write(f"  {'Name':<36} {'Count':>7} {'p50':>8} {'p95':>8} {'p99':>8} {'Max':>8} {'Errors':>7}\n")
+        for name, stats in rows:
+            s = stats.summary()
+            errors = f"{s['error_rate'] * 100:.1f}%"
+            out.write(f"  {name[:36]:<36} {s['count']:>7} {format_ms(s['p50_ms']):>8} "
+                      f"{format_ms(s['p95_ms']):>8} {format_ms(s['p99_ms']):>8} "
+                      f"{format_ms(s['max_ms']):>8} {errors:>7}\n")
+
+    if report.commands:
+        table(f"Slowest Commands (by p95, top {top_n})", report.slowest(top_n))
+        steps = sorted(report.step_totals().items(), key=lambda kv: -(kv[1].sketch.quantile(0.95) or 0))
+        table("Steps (all commands)", steps)
+
+    if regressions is not None:
+        out.write(f"\n{c.BOLD}Regressions vs Baseline{c.ENDC}\n")
+        if not regressions:
+            out.write(f"  {c.GREEN}✓ No regressions{c.ENDC}\n")
+        for r in regressions:
+            out.write(f"  {c.RED}▲{c.ENDC} {r['name'][:44]:<44} {r['quantile']:>4} "
+                      f"{format_ms(r['baseline_ms']):>8} → {format_ms(r['current_ms']):>8} "
+                      f"{c.RED}(x{r['ratio']:.2f}){c.ENDC}\n")
+
+    if report.hourly:
+        recent = sorted(report.hourly.items())[-hours:]
+        peak = max(count for _, count in recent)
+        out.write(f"\n{c.BOLD}Throughput per Hour (last {len(recent)}){c.ENDC}\n")
+        for hour, count in recent:
+            bar = "█" * max(1, round(30 * count / peak))
+            label = datetime.fromtimestamp(hour).strftime("%Y-%m-%d %H:00")
+            out.write(f"  {label}  {c.BLUE}{bar}{c.ENDC} {count}\n")
+
+
+@instrumented("performance-report")
+def main():
+    """Main entry point"""
+    import argparse
+
+    default_log = os.environ.get("BMAD_TELEMETRY_FILE", DEFAULT_TELEMETRY)
+    parser = argparse.ArgumentParser(
+        description="Latency percentiles, slowest commands, regressions and throughput from BMAD telemetry"
+    )
+    parser.add_argument(
+        "logs",
+        nargs="*",
+        default=[default_log],
+        help=f"Telemetry files; rotated siblings are picked up automatically (default: {default_log})"
+    )
+    parser.add_argument("--no-rotated", action="store_true", help="Only read the named files")
+    parser.add_argument("--period", help="Only include the most recent period, e.g. 30m, 24h, 7d, 2w")
+    parser.add_argument("--since", help="Only include runs at or after this ISO timestamp")
+    parser.add_argument("--until", help="Only include runs before this ISO timestamp")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest commands to show (default: 10)")
+    parser.add_argument("--hours", type=int, default=24, help="Hours of throughput to show (default: 24)")
+    parser.add_argument("--baseline", metavar="FILE", help="Compare against a baseline saved with --save-baseline")
+    parser.add_argument("--save-baseline", metavar="FILE", help="Save this report's sketches as a baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="Flag a regression when p50 or p95 grows by more than this factor (default: 1.2)"
+    )
+    parser.add_argument(
+        "--min-samples",
+        type=int,
+        default=5,
+        help="Minimum runs on both sides before comparing (default: 5)"
+    )
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes, one file each (default: 1)")
+    parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format (default: text)")
+    parser.add_argument("--output", metavar="FILE", help="Write the report to FILE instead of stdout")
+
+    args = parser.parse_args()
+
+    since = parse_timestamp(args.since) if args.since else None
+    until = parse_timestamp(args.until) if args.until else None
+    if (args.since and since is None) or (args.until and until is None):
+        print("❌ --since/--until must be ISO 8601 timestamps", file=sys.stderr)
+        return 2
+    period_label = "All time"
+    if args.period:
+        seconds = parse_period(args.period)
+        if seconds is None:
+            print("❌ --period must look like 30m, 24h, 7d or 2w", file=sys.stderr)
+            return 2
+        since = time.time() - seconds
+        period_label = f"Last {args.period}"
+    elif since is not None or until is not None:
+        period_label = f"{args.since or '…'} → {args.until or 'now'}"
+
+    paths = []
+    for log in args.logs:
+        found = [Path(log)] if args.no_rotated else rotated_logs(log)
+        if not found:
+            print(f"⚠️  Telemetry file not found: {log}", file=sys.stderr)
+        paths.extend(found)
+
+    with phase("parsing"):
+        report, malformed = build_report(paths, since, until, jobs=args.jobs)
+    if malformed:
+        print(f"⚠️  Skipped {malformed} malformed records", file=sys.stderr)
+
+    regressions = None
+    if args.baseline:
+        try:
+            with open(args.baseline, encoding='utf-8') as f:
+                baseline = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"❌ Cannot read baseline {args.baseline}: {e}", file=sys.stderr)
+            return 2
+        regressions = report.regressions(baseline, args.threshold, args.min_samples)
+
+    if args.save_baseline:
+        target = Path(args.save_baseline)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(target.name + ".tmp")
+        tmp.write_text(json.dumps(report.baseline()), encoding='utf-8')
+        os.replace(tmp, target)
+        print(f"✓ Baseline saved to {target}", file=sys.stderr)
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        if args.format == "json":
+            with phase("export"):
+                data = report.report(args.top, regressions)
+                data["sources"] = [str(p) for p in paths]
+                data["malformed_records"] = malformed
+                json.dump(data, out, indent=2)
+                out.write("\n")
+        else:
+            color = not args.output and use_color()
+            with phase("rendering"):
+                write_text(report, out, period_label, args.top, args.hours, regressions, color)
+    finally:
+        if args.output:
+            out.close()
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,13 +4,31 @@ BMAD Enhanced - Progress Visualization System
 Provides real-time progress tracking for workflows and commands.
 """
 
+import os
+import re
 import sys
 import time
 import json
+import atexit
+import hashlib
+import inspect
+import shutil
+import threading
+import uuid
+from collections import deque
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Optional, List, Dict
 from enum import Enum
 
+from bmadlib import metrics
+from bmadlib.hashing import value_digest
+from bmadlib.output import Colors
+from bmadlib.profiling import instrumented
+from bmadlib.sketch import QuantileSketch
+from bmadlib.spans import SpanRecorder
+from bmadlib.telemetry import TelemetryWriter, get_writer as get_telemetry_writer
+
 
 class ProgressStyle(Enum):
     """Progress bar styles"""
@@ -20,19 +38,6 @@ class ProgressStyle(Enum):
     MINIMAL = "minimal"   # Step 1/7
 
 
-class Colors:
-    """ANSI color codes"""
-    HEADER = '\033[95m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
-    DIM = '\033[2m'
-
-
 class WorkflowStep(Enum):
     """7-step workflow phases"""
     LOAD = 1
@@ -66,6 +71,556 @@ STEP_DESCRIPTIONS = {
 
 SPINNER_FRAMES = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
 
+# Substeps kept per step in the step log; later ones are only counted
+MAX_RECORDED_SUBSTEPS = 100
+
+STEP_DURATION = metrics.histogram("bmad_workflow_step_duration_seconds", "Duration of completed workflow steps",
+                                  ["workflow", "step"])
+WORKFLOWS_TOTAL = metrics.counter("bmad_workflows_total", "Finished workflows", ["workflow", "outcome"])
+
+
+def observe_telemetry(record: Dict):
+    """Add a workflow telemetry record from another process to the metrics"""
+    workflow = record.get("workflow_type", "unknown")
+    for step in record.get("steps", []):
+        if step.get("outcome") != "skipped" and "duration_ms" in step:
+            STEP_DURATION.observe(step["duration_ms"] / 1000, workflow=workflow, step=step["step"].lower())
+    if "outcome" in record:
+        WORKFLOWS_TOTAL.inc(workflow=workflow, outcome=record["outcome"])
+
+
+class StepTimingHistory:
+    """Per-step duration statistics persisted between runs
+
+    Keeps an EWMA and a quantile sketch of each step's duration, keyed by
+    ``(workflow_type, command, WorkflowStep)``, plus a ``("*", "*", step)``
+    aggregate used when a workflow/command pair has no history yet. Stats are
+    read lazily and written back when a run completes, re-reading the file
+    under an exclusive lock so concurrent runs don't drop each other's samples.
+    """
+
+    DEFAULT_PATH = ".claude/telemetry/step-timings.json"
+    ANY = "*"
+
+    def __init__(self, path: Optional[str] = None, alpha: float = 0.3):
+        self.path = Path(path or os.environ.get("BMAD_STEP_HISTORY", self.DEFAULT_PATH))
+        self.alpha = alpha
+        self._stats: Optional[Dict[str, Dict]] = None
+        self._pending: List[tuple] = []
+
+    def estimate(self, workflow_type: str, command: str, step: WorkflowStep) -> Optional[float]:
+        """Expected duration of a step in seconds (EWMA), if known"""
+        stats = self._lookup(workflow_type, command, step)
+        return stats["ewma"] if stats else None
+
+    def quantile(self, workflow_type: str, command: str, step: WorkflowStep, q: float) -> Optional[float]:
+        """Historical q-quantile of a step's duration in seconds, if known"""
+        stats = self._lookup(workflow_type, command, step)
+        if not stats:
+            return None
+        return QuantileSketch.from_dict(stats["sketch"]).quantile(q)
+
+    def record(self, workflow_type: str, command: str, step: WorkflowStep, seconds: float):
+        """Queue a finished step's duration; applied on save()"""
+        self._pending.append((workflow_type, command, step.name, seconds))
+
+    def save(self):
+        """Merge queued durations into the stored stats and write atomically
+
+        The read-merge-write holds an exclusive lock on a ``.lock`` file
+        next to the history, shared across processes.
+        """
+        if not self._pending:
+            return
+        from bmadlib.cache import FileLock
+
+        with FileLock(self.path.with_name(f"{self.path.name}.lock")):
+            stats = self._read()
+            for workflow_type, command, step_name, seconds in self._pending:
+                for key in (self._key(workflow_type, command, step_name),
+                            self._key(self.ANY, self.ANY, step_name)):
+                    self._update(stats, key, seconds)
+            tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"version": 1, "steps": stats}), encoding='utf-8')
+            os.replace(tmp, self.path)
+        self._pending = []
+        self._stats = stats
+
+    def _update(self, stats: Dict[str, Dict], key: str, seconds: float):
+        """Fold one duration into a step's EWMA and sketch"""
+        entry = stats.get(key)
+        if entry is None:
+            sketch = QuantileSketch()
+            sketch.add(seconds)
+            stats[key] = {"ewma": seconds, "count": 1, "sketch": sketch.to_dict()}
+            return
+        sketch = QuantileSketch.from_dict(entry["sketch"])
+        sketch.add(seconds)
+        entry["ewma"] = self.alpha * seconds + (1 - self.alpha) * entry["ewma"]
+        entry["count"] += 1
+        entry["sketch"] = sketch.to_dict()
+
+    def _lookup(self, workflow_type: str, command: str, step: WorkflowStep) -> Optional[Dict]:
+        """Stats for a step, falling back to the all-workflows aggregate"""
+        if self._stats is None:
+            self._stats = self._read()
+        return (self._stats.get(self._key(workflow_type, command, step.name)) or
+                self._stats.get(self._key(self.ANY, self.ANY, step.name)))
+
+    def _read(self) -> Dict[str, Dict]:
+        """Load stored stats, treating a missing or corrupt file as empty"""
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            return data.get("steps", {})
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    @staticmethod
+    def _key(workflow_type: str, command: str, step_name: str) -> str:
+        return f"{workflow_type}|{command}|{step_name}"
+
+
+class CheckpointJournal:
+    """Completed-step journal that lets a failed workflow resume
+
+    After each completed step the journal stores the step's output and a
+    fingerprint of its inputs, chained with the fingerprint and output of
+    the step before it. On a restart, a step whose fingerprint matches is
+    restored from the journal instead of re-run; a changed input, or a
+    changed output upstream, invalidates it and everything after it. The
+    file is rewritten atomically after every step.
+    """
+
+    DEFAULT_DIR = ".claude/checkpoints"
+
+    def __init__(self, workflow_type: str, command: str, run_id: str, directory: Optional[str] = None):
+        self.workflow_type = workflow_type
+        self.command = command
+        self.run_id = run_id
+        directory = Path(directory or os.environ.get("BMAD_CHECKPOINT_DIR", self.DEFAULT_DIR))
+        name = re.sub(r'[^A-Za-z0-9._-]+', '_', f"{workflow_type}-{command}-{run_id}").strip("_")
+        self.path = directory / f"{name}.json"
+        self.steps: Dict[str, Dict] = self._read()
+
+    def lookup(self, step: WorkflowStep, fingerprint: str) -> Optional[Dict]:
+        """The stored entry for a step if it completed with these inputs"""
+        entry = self.steps.get(step.name)
+        if entry and entry.get("fingerprint") == fingerprint:
+            return entry
+        return None
+
+    def record(self, step: WorkflowStep, fingerprint: str, output, duration_ms: float) -> Optional[str]:
+        """Store a completed step; returns its output digest, or None if not JSON-serialisable"""
+        try:
+            json.dumps(output)
+        except (TypeError, ValueError):
+            self.steps.pop(step.name, None)
+            return None
+        output_hash = value_digest(output)
+        self.steps[step.name] = {
+            "fingerprint": fingerprint,
+            "output": output,
+            "output_hash": output_hash,
+            "duration_ms": duration_ms,
+            "completed_at": datetime.now().isoformat()
+        }
+        return output_hash
+
+    def save(self):
+        """Write the journal atomically"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": 1,
+            "workflow_type": self.workflow_type,
+            "command": self.command,
+            "run_id": self.run_id,
+            "updated_at": datetime.now().isoformat(),
+            "steps": self.steps
+        }
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data, default=str), encoding='utf-8')
+        os.replace(tmp, self.path)
+
+    def clear(self):
+        """Forget all checkpoints for this run"""
+        self.steps = {}
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _read(self) -> Dict[str, Dict]:
+        """Load stored steps, treating a missing or corrupt journal as empty"""
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            return data.get("steps", {})
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+
+class TerminalRenderer:
+    """Coalescing, frame-rate-limited renderer for progress trackers
+
+    Trackers only mark themselves dirty on updates; a single render tick
+    thread rebuilds the frame from tracker state at most ``max_fps`` times
+    per second, so bursts of updates cost one redraw. On a TTY the live
+    frame is redrawn in place with cursor control; otherwise frames are
+    appended, skipping repeats. Permanent lines (start/complete messages,
+    finished steps) are written above the live frame.
+    """
+
+    # Redraw a clean TTY frame this often so elapsed times keep ticking
+    REFRESH_INTERVAL = 1.0
+
+    def __init__(self,
+                 stream=None,
+                 max_fps: float = 10.0,
+                 in_place: Optional[bool] = None):
+        self.stream = stream or sys.stderr
+        self.interval = 1.0 / max_fps if max_fps > 0 else 0.0
+        if in_place is None:
+            in_place = hasattr(self.stream, "isatty") and self.stream.isatty()
+        self.in_place = in_place
+        self.trackers: List["ProgressTracker"] = []
+        self._messages: deque = deque()
+        self._printed: Dict[int, tuple] = {}
+        self._dirty = False
+        self._live_lines = 0
+        self._last_draw = 0.0
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def attach(self, tracker: "ProgressTracker"):
+        """Start rendering a tracker"""
+        with self._lock:
+            if tracker not in self.trackers:
+                self.trackers.append(tracker)
+            self._ensure_thread()
+
+    def detach(self, tracker: "ProgressTracker"):
+        """Stop rendering a tracker, flushing its final state"""
+        with self._lock:
+            if tracker in self.trackers:
+                self.trackers.remove(tracker)
+            self._printed.pop(id(tracker), None)
+            self._draw()
+        if not self.trackers:
+            self._end_thread(idle_only=True)
+            self.flush()
+
+    def mark_dirty(self, tracker: "ProgressTracker"):
+        """Note that a tracker changed; it is redrawn on the next tick"""
+        self._dirty = True
+
+    def message(self, text: str, tracker: Optional["ProgressTracker"] = None):
+        """Queue a permanent line above the live frame"""
+        self._messages.append(text)
+        self._dirty = True
+
+    def commit(self, tracker: "ProgressTracker"):
+        """Keep a tracker's current frame in the scrollback (non-blocking)"""
+        key = tracker._frame_key()
+        if self.in_place:
+            self._messages.extend(tracker._build_frame())
+            self._dirty = True
+        elif self._printed.get(id(tracker)) != key:
+            self._messages.extend(tracker._build_frame())
+            self._printed[id(tracker)] = key
+            self._dirty = True
+
+    def flush(self):
+        """Draw immediately if anything changed"""
+        with self._lock:
+            if self._has_pending():
+                self._draw()
+
+    def stop(self):
+        """Stop the render tick, flushing pending output"""
+        self._end_thread()
+        self.flush()
+
+    def _end_thread(self, idle_only: bool = False):
+        """Stop the render tick thread and wait for it
+
+        The wait happens outside the lock, which the thread may need to
+        finish its frame. Each thread has its own stop event, so a thread
+        started by a later attach() is not affected.
+        """
+        with self._lock:
+            if idle_only and self.trackers:
+                return
+            thread, self._thread = self._thread, None
+            self._stop.set()
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+
+    def _ensure_thread(self):
+        """Start the render tick thread if it is not running"""
+        if self._thread is not None or self.interval <= 0:
+            return
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(self._stop,),
+                                        name="bmad-progress-render", daemon=True)
+        self._thread.start()
+
+    def _run(self, stop: threading.Event):
+        """Render tick: redraw at most once per frame interval"""
+        while not stop.wait(self.interval):
+            refresh = (self.in_place and self._live_lines and
+                       time.monotonic() - self._last_draw >= self.REFRESH_INTERVAL)
+            if self._has_pending() or refresh:
+                with self._lock:
+                    self._draw()
+
+    def _has_pending(self) -> bool:
+        """Whether there is anything new to draw"""
+        return self._dirty or bool(self._messages)
+
+    def _draw(self):
+        """Write pending messages and the current frame in one write"""
+        self._dirty = False
+        out = []
+        if self.in_place and self._live_lines:
+            # Move to the first live line and clear everything below it
+            out.append(f"\r\033[{self._live_lines}A\033[J")
+            self._live_lines = 0
+
+        while self._messages:
+            out.append(self._messages.popleft() + "\n")
+
+        if self.in_place:
+            width = shutil.get_terminal_size().columns
+            for tracker in self.trackers:
+                for line in tracker._build_frame():
+                    out.append(_fit(line, width) + "\n")
+                    self._live_lines += 1
+        else:
+            for tracker in self.trackers:
+                key = tracker._frame_key()
+                if self._printed.get(id(tracker)) != key:
+                    self._printed[id(tracker)] = key
+                    out.extend(line + "\n" for line in tracker._build_frame())
+
+        if out:
+            self.stream.write("".join(out))
+            self.stream.flush()
+        self._last_draw = time.monotonic()
+
+
+ANSI_ESCAPE = re.compile(r'\033\[[0-9;]*[A-Za-z]')
+
+
+def _fit(line: str, width: int) -> str:
+    """Truncate a line to the terminal width so in-place redraws don't wrap"""
+    plain = ANSI_ESCAPE.sub("", line)
+    if len(plain) < width:
+        return line
+    return plain[:max(width - 1, 1)]
+
+
+class EventStreamRenderer:
+    """Headless renderer emitting progress as NDJSON events
+
+    Nothing is drawn: each tracker update becomes one compact JSON line
+    (``start``, ``step``, ``substep``, ``end``) for CI logs or a parent
+    process to parse. Events are snapshotted on the caller's thread and
+    written by a background thread, so a slow pipe never stalls a workflow.
+    Decorative tracker messages are dropped; their content is carried by
+    the ``end`` event.
+    """
+
+    def __init__(self, stream=None, path: Optional[str] = None):
+        self.stream = stream
+        self.path = path
+        self.pid = os.getpid()
+        self._runs: Dict[int, int] = {}
+        self._next_run = 1
+        self._events: deque = deque()
+        self._wake = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._file = None
+        self._closed = False
+        atexit.register(self.flush)
+
+    def attach(self, tracker: "ProgressTracker"):
+        """Emit a start event for a new run"""
+        if id(tracker) in self._runs:
+            return
+        with self._lock:
+            self._runs[id(tracker)] = self._next_run
+            self._next_run += 1
+        self._emit(tracker, "start", pid=self.pid, total=tracker.total_steps)
+
+    def detach(self, tracker: "ProgressTracker"):
+        """Emit the end event with the run's outcome and timings"""
+        end_ns = tracker.end_ns or time.perf_counter_ns()
+        elapsed = round((end_ns - tracker.start_ns) / 1e6, 3) if tracker.start_ns else None
+        self._emit(tracker, "end", outcome=tracker.outcome, message=tracker.outcome_message,
+                   elapsed_ms=elapsed, steps=[{k: s[k] for k in ("step", "duration_ms", "outcome") if k in s}
+                                              for s in tracker.timings()])
+        self._runs.pop(id(tracker), None)
+
+    def mark_dirty(self, tracker: "ProgressTracker"):
+        """Emit the tracker's new step or substep"""
+        step_name, description = tracker._step_view or ("", "")
+        if tracker._substep is not None:
+            self._emit(tracker, "substep", step=tracker.current_step, name=step_name, detail=tracker._substep)
+        else:
+            self._emit(tracker, "step", step=tracker.current_step, total=tracker.total_steps,
+                       name=step_name, detail=description)
+
+    def message(self, text: str, tracker: Optional["ProgressTracker"] = None):
+        """Emit free-standing messages; tracker decorations are dropped"""
+        if tracker is None:
+            text = ANSI_ESCAPE.sub("", text).strip()
+            if text:
+                self._queue({"ts": round(time.time(), 3), "event": "message", "text": text})
+
+    def commit(self, tracker: "ProgressTracker"):
+        """Finished steps are reported by the next step or end event"""
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until every queued event has been written"""
+        if self._thread is None:
+            return not self._events
+        self._wake.set()
+        return self._idle.wait(timeout)
+
+    def stop(self):
+        """Write pending events (the writer thread is shared and keeps running)"""
+        self.flush()
+
+    def close(self, timeout: Optional[float] = 5.0):
+        """Write pending events, then end the writer thread and close the file"""
+        self.flush(timeout)
+        atexit.unregister(self.flush)
+        self._closed = True
+        if self._thread is not None:
+            self._wake.set()
+            self._thread.join(timeout)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _emit(self, tracker: "ProgressTracker", event: str, **fields):
+        """Snapshot an event for a tracker and queue it"""
+        record = {"ts": round(time.time(), 3), "event": event,
+                  "run": self._runs.get(id(tracker)), "op": tracker.operation_name}
+        record.update(fields)
+        self._queue(record)
+
+    def _queue(self, record: Dict):
+        """Queue an event and make sure the writer thread will pick it up
+
+        Queueing and the writer's idle check share the lock, so ``flush()``
+        can never see the writer idle while an event is still queued.
+        """
+        with self._lock:
+            self._events.append(record)
+            self._idle.clear()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="bmad-progress-events", daemon=True)
+                self._thread.start()
+        self._wake.set()
+
+    def _run(self):
+        """Writer loop: serialise queued events as NDJSON"""
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            while True:
+                lines = []
+                while self._events:
+                    lines.append(json.dumps(self._events.popleft(), separators=(",", ":"),
+                                            ensure_ascii=False, default=str))
+                if lines:
+                    try:
+                        stream = self._open()
+                        stream.write("\n".join(lines) + "\n")
+                        stream.flush()
+                    except (OSError, ValueError):
+                        pass
+                with self._lock:
+                    if not self._events:
+                        self._idle.set()
+                        break
+            if self._closed:
+                return
+
+    def _open(self):
+        """Open the output lazily (opening a named pipe waits for a reader)"""
+        if self.stream is not None:
+            return self.stream
+        if self.path:
+            if self._file is None:
+                self._file = open(self.path, 'a', encoding='utf-8')
+            return self._file
+        # Looked up on every write: the daemon redirects stderr per request
+        return sys.stderr
+
+
+_event_stream: Optional[EventStreamRenderer] = None
+_event_stream_lock = threading.Lock()
+
+
+def headless_requested(stream=None) -> bool:
+    """Whether progress should be emitted as events instead of drawn
+
+    ``BMAD_PROGRESS=events`` forces headless mode and ``BMAD_PROGRESS=terminal``
+    forces drawing. Otherwise events are used when an event destination
+    (``BMAD_PROGRESS_FD`` or ``BMAD_PROGRESS_FILE``) is set, or when the
+    output stream is not a terminal.
+    """
+    mode = os.environ.get("BMAD_PROGRESS", "auto").lower()
+    if mode in ("events", "ndjson", "json", "headless"):
+        return True
+    if mode in ("terminal", "tty", "plain"):
+        return False
+    if os.environ.get("BMAD_PROGRESS_FD") or os.environ.get("BMAD_PROGRESS_FILE"):
+        return True
+    stream = stream or sys.stderr
+    return not (hasattr(stream, "isatty") and stream.isatty())
+
+
+def get_event_stream() -> EventStreamRenderer:
+    """Return the process-wide event renderer
+
+    Events go to file descriptor ``BMAD_PROGRESS_FD``, else to the file or
+    named pipe ``BMAD_PROGRESS_FILE``, else to stderr.
+    """
+    global _event_stream
+    if _event_stream is None:
+        with _event_stream_lock:
+            if _event_stream is None:
+                fd = os.environ.get("BMAD_PROGRESS_FD")
+                stream = os.fdopen(int(fd), 'w', encoding='utf-8', closefd=False) if fd else None
+                _event_stream = EventStreamRenderer(stream=stream, path=os.environ.get("BMAD_PROGRESS_FILE"))
+    return _event_stream
+
+
+def close_event_stream():
+    """Write and close the shared event renderer, if one was created
+
+    The next ``get_event_stream()`` builds a fresh one from the environment
+    at that point; the daemon does this after every request it runs.
+    """
+    global _event_stream
+    with _event_stream_lock:
+        renderer, _event_stream = _event_stream, None
+    if renderer is not None:
+        renderer.close()
+
+
+def default_renderer(max_fps: float = 10.0):
+    """Renderer for a standalone tracker: events when headless, else the terminal"""
+    if headless_requested():
+        return get_event_stream()
+    return TerminalRenderer(max_fps=max_fps)
+
 
 class ProgressTracker:
     """Tracks and displays progress for BMAD operations"""
@@ -74,7 +629,12 @@ class ProgressTracker:
                  total_steps: int = 7,
                  style: ProgressStyle = ProgressStyle.BAR,
                  show_eta: bool = True,
-                 show_elapsed: bool = True):
+                 show_elapsed: bool = True,
+                 max_fps: float = 10.0,
+                 renderer: Optional[TerminalRenderer] = None,
+                 history: Optional[StepTimingHistory] = None,
+                 history_key: Optional[tuple] = None,
+                 spans: Optional[SpanRecorder] = None):
         self.total_steps = total_steps
         self.current_step = 0
         self.style = style
@@ -83,23 +643,54 @@ class ProgressTracker:
         self.start_time = None
         self.step_start_time = None
         self.step_times: List[float] = []
+        self.step_durations: Dict[WorkflowStep, float] = {}
+        self.step_log: List[Dict] = []
+        self.start_ns: Optional[int] = None
+        self.end_ns: Optional[int] = None
+        self.history = history
+        self.history_key = history_key or ("default", "default")
         self.spinner_index = 0
         self.completed = False
+        self.operation_name = "Operation"
+        self.outcome: Optional[str] = None
+        self.outcome_message: Optional[str] = None
+        self.renderer = renderer or default_renderer(max_fps)
+        self._step_view: Optional[tuple] = None
+        self._substep: Optional[str] = None
+        self._attached = False
+        self.spans = spans
+        self._root_span = None
+        self._step_span = None
+        self._substep_span = None
 
     def start(self, operation_name: str = "Operation"):
         """Start progress tracking"""
         self.start_time = datetime.now()
+        self.start_ns = time.perf_counter_ns()
         self.operation_name = operation_name
+        if self.spans:
+            self._root_span = self.spans.begin(operation_name)
+        self._attach()
         self._print(f"\n{Colors.BOLD}{Colors.CYAN}Starting: {operation_name}{Colors.ENDC}\n")
 
     def update_step(self, step: WorkflowStep, status: str = ""):
         """Update to a new workflow step"""
         if self.step_start_time:
-            elapsed = (datetime.now() - self.step_start_time).total_seconds()
-            self.step_times.append(elapsed)
+            self._finish_step()
+            self.renderer.commit(self)
 
         self.current_step = step.value
         self.step_start_time = datetime.now()
+        self.step_log.append({
+            "step": step,
+            "start_ns": time.perf_counter_ns(),
+            "end_ns": None,
+            "substeps": [],
+            "substep_count": 0
+        })
+        if self.spans:
+            args = {"step": step.name, "status": status} if status else {"step": step.name}
+            self._step_span = self.spans.begin(STEP_NAMES[step], parent=self._root_span, args=args)
 
         step_name = STEP_NAMES[step]
         step_desc = STEP_DESCRIPTIONS[step]
@@ -111,40 +702,217 @@ class ProgressTracker:
 
     def update_substep(self, message: str):
         """Update substep within current step"""
+        if self.step_log:
+            entry = self.step_log[-1]
+            entry["substep_count"] += 1
+            if len(entry["substeps"]) < MAX_RECORDED_SUBSTEPS:
+                entry["substeps"].append((message, time.perf_counter_ns()))
+        if self.spans and self._step_span is not None:
+            self.spans.end(self._substep_span)
+            self._substep_span = self.spans.begin(message, parent=self._step_span)
         self._render_progress(STEP_NAMES[WorkflowStep(self.current_step)], message, is_substep=True)
 
     def complete(self, message: str = "Completed successfully"):
         """Mark operation as complete"""
+        if self.step_start_time and not self.completed:
+            self._finish_step()
         self.completed = True
+        self.end_ns = time.perf_counter_ns()
         self.current_step = self.total_steps
+        self.outcome, self.outcome_message = "success", message
 
         total_elapsed = (datetime.now() - self.start_time).total_seconds()
 
+        self._substep = None
+        self.renderer.commit(self)
         self._print(f"\n{Colors.GREEN}✓{Colors.ENDC} {Colors.BOLD}{message}{Colors.ENDC}")
         if self.show_elapsed:
             self._print(f"  {Colors.DIM}Total time: {self._format_duration(total_elapsed)}{Colors.ENDC}\n")
+        self._detach()
+        self._end_root_span()
+        self._save_history()
 
     def error(self, message: str):
         """Mark operation as failed"""
+        if self.step_start_time and not self.completed:
+            self._finish_step()
         self.completed = True
+        self.end_ns = time.perf_counter_ns()
+        self.outcome, self.outcome_message = "error", message
         total_elapsed = (datetime.now() - self.start_time).total_seconds() if self.start_time else 0
 
+        if self._step_view:
+            self.renderer.commit(self)
         self._print(f"\n{Colors.RED}✗{Colors.ENDC} {Colors.BOLD}{message}{Colors.ENDC}")
         if self.show_elapsed and total_elapsed > 0:
             self._print(f"  {Colors.DIM}Time elapsed: {self._format_duration(total_elapsed)}{Colors.ENDC}\n")
+        self._detach()
+        self._end_root_span(error=message)
+
+    def skip_step(self, step: WorkflowStep, status: str = "Restored from checkpoint"):
+        """Show a step as done without running it (not counted in timing history)"""
+        if self.step_start_time:
+            self._finish_step()
+            self.renderer.commit(self)
+            self.step_start_time = None
+        self.current_step = step.value
+        now = time.perf_counter_ns()
+        self.step_log.append({
+            "step": step,
+            "start_ns": now,
+            "end_ns": now,
+            "substeps": [],
+            "substep_count": 0,
+            "outcome": "skipped"
+        })
+        self._render_progress(STEP_NAMES[step], status)
+        self.renderer.commit(self)
+
+    def end_step(self, outcome: str = "success", error: Optional[str] = None):
+        """End the current step now rather than when the next one starts"""
+        if not self.step_start_time or self.completed:
+            return
+        self._finish_step()
+        if self.step_log:
+            self.step_log[-1]["outcome"] = outcome
+            if error:
+                self.step_log[-1]["error"] = error
+        self.renderer.commit(self)
+        self.step_start_time = None
+
+    def _finish_step(self):
+        """Record how long the current step took"""
+        if self.spans:
+            self.spans.end(self._substep_span)
+            self.spans.end(self._step_span)
+            self._substep_span = self._step_span = None
+        now = time.perf_counter_ns()
+        if self.step_log and self.step_log[-1]["end_ns"] is None:
+            self.step_log[-1]["end_ns"] = now
+            elapsed = (now - self.step_log[-1]["start_ns"]) / 1e9
+        else:
+            elapsed = (datetime.now() - self.step_start_time).total_seconds()
+        self.step_times.append(elapsed)
+        try:
+            step = WorkflowStep(self.current_step)
+        except ValueError:
+            return
+        self.step_durations[step] = self.step_durations.get(step, 0.0) + elapsed
+        STEP_DURATION.observe(elapsed, workflow=self.history_key[0], step=step.name.lower())
+
+    def _end_root_span(self, error: Optional[str] = None):
+        """Close the operation span once the run has finished"""
+        if not self.spans or self._root_span is None:
+            return
+        if error and hasattr(self._root_span, "args"):
+            self._root_span.args = dict(self._root_span.args or {}, error=error)
+        self.spans.end(self._root_span)
+        self._root_span = None
+
+    def timings(self) -> List[Dict]:
+        """Per-step durations (ms) with their substeps, from the step log"""
+        steps = []
+        for entry in self.step_log:
+            end_ns = entry["end_ns"] or time.perf_counter_ns()
+            substeps = []
+            marks = entry["substeps"]
+            for i, (message, start_ns) in enumerate(marks):
+                sub_end = marks[i + 1][1] if i + 1 < len(marks) else end_ns
+                substeps.append({
+                    "message": message,
+                    "duration_ms": round((sub_end - start_ns) / 1e6, 3)
+                })
+            step = {
+                "step": entry["step"].name,
+                "name": STEP_NAMES[entry["step"]],
+                "duration_ms": round((end_ns - entry["start_ns"]) / 1e6, 3),
+                "substep_count": entry["substep_count"],
+                "substeps": substeps
+            }
+            for key in ("outcome", "error"):
+                if key in entry:
+                    step[key] = entry[key]
+            steps.append(step)
+        return steps
+
+    def _save_history(self):
+        """Persist this run's step durations for future ETAs"""
+        if not self.history:
+            return
+        workflow_type, command = self.history_key
+        for step, seconds in self.step_durations.items():
+            self.history.record(workflow_type, command, step, seconds)
+        try:
+            self.history.save()
+        except OSError:
+            pass
 
     def _render_progress(self, step_name: str, description: str, is_substep: bool = False):
-        """Render progress based on style"""
+        """Update the live view; it is drawn on the next render tick"""
+        if is_substep:
+            self._substep = description
+        else:
+            self._step_view = (step_name, description)
+            self._substep = None
+        self._attach()
+        self.renderer.mark_dirty(self)
+
+    def _attach(self):
+        """Register with the renderer once per run"""
+        if not self._attached:
+            self._attached = True
+            self.renderer.attach(self)
+
+    def _detach(self):
+        """Hand the final state to the renderer and unregister"""
+        if self._attached:
+            self._attached = False
+            self.renderer.detach(self)
+
+    def _frame_key(self) -> tuple:
+        """Identity of the current view, used to skip repeated frames"""
+        return (self.current_step, self._step_view, self._substep)
+
+    def _build_frame(self) -> List[str]:
+        """Build the lines for the current view in the configured style"""
+        if self._step_view is None:
+            return []
+        step_name, description = self._step_view
+
         if self.style == ProgressStyle.BAR:
-            self._render_bar(step_name, description, is_substep)
+            lines = self._render_bar(step_name, description)
         elif self.style == ProgressStyle.SPINNER:
-            self._render_spinner(step_name, description, is_substep)
+            lines = self._render_spinner(step_name, description)
         elif self.style == ProgressStyle.DOTS:
-            self._render_dots(step_name, description, is_substep)
-        elif self.style == ProgressStyle.MINIMAL:
-            self._render_minimal(step_name, description, is_substep)
+            lines = self._render_dots(step_name, description)
+        else:
+            lines = self._render_minimal(step_name, description)
+
+        if self._substep:
+            lines.append(f"  ↳ {Colors.CYAN}{self._substep}{Colors.ENDC}")
+        return lines
+
+    def _build_row(self) -> str:
+        """Build a compact single-line view for the multi-workflow dashboard"""
+        progress = self.current_step / self.total_steps if self.total_steps else 0
+        bar_width = 12
+        filled = int(bar_width * progress)
+        bar = '█' * filled + '░' * (bar_width - filled)
 
-    def _render_bar(self, step_name: str, description: str, is_substep: bool):
+        step_name, description = self._step_view or ("Starting", "")
+        detail = self._substep or description
+        elapsed_str = ""
+        if self.show_elapsed and self.start_time:
+            elapsed = (datetime.now() - self.start_time).total_seconds()
+            elapsed_str = f" | {self._format_duration(elapsed)}"
+
+        row = (f"{self.operation_name:<28} {Colors.BLUE}[{bar}]{Colors.ENDC} "
+               f"{self.current_step}/{self.total_steps} {Colors.BOLD}{step_name}{Colors.ENDC}{elapsed_str}")
+        if detail:
+            row += f" {Colors.DIM}↳ {detail}{Colors.ENDC}"
+        return row
+
+    def _render_bar(self, step_name: str, description: str) -> List[str]:
         """Render progress bar style"""
         progress = self.current_step / self.total_steps
         bar_width = 30
@@ -153,11 +921,8 @@ class ProgressTracker:
 
         percentage = int(progress * 100)
 
-        prefix = "  ↳" if is_substep else "▶"
-        color = Colors.CYAN if is_substep else Colors.BLUE
-
         eta_str = ""
-        if self.show_eta and not is_substep and self.step_times:
+        if self.show_eta:
             eta = self._estimate_remaining()
             if eta:
                 eta_str = f" | ETA: {self._format_duration(eta)}"
@@ -167,59 +932,77 @@ class ProgressTracker:
             elapsed = (datetime.now() - self.step_start_time).total_seconds()
             elapsed_str = f" | {self._format_duration(elapsed)}"
 
-        line = f"{prefix} {color}[{bar}] {percentage}%{Colors.ENDC} | Step {self.current_step}/{self.total_steps}: {Colors.BOLD}{step_name}{Colors.ENDC}{eta_str}{elapsed_str}"
-        self._print(line)
+        lines = [f"▶ {Colors.BLUE}[{bar}] {percentage}%{Colors.ENDC} | Step {self.current_step}/{self.total_steps}: {Colors.BOLD}{step_name}{Colors.ENDC}{eta_str}{elapsed_str}"]
 
-        if description and not is_substep:
-            self._print(f"   {Colors.DIM}{description}{Colors.ENDC}")
+        if description:
+            lines.append(f"   {Colors.DIM}{description}{Colors.ENDC}")
+        return lines
 
-    def _render_spinner(self, step_name: str, description: str, is_substep: bool):
+    def _render_spinner(self, step_name: str, description: str) -> List[str]:
         """Render spinner style"""
         spinner = SPINNER_FRAMES[self.spinner_index % len(SPINNER_FRAMES)]
         self.spinner_index += 1
 
-        prefix = "  ↳" if is_substep else spinner
-        color = Colors.CYAN if is_substep else Colors.BLUE
-
-        line = f"{prefix} {color}Step {self.current_step}/{self.total_steps}: {Colors.BOLD}{step_name}{Colors.ENDC}"
+        line = f"{spinner} {Colors.BLUE}Step {self.current_step}/{self.total_steps}: {Colors.BOLD}{step_name}{Colors.ENDC}"
         if description:
             line += f" - {Colors.DIM}{description}{Colors.ENDC}"
+        return [line]
 
-        self._print(line)
-
-    def _render_dots(self, step_name: str, description: str, is_substep: bool):
+    def _render_dots(self, step_name: str, description: str) -> List[str]:
         """Render dots style"""
         dots = "." * (self.spinner_index % 4)
         self.spinner_index += 1
 
-        prefix = "  ↳" if is_substep else "•"
-        color = Colors.CYAN if is_substep else Colors.BLUE
-
-        line = f"{prefix} {color}{step_name}{dots}{Colors.ENDC}"
+        line = f"• {Colors.BLUE}{step_name}{dots}{Colors.ENDC}"
         if description:
             line += f" {Colors.DIM}{description}{Colors.ENDC}"
+        return [line]
 
-        self._print(line)
-
-    def _render_minimal(self, step_name: str, description: str, is_substep: bool):
+    def _render_minimal(self, step_name: str, description: str) -> List[str]:
         """Render minimal style"""
-        prefix = "  ↳" if is_substep else "▶"
-        color = Colors.CYAN if is_substep else Colors.BLUE
-
-        line = f"{prefix} {color}[{self.current_step}/{self.total_steps}] {step_name}{Colors.ENDC}"
+        line = f"▶ {Colors.BLUE}[{self.current_step}/{self.total_steps}] {step_name}{Colors.ENDC}"
         if description:
             line += f" - {Colors.DIM}{description}{Colors.ENDC}"
-
-        self._print(line)
+        return [line]
 
     def _estimate_remaining(self) -> Optional[float]:
-        """Estimate remaining time based on average step time"""
-        if not self.step_times:
+        """Estimate remaining time from historical step costs
+
+        Uses each remaining step's historical duration when available, and
+        the average of this run's finished steps otherwise.
+        """
+        avg_step_time = sum(self.step_times) / len(self.step_times) if self.step_times else None
+
+        if not self.history:
+            if avg_step_time is None:
+                return None
+            return avg_step_time * (self.total_steps - self.current_step)
+
+        workflow_type, command = self.history_key
+        remaining = 0.0
+        known = False
+        for number in range(max(self.current_step, 1), self.total_steps + 1):
+            try:
+                step = WorkflowStep(number)
+            except ValueError:
+                expected = None
+            else:
+                expected = self.history.estimate(workflow_type, command, step)
+            if expected is None:
+                expected = avg_step_time
+            else:
+                known = True
+            if expected is None:
+                continue
+            if number == self.current_step and self.step_start_time:
+                # Only the part of the current step that is still to come
+                in_step = (datetime.now() - self.step_start_time).total_seconds()
+                expected = max(expected - in_step, 0.0)
+            remaining += expected
+
+        if not known and avg_step_time is None:
             return None
-
-        avg_step_time = sum(self.step_times) / len(self.step_times)
-        remaining_steps = self.total_steps - self.current_step
-        return avg_step_time * remaining_steps
+        return remaining
 
     def _format_duration(self, seconds: float) -> str:
         """Format duration in human-readable format"""
@@ -237,22 +1020,270 @@ class ProgressTracker:
             return f"{hours}h {minutes}m"
 
     def _print(self, message: str):
-        """Print message to stderr (so it doesn't interfere with output)"""
-        print(message, file=sys.stderr, flush=True)
+        """Queue a permanent line on stderr (so it doesn't interfere with output)"""
+        self.renderer.message(message, self)
+
+
+class ProgressHub(TerminalRenderer):
+    """Shared dashboard for concurrently running workflows
+
+    Any number of trackers, on any thread or event loop, can share one hub.
+    Publishing is an append to a lock-free deque (plus a flag for plain
+    updates), so it never blocks the caller; the hub's single render thread
+    drains the queue and draws one stable row per active workflow, in the
+    order they started. Per-workflow messages are labelled with the
+    workflow's row number and written above the dashboard.
+    """
+
+    def __init__(self,
+                 stream=None,
+                 max_fps: float = 10.0,
+                 in_place: Optional[bool] = None):
+        super().__init__(stream=stream, max_fps=max_fps, in_place=in_place)
+        self._events: deque = deque()
+        self._labels: Dict[int, int] = {}
+        self._next_label = 1
+        self._rows_printed: Dict[int, str] = {}
+        atexit.register(self.stop)
+
+    def attach(self, tracker: "ProgressTracker"):
+        """Add a workflow row (non-blocking)"""
+        self._events.append(("attach", tracker, None))
+        if self._thread is None:
+            with self._lock:
+                self._ensure_thread()
+
+    def detach(self, tracker: "ProgressTracker"):
+        """Remove a workflow row, keeping its final state (non-blocking)"""
+        self._events.append(("detach", tracker, None))
+
+    def message(self, text: str, tracker: Optional["ProgressTracker"] = None):
+        """Queue a permanent line for a workflow (non-blocking)"""
+        self._events.append(("message", tracker, text))
+
+    def commit(self, tracker: "ProgressTracker"):
+        """Rows always show the current step; finished steps are not kept"""
+
+    def _has_pending(self) -> bool:
+        """Whether there is anything new to draw"""
+        return self._dirty or bool(self._events) or bool(self._messages)
+
+    def _draw(self):
+        """Apply queued events, then redraw the dashboard"""
+        self._dirty = False
+        while self._events:
+            kind, tracker, text = self._events.popleft()
+            if kind == "attach":
+                if tracker not in self.trackers:
+                    self.trackers.append(tracker)
+                    self._labels[id(tracker)] = self._next_label
+                    self._next_label += 1
+            elif kind == "detach":
+                if tracker in self.trackers:
+                    self._messages.append(self._label(tracker) + tracker._build_row())
+                    self.trackers.remove(tracker)
+                self._rows_printed.pop(id(tracker), None)
+                self._labels.pop(id(tracker), None)
+            else:
+                prefix = self._label(tracker) if tracker is not None else ""
+                for line in text.splitlines():
+                    if line.strip():
+                        self._messages.append(prefix + line)
+
+        out = []
+        if self.in_place and self._live_lines:
+            out.append(f"\r\033[{self._live_lines}A\033[J")
+            self._live_lines = 0
+
+        while self._messages:
+            out.append(self._messages.popleft() + "\n")
+
+        if self.in_place:
+            if self.trackers:
+                width = shutil.get_terminal_size().columns
+                header = f"{Colors.BOLD}{Colors.CYAN}BMAD workflows: {len(self.trackers)} active{Colors.ENDC}"
+                rows = [header] + [self._label(t) + t._build_row() for t in self.trackers]
+                for row in rows:
+                    out.append(_fit(row, width) + "\n")
+                self._live_lines = len(rows)
+        else:
+            for tracker in self.trackers:
+                key = repr(tracker._frame_key())
+                if self._rows_printed.get(id(tracker)) != key:
+                    self._rows_printed[id(tracker)] = key
+                    out.append(self._label(tracker) + tracker._build_row() + "\n")
+
+        if out:
+            self.stream.write("".join(out))
+            self.stream.flush()
+        self._last_draw = time.monotonic()
+
+    def _label(self, tracker: "ProgressTracker") -> str:
+        """Row label shared by a workflow's row and its messages"""
+        number = self._labels.get(id(tracker))
+        return f"{Colors.DIM}#{number}{Colors.ENDC} " if number else ""
+
+
+_hub: Optional[ProgressHub] = None
+_hub_lock = threading.Lock()
+
+
+def get_hub():
+    """Return the process-wide progress hub, creating it on first use
+
+    In headless mode this is the shared event renderer instead, so
+    concurrent workflows become interleaved event streams keyed by ``run``.
+    """
+    global _hub
+    if headless_requested():
+        return get_event_stream()
+    if _hub is None:
+        with _hub_lock:
+            if _hub is None:
+                _hub = ProgressHub()
+    return _hub
+
+
+class StepContext:
+    """Times one workflow step; usable with ``with`` and ``async with``
+
+    Entering starts the step and leaving ends it, recording the value set
+    with ``set_result()`` or the exception that escaped. Both only update
+    tracker state and queue work for the renderer, so they never wait on
+    terminal writes. An escaping exception also fails the workflow (and
+    still propagates) unless ``fail_workflow`` is False.
+
+    With a checkpoint journal, a step that already completed with the same
+    inputs is restored instead: ``cached`` is True and ``result`` holds the
+    stored output, so the body can skip the work.
+    """
+
+    def __init__(self, progress: "WorkflowProgress", step: WorkflowStep,
+                 status: str = "", fail_workflow: bool = True, inputs=None):
+        self.progress = progress
+        self.step = step
+        self.status = status
+        self.fail_workflow = fail_workflow
+        self.inputs = inputs
+        self.result = None
+        self.cached = False
+        self._fingerprint: Optional[str] = None
+
+    def substep(self, message: str):
+        """Report a substep within this step"""
+        self.progress.tracker.update_substep(message)
+
+    def set_result(self, value):
+        """Record the step's result in ``progress.results``"""
+        self.result = value
+
+    def __enter__(self) -> "StepContext":
+        journal = self.progress.journal
+        if journal is not None:
+            self._fingerprint = self.progress._fingerprint(self.step, self.inputs)
+            entry = journal.lookup(self.step, self._fingerprint)
+            if entry is not None:
+                self.cached = True
+                self.result = entry["output"]
+                self.progress.tracker.skip_step(self.step)
+                return self
+        self.progress.tracker.update_step(self.step, self.status)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._finish(exc):
+            if self.fail_workflow:
+                self.progress.error(self._failure_message(exc))
+        elif self._checkpoint():
+            self._save_journal()
+        return False
+
+    async def __aenter__(self) -> "StepContext":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._finish(exc):
+            if self.fail_workflow:
+                await self.progress.aerror(self._failure_message(exc))
+        elif self._checkpoint():
+            import asyncio
+            await asyncio.get_running_loop().run_in_executor(None, self._save_journal)
+        return False
+
+    def _finish(self, exc: Optional[BaseException]) -> bool:
+        """End the step and record its outcome; True if it failed"""
+        if exc is None:
+            if not self.cached:
+                self.progress.tracker.end_step("success")
+            self.progress.results[self.step] = self.result
+            return False
+        self.progress.tracker.end_step("error", f"{type(exc).__name__}: {exc}")
+        self.progress.results[self.step] = exc
+        return True
+
+    def _checkpoint(self) -> bool:
+        """Advance the fingerprint chain; True if the journal needs saving"""
+        journal = self.progress.journal
+        if journal is None:
+            return False
+        if self.cached:
+            entry = journal.steps[self.step.name]
+            self.progress._advance_chain(self._fingerprint, entry["output_hash"])
+            return False
+        entry = self.progress.tracker.step_log[-1]
+        duration_ms = round((entry["end_ns"] - entry["start_ns"]) / 1e6, 3)
+        output_hash = journal.record(self.step, self._fingerprint, self.result, duration_ms)
+        # An output that cannot be stored cannot be compared on a rerun either,
+        # so later steps must not match anything a previous run recorded
+        self.progress._advance_chain(self._fingerprint, output_hash or uuid.uuid4().hex)
+        return True
+
+    def _save_journal(self):
+        """Persist the journal, ignoring disk errors (resuming is best effort)"""
+        try:
+            self.progress.journal.save()
+        except OSError:
+            pass
+
+    def _failure_message(self, exc: BaseException) -> str:
+        return f"{STEP_NAMES[self.step]} failed: {str(exc) or type(exc).__name__}"
 
 
 class WorkflowProgress:
     """Specialized progress tracker for BMAD workflows"""
 
-    def __init__(self, workflow_type: str, subagent: str, command: str):
+    def __init__(self,
+                 workflow_type: str,
+                 subagent: str,
+                 command: str,
+                 hub: Optional[ProgressHub] = None,
+                 history: Optional[StepTimingHistory] = None,
+                 telemetry: Optional[TelemetryWriter] = None,
+                 spans: Optional[SpanRecorder] = None,
+                 checkpoint: Optional[str] = None,
+                 keep_checkpoint: bool = False):
         self.workflow_type = workflow_type
         self.subagent = subagent
         self.command = command
+        self.telemetry = telemetry or get_telemetry_writer()
+        self.metrics: Dict = {}
+        self.results: Dict[WorkflowStep, object] = {}
+        self.journal = CheckpointJournal(workflow_type, command, checkpoint) if checkpoint else None
+        self.keep_checkpoint = keep_checkpoint
+        self._chain = ""
+        self.trace_dir = os.environ.get("BMAD_TRACE_DIR")
+        if spans is None and self.trace_dir:
+            spans = SpanRecorder(sample_rate=float(os.environ.get("BMAD_TRACE_SAMPLE", "1.0")))
+        self.spans = spans
         self.tracker = ProgressTracker(
             total_steps=7,
             style=ProgressStyle.BAR,
             show_eta=True,
-            show_elapsed=True
+            show_elapsed=True,
+            renderer=hub,
+            history=history or StepTimingHistory(),
+            history_key=(workflow_type, command),
+            spans=spans
         )
 
     def start(self):
@@ -260,6 +1291,28 @@ class WorkflowProgress:
         operation_name = f"{self.subagent} - {self.command}"
         self.tracker.start(operation_name)
 
+    def step(self, step: WorkflowStep, status: str = "", fail_workflow: bool = True,
+             inputs=None) -> StepContext:
+        """Context manager timing one step: ``async with progress.step(WorkflowStep.EXECUTE):``"""
+        return StepContext(self, step, status, fail_workflow, inputs)
+
+    def run_step(self, step: WorkflowStep, func, inputs=None, status: str = ""):
+        """Run ``func()`` as a step, or restore its output from the checkpoint journal"""
+        with self.step(step, status, inputs=inputs) as ctx:
+            if not ctx.cached:
+                ctx.set_result(func())
+        return ctx.result
+
+    async def arun_step(self, step: WorkflowStep, func, inputs=None, status: str = ""):
+        """Async run_step(); ``func`` may return a value or an awaitable"""
+        async with self.step(step, status, inputs=inputs) as ctx:
+            if not ctx.cached:
+                value = func()
+                if inspect.isawaitable(value):
+                    value = await value
+                ctx.set_result(value)
+        return ctx.result
+
     def load_context(self, details: str = ""):
         """Step 1: Load Context"""
         self.tracker.update_step(WorkflowStep.LOAD, details)
@@ -291,22 +1344,86 @@ class WorkflowProgress:
         status = "Verification successful" if success else "Verification issues detected"
         self.tracker.update_step(WorkflowStep.VERIFY, status)
 
-    def emit_telemetry(self):
-        """Step 7: Emit Telemetry"""
+    def emit_telemetry(self, metrics: Optional[Dict] = None):
+        """Step 7: Emit Telemetry
+
+        The telemetry record itself is written when the workflow completes or
+        fails, so it includes this step and the outcome; ``metrics`` are
+        added to it.
+        """
+        if metrics:
+            self.metrics.update(metrics)
         self.tracker.update_step(WorkflowStep.TELEMETRY, "Recording metrics")
 
     def complete(self, message: str = "Workflow completed successfully"):
         """Complete workflow"""
         self.tracker.complete(message)
+        self._record_telemetry("success", message)
+        self._export_trace()
+        if self.journal is not None and not self.keep_checkpoint:
+            self.journal.clear()
 
     def error(self, message: str):
         """Error in workflow"""
         self.tracker.error(message)
+        self._record_telemetry("error", message)
+        self._export_trace()
+
+    async def acomplete(self, message: str = "Workflow completed successfully"):
+        """Complete workflow without blocking the event loop on output and history I/O"""
+        import asyncio
+        await asyncio.get_running_loop().run_in_executor(None, self.complete, message)
+
+    async def aerror(self, message: str):
+        """Fail workflow without blocking the event loop on output and history I/O"""
+        import asyncio
+        await asyncio.get_running_loop().run_in_executor(None, self.error, message)
+
+    def _fingerprint(self, step: WorkflowStep, inputs) -> str:
+        """Identity of a step run: its inputs plus everything upstream of it"""
+        return hashlib.sha256(f"{self._chain}|{step.name}|{value_digest(inputs)}".encode()).hexdigest()
+
+    def _advance_chain(self, fingerprint: str, output_hash: str):
+        """Make later fingerprints depend on this step and its output"""
+        self._chain = hashlib.sha256(f"{fingerprint}|{output_hash}".encode()).hexdigest()
+
+    def _export_trace(self):
+        """Write Chrome-trace and speedscope files when BMAD_TRACE_DIR is set"""
+        if not self.trace_dir or not self.spans or not self.spans.spans:
+            return
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        base = Path(self.trace_dir) / f"{self.command}-{stamp}-{os.getpid()}"
+        try:
+            self.spans.export(f"{base}.trace.json")
+            self.spans.export(f"{base}.speedscope.json")
+        except OSError:
+            pass
+
+    def _record_telemetry(self, outcome: str, message: str):
+        """Queue this run's telemetry record (never blocks the workflow)"""
+        WORKFLOWS_TOTAL.inc(workflow=self.workflow_type, outcome=outcome)
+        if not self.telemetry or self.tracker.start_ns is None:
+            return
+        end_ns = self.tracker.end_ns or time.perf_counter_ns()
+        record = {
+            "timestamp": datetime.now().isoformat(),
+            "workflow_type": self.workflow_type,
+            "subagent": self.subagent,
+            "command": self.command,
+            "outcome": outcome,
+            "message": message,
+            "duration_ms": round((end_ns - self.tracker.start_ns) / 1e6, 3),
+            "steps": self.tracker.timings()
+        }
+        if self.metrics:
+            record["metrics"] = self.metrics
+        self.telemetry.write(record)
 
 
 def demo_progress():
     """Demo the progress visualization system"""
     import time
+    import asyncio
 
     # Demo 1: Workflow progress
     print("\n" + "=" * 70)
@@ -377,6 +1494,73 @@ def demo_progress():
 
         tracker.complete("Done!")
 
+    # Demo 3: Parallel workflows sharing one dashboard
+    print("\n" + "=" * 70)
+    print("DEMO 3: Parallel Workflows")
+    print("=" * 70)
 
-if __name__ == "__main__":
+    import threading
+
+    def run_workflow(subagent: str, command: str, pause: float):
+        workflow = WorkflowProgress("parallel", subagent, command, hub=hub)
+        workflow.start()
+        workflow.load_context()
+        time.sleep(pause)
+        workflow.execute()
+        for i in range(1, 51):
+            workflow.execute_substep(f"Processing item {i}/50")
+            time.sleep(pause / 25)
+        workflow.verify(success=True)
+        time.sleep(pause)
+        workflow.complete(f"{command} finished")
+
+    hub = get_hub()
+    workers = [
+        threading.Thread(target=run_workflow, args=("alex", "*create-task-spec", 0.2)),
+        threading.Thread(target=run_workflow, args=("james", "*implement", 0.3)),
+        threading.Thread(target=run_workflow, args=("quinn", "*review", 0.25))
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    hub.flush()
+
+    # Demo 4: asyncio workflows with step context managers
+    print("\n" + "=" * 70)
+    print("DEMO 4: Async Workflows")
+    print("=" * 70)
+
+    async def run_async(subagent: str, command: str, pause: float):
+        workflow = WorkflowProgress("async", subagent, command, hub=hub)
+        workflow.start()
+        async with workflow.step(WorkflowStep.LOAD):
+            await asyncio.sleep(pause)
+        async with workflow.step(WorkflowStep.EXECUTE, "Running checks") as step:
+            for i in range(1, 11):
+                step.substep(f"Check {i}/10")
+                await asyncio.sleep(pause / 5)
+            step.set_result({"checks": 10})
+        async with workflow.step(WorkflowStep.VERIFY):
+            await asyncio.sleep(pause)
+        await workflow.acomplete(f"{command} finished")
+
+    async def run_all():
+        await asyncio.gather(
+            run_async("quinn", "*nfr-assess", 0.2),
+            run_async("winston", "*review-architecture", 0.3)
+        )
+
+    asyncio.run(run_all())
+    hub.flush()
+
+
+@instrumented("progress-visualizer")
+def main():
+    """Main entry point"""
     demo_progress()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+BMAD Enhanced - Cache Warmer
+
+Pre-populates the caches the BMAD scripts read on their first run: skill
+analysis, the documentation/bundle search index and payload hashes, and
+optionally starts the resident daemon. Targets run in parallel worker
+processes; --background detaches so a deploy or clone can return at once.
+"""
+
+import io
+import os
+import sys
+import time
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from bmadlib.cache import get_cache, flush_caches
+from bmadlib.loader import SCRIPTS_DIR, load_script
+from bmadlib.output import colors_for
+from bmadlib.profiling import instrumented
+
+
+LOG_FILE = ".claude/logs/warm-cache.log"
+
+
+@dataclass
+class Target:
+    """A cache that can be warmed"""
+    name: str
+    description: str
+    func: Callable[[Path], str]
+    default: bool = True
+
+
+TARGETS: Dict[str, Target] = {}
+
+
+def target(name: str, description: str, default: bool = True):
+    """Register a warm-up target; func(root) returns a one-line summary"""
+    def decorator(func):
+        TARGETS[name] = Target(name, description, func, default)
+        return func
+    return decorator
+
+
+@target("skills", "Skill analysis used by monitor-skills.py and health-check.py")
+def warm_skills(root: Path) -> str:
+    monitor_module = load_script("monitor-skills.py")
+    cache = get_cache("skills", root)
+    monitor = monitor_module.SkillMonitor(".claude/skills", cache=cache)
+    with redirect_stdout(io.StringIO()):
+        count = monitor.discover_skills()
+    return f"{count} skills ({cache.counts['hits']} already cached)"
+
+
+@target("search", "Documentation, .bmad-core and web-bundle search index (bmad-wizard.py --search)")
+def warm_search(root: Path) -> str:
+    from bmadlib.docsearch import DocsIndex
+
+    index = DocsIndex(root)
+    try:
+        stats = index.refresh()
+    finally:
+        index.close()
+    return f"{stats['scanned']} files, {stats['updated']} indexed, {stats['removed']} removed"
+
+
+@target("manifest", "Payload file hashes used by deploy-projects.py")
+def warm_manifest(root: Path) -> str:
+    deploy = load_script("deploy-projects.py")
+    if root.resolve() != deploy.BMAD_ROOT:
+        return f"skipped (payloads are hashed in the BMAD source tree, {deploy.BMAD_ROOT})"
+    hashed = set()
+    for mode in deploy.MANIFESTS:
+        files, _ = deploy.plan_payload(mode)
+        deploy.hash_sources(files)
+        hashed.update(src for src, _ in files)
+    return f"{len(hashed)} payload files"
+
+
+@target("daemon", "Resident daemon holding the command search index (bmad-daemon.py)", default=False)
+def warm_daemon(root: Path) -> str:
+    result = subprocess.run([sys.executable, os.path.join(SCRIPTS_DIR, "bmad-daemon.py"), "start", "--detach"],
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stdout.strip() or "daemon did not start")
+    return result.stdout.strip().lstrip("✓⚠️ ")
+
+
+def run_target(name: str, root: str) -> Tuple[str, str, bool, str, float]:
+    """Warm one target for one project (runs in a worker process)"""
+    start = time.perf_counter()
+    os.chdir(root)
+    try:
+        detail = TARGETS[name].func(Path(root))
+        ok = True
+    except Exception as e:
+        detail = f"{type(e).__name__}: {e}"
+        ok = False
+    finally:
+        flush_caches()
+    return root, name, ok, detail, (time.perf_counter() - start) * 1000
+
+
+def warm(roots: List[str], names: List[str], jobs: int, colors, quiet: bool = False) -> int:
+    """Warm every target for every project in parallel; returns the number of failures"""
+    tasks = [(name, root) for root in roots for name in names]
+    width = max(len(name) for name in names)
+    failures = 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max(1, min(jobs, len(tasks)))) as pool:
+        futures = [pool.submit(run_target, name, root) for name, root in tasks]
+        for done, future in enumerate(as_completed(futures), 1):
+            root, name, ok, detail, elapsed = future.result()
+            failures += not ok
+            if quiet and ok:
+                continue
+            where = f" {colors.BLUE}{root}{colors.ENDC}" if len(roots) > 1 else ""
+            mark = f"{colors.GREEN}✓{colors.ENDC}" if ok else f"{colors.RED}❌{colors.ENDC}"
+            print(f"[{done}/{len(tasks)}] {mark} {name:<{width}} {elapsed:7.0f}ms  {detail}{where}", flush=True)
+
+    total_ms = (time.perf_counter() - start) * 1000
+    if failures:
+        print(f"{colors.YELLOW}⚠️  Warmed {len(tasks) - failures}/{len(tasks)} cache(s) in {total_ms:.0f}ms{colors.ENDC}")
+    else:
+        print(f"{colors.GREEN}✅ Warmed {len(tasks)} cache(s) in {total_ms:.0f}ms{colors.ENDC}")
+    return failures
+
+
+def start_background(argv: List[str]) -> int:
+    """Re-run this script detached, logging to .claude/logs/warm-cache.log"""
+    log_path = Path(LOG_FILE)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_path, 'a') as log:
+        process = subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve())] + argv,
+            stdin=subprocess.DEVNULL, stdout=log, stderr=log, start_new_session=True,
+            env=dict(os.environ, NO_COLOR="1")
+        )
+    print(f"✓ Warming caches in the background (pid {process.pid}, log {log_path})")
+    return 0
+
+
+@instrumented("warm-cache")
+def main():
+    """Main entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Pre-populate the BMAD script caches so the first runs are warm",
+        epilog="Targets: " + "; ".join(f"{t.name}: {t.description}" + ("" if t.default else " (opt-in)")
+                                      for t in TARGETS.values())
+    )
+    parser.add_argument("roots", nargs="*", help="Project directories (default: current directory)")
+    parser.add_argument("--targets", default=",".join(t.name for t in TARGETS.values() if t.default),
+                        help="Comma-separated targets (default: %(default)s)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 4,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--background", action="store_true", help="Detach and log to " + LOG_FILE)
+    parser.add_argument("--quiet", action="store_true", help="Only report failures and the summary")
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.targets.split(",") if name.strip()]
+    unknown = [name for name in names if name not in TARGETS]
+    if unknown or not names:
+        print(f"❌ Unknown target(s): {', '.join(unknown) or '(none)'}. "
+              f"Available: {', '.join(TARGETS)}", file=sys.stderr)
+        return 2
+
+    roots = [str(Path(root).resolve()) for root in args.roots] or [str(Path.cwd())]
+    missing = [root for root in roots if not os.path.isdir(root)]
+    if missing:
+        print(f"❌ Not a directory: {', '.join(missing)}", file=sys.stderr)
+        return 2
+
+    if args.background:
+        argv = roots + ["--targets", ",".join(names), "--jobs", str(args.jobs)]
+        return start_background(argv + (["--quiet"] if args.quiet else []))
+
+    colors = colors_for(sys.stdout)
+    return 1 if warm(roots, names, args.jobs, colors, args.quiet) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""Tests for the benchmark and regression harness"""
+
+import json
+import sys
+
+import pytest
+
+from bmadlib.loader import load_script
+from bmadlib.output import NoColors
+
+bench = load_script("benchmark.py")
+
+SMALL = {"seed": 7, "skills": 12, "goals": 5, "repeat": 5, "runs": 2, "warmup": 0, "cold_runs": 1}
+
+
+def stats(mean, ci=0.0):
+    return bench.Stats(n=5, mean=mean, ci=ci, median=mean, stdev=0.0, min=mean, ops=1)
+
+
+def test_summary_uses_a_t_interval():
+    result = bench.summarize([1.0, 2.0, 3.0], ops=10)
+
+    assert (result.n, result.mean, result.median, result.min, result.ops) == (3, 2.0, 2.0, 1.0, 10)
+    assert result.ci == pytest.approx(bench.t_critical(2) * 1.0 / 3 ** 0.5)
+    assert bench.summarize([4.0], ops=1).ci == 0.0
+    assert bench.t_critical(1000) == 1.96
+
+
+@pytest.mark.parametrize("current, expected", [
+    (stats(1.0), "ok"),
+    (stats(1.2), "ok"),
+    (stats(1.5), "regression"),
+    (stats(1.5, ci=0.4), "ok"),
+    (stats(0.5), "faster"),
+])
+def test_only_changes_beyond_the_interval_and_tolerance_count(current, expected):
+    assert bench.compare(current, {"mean": 1.0}, tolerance=0.25) == expected
+
+
+def test_entries_missing_from_the_baseline_are_new():
+    assert bench.compare(stats(1.0), None, 0.25) == "new"
+
+
+def test_synthetic_inputs_are_reproducible(tmp_path):
+    first, second = tmp_path / "a", tmp_path / "b"
+    bench.generate_inputs(first, SMALL)
+    bench.generate_inputs(second, SMALL)
+
+    files = sorted(p.relative_to(first) for p in first.rglob("SKILL.md"))
+    assert len(files) == SMALL["skills"]
+    assert files == sorted(p.relative_to(second) for p in second.rglob("SKILL.md"))
+    assert all((first / f).read_bytes() == (second / f).read_bytes() for f in files)
+
+
+def test_every_benchmark_runs_one_sample(tmp_path, monkeypatch):
+    bench.generate_inputs(tmp_path, SMALL)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BMAD_CACHE_DIR", str(tmp_path / "cache"))
+
+    for name in bench.BENCHMARKS:
+        seconds, ops = bench.cold_sample(name, tmp_path, SMALL)
+        assert ops > 0 and seconds > 0, name
+
+
+def test_regressions_are_flagged_in_the_table(capsys):
+    results = {"monitor.discover": {"warm": stats(2.0)}, "monitor.export_json": {"warm": stats(1.0)}}
+    baseline = {"monitor.discover": {"warm": {"mean": 1.0}}}
+
+    assert bench.print_results(results, baseline, 0.25, NoColors) == 1
+    rows = capsys.readouterr().out.splitlines()[-2:]
+    assert rows[0].endswith("REGRESSION") and "+100%" in rows[0]
+    assert rows[1].endswith("new")
+
+
+def test_baselines_from_another_format_version_are_ignored(tmp_path):
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps({"version": 0, "results": {"monitor.discover": {}}}), encoding="utf-8")
+
+    assert bench.load_baseline(path) == {}
+    assert bench.load_baseline(tmp_path / "missing.json") == {}
+
+
+def test_saved_baseline_is_compared_on_the_next_run(tmp_path, monkeypatch, capsys):
+    baseline = tmp_path / "baseline.json"
+    argv = ["benchmark.py", "--only", "wizard.recommend", "--runs", "2", "--warmup", "0", "--cold-runs", "1",
+            "--skills", "12", "--goals", "5", "--baseline", str(baseline)]
+
+    monkeypatch.setattr(sys, "argv", argv + ["--save-baseline"])
+    assert bench.main() == 0
+    saved = json.loads(baseline.read_text())
+    assert saved["version"] == bench.BASELINE_VERSION
+    assert set(saved["results"]["wizard.recommend"]) == {"cold", "warm"}
+
+    monkeypatch.setattr(sys, "argv", argv + ["--tolerance", "100"])
+    assert bench.main() == 0
+    assert "No regressions against baseline.json" in capsys.readouterr().out
+
+    monkeypatch.setattr(sys, "argv", ["benchmark.py", "--only", "nope"])
+    assert bench.main() == 2
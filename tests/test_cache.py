@@ -0,0 +1,136 @@
+"""Tests for the shared result cache: keys, eviction, expiry and locking"""
+
+import json
+import multiprocessing
+import os
+import threading
+
+import pytest
+
+from bmadlib.cache import Cache
+
+
+def make_cache(tmp_path, namespace="test", **options):
+    return Cache(namespace, str(tmp_path / "cache"), **options)
+
+
+def test_put_get_and_counters(tmp_path):
+    cache = make_cache(tmp_path)
+    key = Cache.key("analysis", 1)
+
+    assert cache.get(key) is None
+    cache.put(key, {"valid": True})
+
+    assert cache.get(key) == {"valid": True}
+    assert cache.counts["hits"] == 1
+    assert cache.counts["misses"] == 1
+    assert cache.counts["writes"] == 1
+
+
+def test_keys_follow_file_content(tmp_path):
+    path = tmp_path / "SKILL.md"
+    path.write_text("one")
+    first = Cache.key("skill", path)
+    path.write_text("two")
+    second = Cache.key("skill", path)
+    path.write_text("one")
+
+    assert first != second
+    assert Cache.key("skill", path) == first
+
+
+def test_get_or_compute_only_computes_on_a_miss(tmp_path):
+    cache = make_cache(tmp_path)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return [1, 2, 3]
+
+    assert cache.get_or_compute("k" * 64, compute) == [1, 2, 3]
+    assert cache.get_or_compute("k" * 64, compute) == [1, 2, 3]
+    assert len(calls) == 1
+
+
+def test_expired_entries_miss(tmp_path):
+    cache = make_cache(tmp_path, ttl=60)
+    key = Cache.key("old")
+    cache.put(key, 1)
+    entry = cache._entry(key)
+    data = json.loads(entry.read_text())
+    data["created"] -= 120
+    entry.write_text(json.dumps(data))
+
+    assert cache.get(key) is None
+    assert cache.counts["expired"] == 1
+
+
+def test_disabled_cache_stores_nothing(tmp_path):
+    cache = make_cache(tmp_path, enabled=False)
+    cache.put(Cache.key("x"), 1)
+
+    assert cache.get(Cache.key("x")) is None
+    assert not (tmp_path / "cache" / "test").exists()
+
+
+def test_eviction_removes_least_recently_used_entries_first(tmp_path):
+    cache = make_cache(tmp_path, max_size_mb=1)
+    value = "x" * 100_000
+    keys = [Cache.key(i) for i in range(8)]
+    for age, key in enumerate(keys):
+        cache.put(key, value)
+        # Oldest first: key 0 was used longest ago
+        stamp = 1_000_000 + age
+        os.utime(cache._entry(key), (stamp, stamp))
+    # A hit refreshes an old entry, so it survives
+    assert cache.get(keys[0]) == value
+
+    cache.max_bytes = 500_000
+    removed = cache.evict()
+
+    survivors = [i for i, key in enumerate(keys) if cache._entry(key).exists()]
+    assert removed == 5
+    assert survivors == [0, 6, 7]
+    _, total = cache._scan()
+    assert total <= 500_000 * 0.8
+
+
+def test_put_past_the_limit_evicts(tmp_path):
+    cache = make_cache(tmp_path, max_size_mb=0.5)
+    for i in range(10):
+        cache.put(Cache.key(i), "y" * 100_000)
+
+    _, total = cache._scan()
+    assert total <= cache.max_bytes
+    assert cache.counts["evictions"] > 0
+
+
+def _hit_and_flush(directory, rounds):
+    cache = Cache("shared", directory)
+    for i in range(rounds):
+        key = Cache.key("p", i)
+        if cache.get(key) is None:
+            cache.put(key, i)
+        cache.flush()
+
+
+def test_concurrent_flushes_do_not_lose_counts(tmp_path):
+    directory = str(tmp_path / "cache")
+    try:
+        context = multiprocessing.get_context("fork")
+    except ValueError:
+        pytest.skip("needs fork")
+    workers = [context.Process(target=_hit_and_flush, args=(directory, 25)) for _ in range(4)]
+    threads = [threading.Thread(target=_hit_and_flush, args=(directory, 25)) for _ in range(2)]
+    for worker in workers + threads:
+        worker.start()
+    for worker in workers:
+        worker.join(30)
+        assert worker.exitcode == 0
+    for thread in threads:
+        thread.join(30)
+
+    stats = json.loads((tmp_path / "cache" / "stats.json").read_text())
+    shared = stats["namespaces"]["shared"]
+    assert shared["hits"] + shared["misses"] == 6 * 25
+    assert shared["writes"] == shared["misses"]
@@ -0,0 +1,132 @@
+"""Tests for checkpointed workflow steps and resuming failed runs"""
+
+import pytest
+
+from bmadlib.loader import load_script
+
+progress = load_script("progress-visualizer.py")
+WorkflowStep = progress.WorkflowStep
+
+
+@pytest.fixture(autouse=True)
+def isolated(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BMAD_CHECKPOINT_DIR", str(tmp_path / "checkpoints"))
+    monkeypatch.setenv("BMAD_PROGRESS", "events")
+    monkeypatch.setenv("BMAD_PROGRESS_FILE", str(tmp_path / "events.ndjson"))
+    monkeypatch.delenv("BMAD_TRACE_DIR", raising=False)
+    yield
+    progress.close_event_stream()
+
+
+def workflow(run_id="run-1"):
+    return progress.WorkflowProgress("feature-delivery", "james", "*implement", checkpoint=run_id)
+
+
+def test_journal_round_trip_and_lookup(tmp_path):
+    journal = progress.CheckpointJournal("wf", "*cmd", "r1", directory=str(tmp_path))
+    journal.record(WorkflowStep.LOAD, "fp-1", {"files": 3}, 12.5)
+    journal.save()
+
+    reloaded = progress.CheckpointJournal("wf", "*cmd", "r1", directory=str(tmp_path))
+
+    assert reloaded.lookup(WorkflowStep.LOAD, "fp-1")["output"] == {"files": 3}
+    assert reloaded.lookup(WorkflowStep.LOAD, "fp-2") is None
+    assert reloaded.lookup(WorkflowStep.ASSESS, "fp-1") is None
+
+
+def test_unserialisable_output_is_not_recorded(tmp_path):
+    journal = progress.CheckpointJournal("wf", "*cmd", "r1", directory=str(tmp_path))
+
+    assert journal.record(WorkflowStep.LOAD, "fp", object(), 1.0) is None
+    assert WorkflowStep.LOAD.name not in journal.steps
+
+
+def test_corrupt_journal_is_treated_as_empty(tmp_path):
+    journal = progress.CheckpointJournal("wf", "*cmd", "r1", directory=str(tmp_path))
+    journal.path.parent.mkdir(parents=True, exist_ok=True)
+    journal.path.write_text("{not json")
+
+    assert progress.CheckpointJournal("wf", "*cmd", "r1", directory=str(tmp_path)).steps == {}
+
+
+def test_failed_run_resumes_after_the_last_completed_step():
+    calls = []
+
+    def step(name, fail=False):
+        def run():
+            calls.append(name)
+            if fail:
+                raise RuntimeError("boom")
+            return f"{name}-output"
+        return run
+
+    first = workflow()
+    first.start()
+    first.run_step(WorkflowStep.LOAD, step("load"), inputs={"task": "T-1"})
+    with pytest.raises(RuntimeError):
+        first.run_step(WorkflowStep.ASSESS, step("assess", fail=True))
+    assert first.journal.path.exists()
+
+    second = workflow()
+    second.start()
+    loaded = second.run_step(WorkflowStep.LOAD, step("load"), inputs={"task": "T-1"})
+    second.run_step(WorkflowStep.ASSESS, step("assess"))
+    second.complete()
+
+    assert loaded == "load-output"
+    assert calls == ["load", "assess", "assess"]
+    # A completed run forgets its checkpoints
+    assert not second.journal.path.exists()
+
+
+def test_changed_inputs_invalidate_the_step_and_everything_after_it():
+    calls = []
+
+    def record(name):
+        def run():
+            calls.append(name)
+            return name
+        return run
+
+    first = workflow()
+    first.start()
+    first.run_step(WorkflowStep.LOAD, record("load"), inputs={"task": "T-1"})
+    first.run_step(WorkflowStep.ASSESS, record("assess"))
+    first.error("stopped")
+
+    second = workflow()
+    second.start()
+    second.run_step(WorkflowStep.LOAD, record("load"), inputs={"task": "T-2"})
+    second.run_step(WorkflowStep.ASSESS, record("assess"))
+    second.error("stopped")
+
+    assert calls == ["load", "assess", "load", "assess"]
+
+
+def test_runs_with_other_ids_do_not_share_checkpoints():
+    calls = []
+    for run_id in ("run-a", "run-b"):
+        wf = workflow(run_id)
+        wf.start()
+        wf.run_step(WorkflowStep.LOAD, lambda: calls.append(run_id) or run_id)
+        wf.error("stopped")
+
+    assert calls == ["run-a", "run-b"]
+
+
+def test_unrecordable_output_invalidates_later_steps():
+    assessed = []
+
+    def run(task):
+        wf = workflow()
+        wf.start()
+        # A set is not JSON-serialisable, so LOAD's output cannot be journaled
+        loaded = wf.run_step(WorkflowStep.LOAD, lambda: {task})
+        result = wf.run_step(WorkflowStep.ASSESS, lambda: assessed.append(task) or max(loaded) / 2)
+        wf.error("stopped")
+        return result
+
+    assert run(20) == 10
+    assert run(40) == 20
+    assert assessed == [20, 40]
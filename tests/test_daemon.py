@@ -0,0 +1,100 @@
+"""Tests for the resident daemon's in-process script runs"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+
+from bmadlib.loader import SCRIPTS_DIR, load_script
+from bmadlib.rpc import request
+
+
+def run_progress(daemon):
+    reply = daemon.handle({"op": "run", "tool": "progress", "argv": [],
+                           "env": {"BMAD_PROGRESS": "events"}})
+    assert reply["ok"], reply
+    assert reply["exit"] == 0
+    return [json.loads(line) for line in reply["stderr"].splitlines() if line.startswith("{")]
+
+
+def test_each_progress_run_gets_its_own_events(tmp_path, monkeypatch):
+    daemon_module = load_script("bmad-daemon.py")
+    progress = daemon_module.load_script("progress")
+    monkeypatch.setattr(progress.time, "sleep", lambda seconds: None)
+    monkeypatch.chdir(tmp_path)
+    daemon = daemon_module.BMADDaemon(tmp_path)
+
+    first = run_progress(daemon)
+    second = run_progress(daemon)
+
+    assert first, "first request returned no progress events"
+    assert len(second) == len(first)
+    assert [e["event"] for e in second] == [e["event"] for e in first]
+    assert second[-1]["event"] == "end"
+
+
+def test_requests_wait_while_a_script_run_holds_process_state(tmp_path, monkeypatch):
+    daemon_module = load_script("bmad-daemon.py")
+    analytics = daemon_module.load_script("analytics")
+    monkeypatch.chdir(tmp_path)
+    daemon = daemon_module.BMADDaemon(tmp_path)
+    running, release = threading.Event(), threading.Event()
+
+    def slow_main():
+        running.set()
+        release.wait(5)
+        return 0
+
+    monkeypatch.setattr(analytics, "main", slow_main)
+    replies = {}
+    run = threading.Thread(target=lambda: replies.update(run=daemon.handle({"op": "run", "tool": "analytics"})))
+    run.start()
+    assert running.wait(5)
+
+    resolve = threading.Thread(target=lambda: replies.update(
+        resolve=daemon.handle({"op": "resolve", "name": "reveiw"})))
+    resolve.start()
+    resolve.join(0.2)
+    assert "resolve" not in replies
+    assert daemon.handle({"op": "ping"})["ok"]
+
+    release.set()
+    run.join(5)
+    resolve.join(5)
+    assert replies["run"]["exit"] == 0
+    assert replies["resolve"]["matches"][0]["name"] == "*review"
+
+
+def run_client(tmp_path, *args, **env):
+    environment = dict(os.environ, BMAD_DAEMON_SOCKET=str(tmp_path / "daemon.sock"))
+    environment.pop("BMAD_DAEMON", None)
+    environment.update(env)
+    return subprocess.run([sys.executable, os.path.join(SCRIPTS_DIR, "bmad-client.py"), *args],
+                          cwd=tmp_path, env=environment, capture_output=True, text=True, timeout=60)
+
+
+def test_client_runs_the_script_itself_without_a_daemon(tmp_path):
+    result = run_client(tmp_path, "wizard", "--recommend", "review code", "--top", "1")
+
+    assert result.returncode == 0, result.stderr
+    assert "*review" in result.stdout
+    assert not (tmp_path / "daemon.sock").exists()
+
+
+def test_client_starts_a_daemon_with_bmad_daemon_auto(tmp_path):
+    socket = str(tmp_path / "daemon.sock")
+    try:
+        result = run_client(tmp_path, "wizard", "--recommend", "review code", "--top", "1",
+                            BMAD_DAEMON="auto")
+        assert result.returncode == 0, result.stderr
+        assert "*review" in result.stdout
+
+        info = request({"op": "ping"}, socket, timeout=5)
+        # The startup ping, the client's run and this ping
+        assert info["requests"] >= 3
+    finally:
+        try:
+            request({"op": "stop"}, socket, timeout=5)
+        except OSError:
+            pass
@@ -0,0 +1,146 @@
+"""Tests for delta deployment: manifests, deltas and conflicts"""
+
+import os
+
+import pytest
+
+from bmadlib.loader import load_script
+
+deploy = load_script("deploy-projects.py")
+
+
+@pytest.fixture
+def payload(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.md").write_text("alpha\n")
+    (src / "b.md").write_text("beta\n")
+    return src
+
+
+def sources(src):
+    files = [(path, f"docs/{path.name}") for path in sorted(src.iterdir())]
+    return {dst: deploy.SourceFile(path, deploy.short_hash(path)) for path, dst in files}
+
+
+def run(target, src, **options):
+    result = deploy.deploy_target(target, "minimal", sources(src), **options)
+    assert result.error is None, result.error
+    return result
+
+
+def test_first_deploy_copies_and_second_is_a_no_op(tmp_path, payload):
+    target = tmp_path / "project"
+    target.mkdir()
+
+    first = run(target, payload)
+    second = run(target, payload)
+
+    assert sorted(first.added) == ["docs/a.md", "docs/b.md"]
+    assert (target / "docs/a.md").read_text() == "alpha\n"
+    assert second.unchanged == 2
+    assert not (second.added or second.updated or second.conflicts)
+
+
+def test_only_changed_sources_are_copied(tmp_path, payload):
+    target = tmp_path / "project"
+    target.mkdir()
+    run(target, payload)
+
+    (payload / "b.md").write_text("beta 2\n")
+    (payload / "c.md").write_text("gamma\n")
+    result = run(target, payload)
+
+    assert result.updated == ["docs/b.md"]
+    assert result.added == ["docs/c.md"]
+    assert result.unchanged == 1
+    assert (target / "docs/b.md").read_text() == "beta 2\n"
+
+
+def test_local_edit_is_a_conflict_until_forced(tmp_path, payload):
+    target = tmp_path / "project"
+    target.mkdir()
+    run(target, payload)
+    edited = target / "docs/a.md"
+    with open(edited, "a") as f:
+        f.write("local note\n")
+
+    dry = run(target, payload, dry_run=True)
+    kept = run(target, payload)
+    forced = run(target, payload, force=True)
+
+    assert dry.conflicts == ["docs/a.md"]
+    assert kept.conflicts == ["docs/a.md"]
+    assert forced.updated == ["docs/a.md"]
+    assert edited.read_text() == "alpha\n"
+
+
+def test_same_size_edit_with_restored_mtime_needs_force(tmp_path, payload):
+    target = tmp_path / "project"
+    target.mkdir()
+    run(target, payload)
+    edited = target / "docs/a.md"
+    st = edited.stat()
+    edited.write_text("ALPHA\n")
+    os.utime(edited, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    # Size and mtime still match the manifest, so only --force re-hashes
+    assert run(target, payload).unchanged == 2
+    assert run(target, payload, force=True).updated == ["docs/a.md"]
+
+
+def test_manifest_records_hash_size_and_mtime(tmp_path, payload):
+    target = tmp_path / "project"
+    target.mkdir()
+    run(target, payload)
+
+    deployed, _ = deploy.read_manifest(target / deploy.MANIFESTS["minimal"])
+    entry = deployed["docs/a.md"]
+    st = (target / "docs/a.md").stat()
+
+    assert entry.hash == deploy.short_hash(payload / "a.md")
+    assert (entry.size, entry.mtime) == (st.st_size, st.st_mtime_ns)
+
+
+def test_manifest_header_is_kept(tmp_path):
+    manifest = tmp_path / "install-manifest.yaml"
+    manifest.write_text("version: 4.0.0\nfiles:\n  - path: docs/a.md\n    hash: abc\n    modified: false\n")
+
+    deployed, header = deploy.read_manifest(manifest)
+    deploy.write_manifest(manifest, "minimal", deployed, set(), header)
+
+    text = manifest.read_text()
+    assert text.startswith("version: 4.0.0\n")
+    assert deploy.read_manifest(manifest)[0]["docs/a.md"].hash == "abc"
+
+
+def test_prune_removes_unedited_files_only(tmp_path, payload):
+    target = tmp_path / "project"
+    target.mkdir()
+    (payload / "c.md").write_text("gamma\n")
+    run(target, payload)
+    (payload / "b.md").unlink()
+    (payload / "c.md").unlink()
+    (target / "docs/c.md").write_text("edited\n")
+
+    kept = run(target, payload)
+    assert kept.removed == []
+    assert (target / "docs/b.md").exists()
+
+    pruned = run(target, payload, prune=True)
+    assert pruned.removed == ["docs/b.md"]
+    assert not (target / "docs/b.md").exists()
+    assert (target / "docs/c.md").read_text() == "edited\n"
+
+
+def test_runtime_state_is_not_part_of_the_payload(tmp_path):
+    root = tmp_path
+    for rel in (".claude/skills/x/SKILL.md", ".claude/cache/entry.json", ".claude/telemetry/step-timings.json",
+                ".claude/checkpoints/run.json", ".claude/skills/cache/SKILL.md"):
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+
+    files = [dst for _, dst in deploy._walk(root / ".claude", ".claude", root)]
+
+    assert files == [".claude/skills/cache/SKILL.md", ".claude/skills/x/SKILL.md"]
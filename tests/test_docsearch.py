@@ -0,0 +1,131 @@
+"""Tests for the section-level documentation index"""
+
+import os
+
+import pytest
+
+from bmadlib.docsearch import DocsIndex, find_root, make_snippet, split_sections
+from bmadlib.search import tokenize
+
+
+GUIDE = """# Deployment Guide
+
+Intro text.
+
+## Rollback
+
+To roll back a deployment, restore the previous release tag.
+
+```
+# not a heading
+```
+
+## Monitoring
+
+Watch the error dashboards after release.
+"""
+
+BUNDLE = """==================== START: .bmad-core/tasks/review.md ====================
+# Review Task
+
+Review the story against its acceptance criteria.
+==================== END: .bmad-core/tasks/review.md ====================
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "deployment-guide.md").write_text(GUIDE, encoding="utf-8")
+    (tmp_path / "docs" / "notes.txt").write_text("Plain notes about sprint planning.\n", encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture
+def index(project):
+    index = DocsIndex(project, db_path=str(project / "cache" / "docs.db"))
+    yield index
+    index.close()
+
+
+def test_sections_split_on_headings_outside_code_fences():
+    sections = list(split_sections(GUIDE))
+
+    assert [heading for _, heading, _, _ in sections] == ["Deployment Guide", "Rollback", "Monitoring"]
+    rollback = sections[1]
+    assert rollback[2] == 5
+    assert "# not a heading" in rollback[3]
+
+
+def test_bundle_markers_set_the_embedded_resource():
+    sections = list(split_sections(BUNDLE))
+
+    assert sections == [(".bmad-core/tasks/review.md", "Review Task", 2,
+                         "\nReview the story against its acceptance criteria.")]
+
+
+def test_search_returns_the_matching_section_with_a_snippet(index):
+    index.refresh()
+    results = index.search("roll back release")
+
+    best = results[0]
+    assert (best["path"], best["heading"], best["line"]) == ("docs/deployment-guide.md", "Rollback", 5)
+    assert best["snippet"].startswith("To roll back a deployment")
+    assert index.search("kubernetes") == []
+    assert index.search("the") == []
+
+
+def test_refresh_only_reindexes_changed_files(index, project):
+    assert index.refresh() == {"scanned": 2, "updated": 2, "removed": 0}
+    assert index.refresh() == {"scanned": 2, "updated": 0, "removed": 0}
+
+    guide = project / "docs" / "deployment-guide.md"
+    stat = guide.stat()
+    os.utime(guide, (stat.st_atime, stat.st_mtime + 10))
+    assert index.refresh()["updated"] == 0
+
+    guide.write_text(GUIDE + "\n## Canary\n\nShift traffic gradually.\n", encoding="utf-8")
+    (project / "docs" / "notes.txt").unlink()
+    assert index.refresh() == {"scanned": 1, "updated": 1, "removed": 1}
+    assert index.search("canary traffic")[0]["heading"] == "Canary"
+    assert index.search("sprint planning") == []
+
+
+def test_verbatim_copies_are_indexed_once_and_shown_once(index, project):
+    core = project / ".bmad-core"
+    core.mkdir()
+    (core / "deployment-guide.md").write_text(GUIDE, encoding="utf-8")
+    index.refresh()
+
+    assert index.stats()["sections"] == 7
+    results = index.search("rollback")
+    assert [r["heading"] for r in results].count("Rollback") == 1
+
+
+def test_index_persists_between_processes(project):
+    db = str(project / "cache" / "docs.db")
+    first = DocsIndex(project, db_path=db)
+    first.refresh()
+    first.close()
+
+    second = DocsIndex(project, db_path=db)
+    try:
+        assert second.refresh()["updated"] == 0
+        assert second.search("monitoring dashboards")[0]["heading"] == "Monitoring"
+    finally:
+        second.close()
+
+
+def test_find_root_walks_up_to_the_project(project):
+    nested = project / "src" / "app"
+    nested.mkdir(parents=True)
+
+    assert find_root(nested) == project.resolve()
+
+
+def test_snippets_are_truncated():
+    body = "unrelated line\n" + "deploy " * 100
+    snippet = make_snippet(body, set(tokenize("deploy")), width=50)
+
+    assert snippet.startswith("deploy")
+    assert len(snippet) <= 50 and snippet.endswith("…")
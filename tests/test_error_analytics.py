@@ -0,0 +1,47 @@
+"""Tests for the streaming error analytics"""
+
+from bmadlib.loader import load_script
+
+analytics = load_script("error-analytics.py")
+
+
+def test_topk_counts_exactly_within_capacity():
+    top = analytics.TopK(capacity=3)
+    for key in "aababc":
+        top.add(key)
+
+    assert top.top(3) == [("a", 3, 0), ("b", 2, 0), ("c", 1, 0)]
+
+
+def test_topk_evicts_the_smallest_count_and_records_its_error():
+    top = analytics.TopK(capacity=2)
+    for key in ["a", "a", "a", "b", "c"]:
+        top.add(key)
+
+    # "b" (count 1) is evicted; "c" inherits its count as error
+    assert top.top(2) == [("a", 3, 0), ("c", 2, 1)]
+    assert len(top.counts) == 2
+
+
+def test_topk_keeps_heavy_hitters_in_a_long_tail():
+    top = analytics.TopK(capacity=10)
+    for i in range(1000):
+        top.add("hot")
+        top.add(f"rare-{i}")
+        if i % 2:
+            top.add("warm")
+
+    ranked = top.top(2)
+    assert [key for key, _, _ in ranked] == ["hot", "warm"]
+    for key, count, error in ranked:
+        true_count = 1000 if key == "hot" else 500
+        # Space-Saving: count is an upper bound and count - error a lower bound
+        assert count - error <= true_count <= count
+
+
+def test_topk_ties_are_ordered_by_key():
+    top = analytics.TopK(capacity=5)
+    for key in ["b", "a", "c"]:
+        top.add(key, 2)
+
+    assert [key for key, _, _ in top.top(3)] == ["a", "b", "c"]
@@ -0,0 +1,123 @@
+"""Tests for the SQLite error sink"""
+
+import sqlite3
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from bmadlib.loader import load_script
+
+handler = load_script("error-handler.py")
+
+
+def make_error(category="validation", severity="error", template="invalid_input", when=None):
+    error = handler.BMADError(
+        category=handler.ErrorCategory(category),
+        severity=handler.ErrorSeverity(severity),
+        message="Input validation failed",
+        context={"command": "*implement"},
+        template=template
+    )
+    if when is not None:
+        error.timestamp = when.isoformat()
+    return error
+
+
+def stored_rows(path) -> int:
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM errors").fetchone()[0]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "errors.db")
+
+
+@pytest.fixture
+def sink(db_path):
+    sink = handler.SQLiteErrorSink(db_path, batch_size=3, flush_interval=60)
+    yield sink
+    sink.close()
+
+
+def test_records_are_written_when_the_batch_fills(sink, db_path):
+    sink.write(make_error())
+    sink.write(make_error())
+    assert stored_rows(db_path) == 0
+
+    sink.write(make_error())
+    assert stored_rows(db_path) == 3
+
+
+def test_a_quiet_sink_flushes_on_its_timer(db_path):
+    sink = handler.SQLiteErrorSink(db_path, batch_size=100, flush_interval=0.05)
+    try:
+        sink.write(make_error())
+        deadline = time.monotonic() + 5
+        while stored_rows(db_path) == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert stored_rows(db_path) == 1
+    finally:
+        sink.close()
+
+
+def test_close_writes_pending_records(sink, db_path):
+    sink.write(make_error())
+    sink.close()
+
+    assert stored_rows(db_path) == 1
+
+
+def test_failed_flush_keeps_rows_pending(sink, db_path):
+    sink.write(make_error())
+    sink._conn.execute("PRAGMA busy_timeout = 0")
+    blocker = sqlite3.connect(db_path, isolation_level=None)
+    blocker.execute("BEGIN IMMEDIATE")
+    try:
+        with pytest.raises(sqlite3.OperationalError):
+            sink.flush()
+        assert len(sink._pending) == 1
+    finally:
+        blocker.execute("ROLLBACK")
+        blocker.close()
+
+    sink.flush()
+    assert stored_rows(db_path) == 1
+    assert sink._pending == []
+
+
+def test_queries_filter_by_date_range_and_columns(sink):
+    now = datetime.now()
+    sink.write(make_error(when=now - timedelta(days=3)))
+    sink.write(make_error(category="guardrail", severity="critical", template="guardrail_violation",
+                          when=now - timedelta(days=1)))
+    sink.write(make_error(when=now))
+
+    recent = sink.query(since=now - timedelta(days=2))
+    assert [r["category"] for r in recent] == ["validation", "guardrail"]
+    older = sink.query(until=now - timedelta(days=2))
+    assert len(older) == 1
+    assert sink.query(severity="critical")[0]["template"] == "guardrail_violation"
+    assert sink.counts("category") == {"validation": 2, "guardrail": 1}
+    assert sink.counts("severity", since=now - timedelta(days=2)) == {"error": 1, "critical": 1}
+    with pytest.raises(ValueError):
+        sink.counts("message")
+
+
+def test_retention_and_compaction_free_every_page(db_path):
+    sink = handler.SQLiteErrorSink(db_path, batch_size=500)
+    try:
+        old = datetime.now() - timedelta(days=10)
+        for _ in range(2000):
+            sink.write(make_error(when=old))
+        sink.write(make_error())
+
+        assert sink.apply_retention(max_age_days=5) == 2000
+        assert sink._conn.execute("PRAGMA freelist_count").fetchone()[0] > 1
+        sink.compact()
+
+        assert sink._conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+        assert len(sink.query()) == 1
+    finally:
+        sink.close()
@@ -0,0 +1,125 @@
+"""Tests for headless NDJSON progress events"""
+
+import io
+import json
+import threading
+
+import pytest
+
+from bmadlib.loader import load_script
+
+progress = load_script("progress-visualizer.py")
+WorkflowStep = progress.WorkflowStep
+
+
+class TTY(io.StringIO):
+    def isatty(self):
+        return True
+
+
+def events(text):
+    return [json.loads(line) for line in text.splitlines()]
+
+
+@pytest.fixture
+def renderer():
+    stream = io.StringIO()
+    renderer = progress.EventStreamRenderer(stream=stream)
+    yield renderer
+    renderer.close()
+
+
+def run_workflow(renderer, name):
+    t = progress.ProgressTracker(renderer=renderer, show_eta=False, show_elapsed=False)
+    t.start(name)
+    t.update_step(WorkflowStep.LOAD, "Loading context")
+    t.update_substep("reading spec")
+    t.complete("Done")
+    return t
+
+
+def test_a_run_is_reported_as_start_step_substep_end(renderer):
+    run_workflow(renderer, "james - *implement")
+    assert renderer.flush()
+
+    records = events(renderer.stream.getvalue())
+    assert [r["event"] for r in records] == ["start", "step", "substep", "end"]
+    assert {r["run"] for r in records} == {1}
+    assert {r["op"] for r in records} == {"james - *implement"}
+    assert records[1]["detail"] == "Loading context"
+    assert records[2]["detail"] == "reading spec"
+    assert records[-1]["outcome"] == "success"
+    assert records[-1]["message"] == "Done"
+    assert records[-1]["steps"][0]["step"] == "LOAD"
+
+
+def test_decorations_are_dropped_and_free_messages_kept(renderer):
+    t = progress.ProgressTracker(renderer=renderer, show_eta=False, show_elapsed=False)
+    renderer.message("banner line", t)
+    renderer.message(f"{progress.Colors.GREEN}  all good  {progress.Colors.ENDC}")
+    renderer.flush()
+
+    records = events(renderer.stream.getvalue())
+    assert [(r["event"], r["text"]) for r in records] == [("message", "all good")]
+
+
+def test_concurrent_runs_get_distinct_run_numbers(renderer):
+    threads = [threading.Thread(target=run_workflow, args=(renderer, f"workflow {n}")) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    renderer.flush()
+
+    records = events(renderer.stream.getvalue())
+    runs = {r["op"]: r["run"] for r in records if r["event"] == "start"}
+    assert sorted(runs.values()) == list(range(1, 9))
+    assert all(r["run"] == runs[r["op"]] for r in records)
+
+
+def test_flush_returns_only_once_earlier_events_are_written():
+    stream = io.StringIO()
+    renderer = progress.EventStreamRenderer(stream=stream)
+    missing = []
+
+    def emit(n):
+        for i in range(200):
+            renderer.message(f"thread {n} message {i}")
+            renderer.flush()
+            if f"thread {n} message {i}\"" not in stream.getvalue():
+                missing.append((n, i))
+
+    threads = [threading.Thread(target=emit, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    renderer.close()
+
+    assert missing == []
+
+
+def test_events_can_go_to_a_file(tmp_path):
+    path = tmp_path / "events.ndjson"
+    renderer = progress.EventStreamRenderer(path=str(path))
+    run_workflow(renderer, "quinn - *review")
+    renderer.close()
+
+    assert [r["event"] for r in events(path.read_text())] == ["start", "step", "substep", "end"]
+    assert renderer._file is None
+
+
+@pytest.mark.parametrize("env, stream, expected", [
+    ({"BMAD_PROGRESS": "events"}, TTY(), True),
+    ({"BMAD_PROGRESS": "terminal"}, io.StringIO(), False),
+    ({"BMAD_PROGRESS_FILE": "/tmp/x"}, TTY(), True),
+    ({}, TTY(), False),
+    ({}, io.StringIO(), True),
+])
+def test_headless_mode_detection(monkeypatch, env, stream, expected):
+    for name in ("BMAD_PROGRESS", "BMAD_PROGRESS_FD", "BMAD_PROGRESS_FILE"):
+        monkeypatch.delenv(name, raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+
+    assert progress.headless_requested(stream) is expected
@@ -0,0 +1,80 @@
+"""Tests for typo-tolerant name matching"""
+
+import pytest
+
+from bmadlib.fuzzy import FuzzyIndex, edit_distance, normalize, trigrams
+
+
+@pytest.mark.parametrize("a, b, expected", [
+    ("review", "review", 0),
+    ("review", "reviw", 1),       # deletion
+    ("review", "revieww", 1),     # insertion
+    ("review", "reviex", 1),      # substitution
+    ("review", "reveiw", 1),      # transposition counts as one edit
+    ("ca", "abc", 3),             # OSA, unlike Damerau-Levenshtein (2)
+    ("", "abc", 3),
+])
+def test_edit_distance(a, b, expected):
+    assert edit_distance(a, b) == expected
+    assert edit_distance(b, a) == expected
+
+
+def test_edit_distance_stops_early_past_the_limit():
+    assert edit_distance("implement", "review", limit=2) == 3
+    assert edit_distance("a", "abcdef", limit=2) == 3
+    assert edit_distance("reviw", "review", limit=2) == 1
+
+
+def test_normalize_and_trigrams():
+    assert normalize(" *Validate_Quality Gate ") == "validate-quality-gate"
+    assert trigrams("ab") == {"  a", " ab", "ab "}
+
+
+@pytest.fixture
+def index():
+    index = FuzzyIndex()
+    for name in ("*review", "*implement", "*validate-quality-gate", "*fix", "*refactor"):
+        index.add(name, ("command", name))
+    index.add("quinn", ("subagent", "quinn"))
+    index.add("quality", ("subagent", "quinn"))
+    return index
+
+
+def test_exact_and_misspelt_names_resolve(index):
+    assert index.resolve("*review") == ("command", "*review")
+    assert index.resolve("REVIEW") == ("command", "*review")
+    assert index.resolve("*reviw") == ("command", "*review")
+    assert index.resolve("*implemnet") == ("command", "*implement")
+    assert index.resolve("*validate-qualty-gate") == ("command", "*validate-quality-gate")
+
+
+def test_matches_are_ranked_by_distance(index):
+    matches = index.lookup("*reviw")
+
+    assert matches[0].name == "*review"
+    assert matches[0].distance == 1
+    assert 0 < matches[0].score < 1
+    assert index.lookup("review")[0].score == 1.0
+
+
+def test_prefixes_match_after_typos(index):
+    matches = index.lookup("valid")
+
+    assert matches[0].target == ("command", "*validate-quality-gate")
+
+
+def test_aliases_share_a_target(index):
+    assert index.resolve("qualty") == ("subagent", "quinn")
+    assert len(index) == 7
+
+
+def test_unrelated_and_ambiguous_queries_do_not_resolve():
+    index = FuzzyIndex()
+    index.add("cat", "cat")
+    index.add("car", "car")
+
+    assert index.resolve("xyzzy") is None
+    assert index.lookup("") == []
+    # One edit from both: no unambiguous answer
+    assert index.resolve("cab") is None
+    assert {m.target for m in index.lookup("cab")} == {"cat", "car"}
@@ -0,0 +1,128 @@
+"""Tests for the parallel health-check engine"""
+
+import io
+import json
+import sys
+import threading
+import time
+
+import pytest
+
+from bmadlib.loader import load_script
+
+health = load_script("health-check.py")
+
+SKILL = """---
+name: {name}
+description: A test skill
+---
+
+# {name}
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    for category in health.CATEGORIES[:2]:
+        skill = tmp_path / ".claude" / "skills" / category / f"{category}-skill"
+        skill.mkdir(parents=True)
+        (skill / "SKILL.md").write_text(SKILL.format(name=f"{category}-skill"), encoding="utf-8")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "guide.md").write_text("# Guide\n", encoding="utf-8")
+    monkeypatch.setenv("BMAD_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def make_check(number, func, timeout=5.0):
+    return health.Check(number, f"check {number}", func, timeout)
+
+
+def test_results_come_back_in_declaration_order(project):
+    results = health.run_checks(project)
+
+    assert [r.number for r in results] == list(range(2, len(health.CHECKS) + 2))
+    by_title = {r.title: r for r in results}
+    assert by_title["Counting skills..."].lines[0] == ("info", "Found: 2 skills")
+    categories = by_title["Checking skills by category..."].lines
+    assert categories[0] == ("item", f"{health.CATEGORIES[0]}: 1 skills")
+    assert categories[-1][0] == "warn"
+
+
+def test_a_hung_check_times_out_without_holding_up_the_others(project):
+    release = threading.Event()
+    checks = [make_check(2, lambda scan: release.wait(5) and []), make_check(3, lambda scan: [("pass", "fine")])]
+    start = time.monotonic()
+    try:
+        slow, fast = health.run_checks(project, checks, timeout_scale=0.02)
+    finally:
+        release.set()
+
+    assert time.monotonic() - start < 2
+    assert slow.timed_out and slow.status == "fail"
+    assert slow.lines[0][1].startswith("Timed out after 0.1s")
+    assert fast.lines == [("pass", "fine")]
+
+
+def test_a_raising_check_is_reported_as_a_failure(project):
+    def broken(scan):
+        raise PermissionError("denied")
+
+    (result,) = health.run_checks(project, [make_check(2, broken)])
+    assert result.lines == [("fail", "Check raised PermissionError: denied")]
+
+
+def test_concurrent_checks_share_one_walk(project, monkeypatch):
+    walks = []
+    real_walk = health.os.walk
+
+    def counting_walk(top, *args, **kwargs):
+        walks.append(top)
+        time.sleep(0.01)
+        return real_walk(top, *args, **kwargs)
+
+    monkeypatch.setattr(health.os, "walk", counting_walk)
+    checks = [make_check(n, lambda scan: [("info", str(len(scan.ensure().skill_files)))]) for n in range(2, 10)]
+    results = health.run_checks(project, checks)
+
+    assert len(walks) == 2
+    assert {r.lines[0][1] for r in results} == {"2"}
+
+
+def test_status_is_the_worst_line_and_summary_counts_lines():
+    results = [
+        health.CheckResult(2, "a", [("info", "x"), ("item", "y")]),
+        health.CheckResult(3, "b", [("pass", "x"), ("warn", "y")]),
+        health.CheckResult(4, "c", [("warn", "x"), ("fail", "y")]),
+        health.CheckResult(5, "d", [("info", "x")]),
+    ]
+
+    assert [r.status for r in results] == ["pass", "warn", "fail", "info"]
+    assert health.summarize(results) == {"errors": 1, "warnings": 2, "passed": 2}
+
+
+def test_results_print_in_the_shell_script_format():
+    out = io.StringIO()
+    health.print_results([health.CheckResult(2, "Checking things...", [("pass", "Good"), ("info", "detail")])],
+                         health.colors_for(out), out)
+
+    assert out.getvalue() == "\n2. Checking things...\n✅ Good\n   detail\n"
+
+
+def test_main_writes_a_json_report(project, monkeypatch, capsys):
+    report = project / "health.json"
+    monkeypatch.setattr(sys, "argv", ["health-check.py", "--quiet", "--json", str(report)])
+    health.main()
+
+    data = json.loads(report.read_text())
+    assert [c["number"] for c in data["checks"]] == list(range(2, len(health.CHECKS) + 2))
+    assert data["summary"]["passed"] >= 1
+    assert "📊 Health Check Summary" in capsys.readouterr().out
+
+
+def test_main_outside_a_project_fails_fast(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", ["health-check.py"])
+
+    assert health.main() == 1
+    assert "Not in project root" in capsys.readouterr().out
@@ -0,0 +1,112 @@
+"""Tests for the Prometheus metrics registry and text format"""
+
+import urllib.error
+import urllib.request
+
+import pytest
+
+from bmadlib.metrics import Registry, serve
+
+
+@pytest.fixture
+def registry():
+    return Registry()
+
+
+def test_counter_renders_help_type_and_sorted_samples(registry):
+    errors = registry.counter("bmad_errors_total", "Errors handled", ["category", "severity"])
+    errors.inc(category="validation", severity="error")
+    errors.inc(2, category="guardrail", severity="critical")
+
+    assert registry.render() == (
+        "# HELP bmad_errors_total Errors handled\n"
+        "# TYPE bmad_errors_total counter\n"
+        'bmad_errors_total{category="guardrail",severity="critical"} 2\n'
+        'bmad_errors_total{category="validation",severity="error"} 1\n'
+    )
+
+
+def test_counters_only_go_up_and_check_labels(registry):
+    errors = registry.counter("errors_total", "Errors", ["category"])
+    with pytest.raises(ValueError):
+        errors.inc(-1, category="x")
+    with pytest.raises(ValueError):
+        errors.inc(severity="x")
+
+
+def test_gauge_values_and_replace(registry):
+    skills = registry.gauge("bmad_skills", "Skills", ["category", "status"])
+    skills.set(3, category="planning", status="valid")
+    skills.replace({("quality", "valid"): 5, ("quality", "invalid"): 1})
+    plain = registry.gauge("bmad_last_scan_timestamp_seconds", "Last scan")
+    plain.set(1700000000.5)
+
+    text = registry.render()
+
+    assert 'category="planning"' not in text
+    assert 'bmad_skills{category="quality",status="invalid"} 1\n' in text
+    assert "bmad_last_scan_timestamp_seconds 1700000000.5\n" in text
+    assert skills.value(category="quality", status="valid") == 5
+
+
+def test_histogram_buckets_are_cumulative(registry):
+    durations = registry.histogram("step_seconds", "Step time", ["step"], buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.7, 3.0):
+        durations.observe(value, step="execute")
+
+    lines = registry.render().splitlines()
+
+    assert lines[1] == "# TYPE step_seconds histogram"
+    assert lines[2:] == [
+        'step_seconds_bucket{step="execute",le="0.1"} 1',
+        'step_seconds_bucket{step="execute",le="1"} 3',
+        'step_seconds_bucket{step="execute",le="+Inf"} 4',
+        'step_seconds_sum{step="execute"} 4.25',
+        'step_seconds_count{step="execute"} 4',
+    ]
+    assert durations.count(step="execute") == 4
+
+
+def test_label_values_and_help_are_escaped(registry):
+    counter = registry.counter("odd_total", 'Help with \\ and\nnewline', ["path"])
+    counter.inc(path='C:\\dir\\"x"\n')
+
+    text = registry.render()
+
+    assert "# HELP odd_total Help with \\\\ and\\nnewline\n" in text
+    assert 'odd_total{path="C:\\\\dir\\\\\\"x\\"\\n"} 1\n' in text
+
+
+def test_registry_returns_the_same_metric_and_rejects_kind_changes(registry):
+    first = registry.counter("requests_total", "Requests", ["op"])
+
+    assert registry.counter("requests_total", "Requests", ["op"]) is first
+    with pytest.raises(ValueError):
+        registry.gauge("requests_total", "Requests")
+
+
+def test_metrics_are_rendered_in_name_order(registry):
+    registry.gauge("b_metric", "B").set(1)
+    registry.gauge("a_metric", "A").set(2)
+
+    names = [line.split()[2] for line in registry.render().splitlines() if line.startswith("# TYPE")]
+
+    assert names == ["a_metric", "b_metric"]
+
+
+def test_serve_exposes_the_registry(registry):
+    registry.counter("served_total", "Served").inc()
+    server = serve(0, registry=registry)
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+            body = response.read().decode()
+            content_type = response.headers["Content-Type"]
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/other", timeout=5)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert "served_total 1\n" in body
+    assert content_type.startswith("text/plain; version=0.0.4")
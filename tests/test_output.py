@@ -0,0 +1,153 @@
+"""Tests for the buffered report writer and shared colors"""
+
+import io
+import os
+
+import pytest
+
+from bmadlib import output
+from bmadlib.cache import Cache
+from bmadlib.loader import load_script
+from bmadlib.output import Colors, NoColors, Report, colors_for, limited
+
+
+class CountingStream(io.StringIO):
+    """Records every write"""
+
+    def __init__(self, tty=False):
+        super().__init__()
+        self.tty = tty
+        self.chunks = []
+
+    def write(self, text):
+        self.chunks.append(text)
+        return super().write(text)
+
+    def isatty(self):
+        return self.tty
+
+
+class ClosedPipe(io.StringIO):
+    def write(self, text):
+        raise BrokenPipeError
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    monkeypatch.delenv("NO_COLOR", raising=False)
+    monkeypatch.delenv("BMAD_COLOR", raising=False)
+    return monkeypatch
+
+
+def test_colors_follow_the_stream_and_environment(clean_env):
+    assert colors_for(CountingStream(tty=True)) is Colors
+    assert colors_for(CountingStream()) is NoColors
+    clean_env.setenv("BMAD_COLOR", "1")
+    assert colors_for(CountingStream()) is Colors
+    clean_env.setenv("NO_COLOR", "1")
+    assert colors_for(CountingStream(tty=True)) is NoColors
+
+
+def test_limited_reports_how_many_were_left_out():
+    assert limited([1, 2, 3, 4], 3) == ([1, 2, 3], 1)
+    assert limited([1, 2], 3) == ([1, 2], 0)
+    assert limited([1, 2], 0) == ([1, 2], 0)
+    assert limited([1, 2], None) == ([1, 2], 0)
+
+
+def test_lines_are_written_in_chunks():
+    stream = CountingStream()
+    with Report(stream, chunk_lines=3) as report:
+        for i in range(7):
+            report.line(f"line {i}")
+        assert len(stream.chunks) == 2
+        report.lines_from(["a", "b"])
+        assert report.lines == 9
+
+    assert stream.getvalue() == "".join(f"line {i}\n" for i in range(7)) + "a\nb\n"
+    assert len(stream.chunks) == 3
+
+
+def test_nested_with_blocks_close_at_the_outermost():
+    stream = CountingStream()
+    with Report(stream) as report:
+        with report as inner:
+            inner.line("inner")
+        assert stream.getvalue() == ""
+    assert stream.getvalue() == "inner\n"
+
+
+def test_more_notes_hidden_entries():
+    stream = CountingStream()
+    with Report(stream, colors=NoColors) as report:
+        report.more(0, "skills")
+        report.more(1, "skills")
+        report.more(5, "skills", indent="")
+
+    assert stream.getvalue() == ("  … 1 more skill (--limit 0 shows all)\n"
+                                 "… 5 more skills (--limit 0 shows all)\n")
+
+
+def test_a_closed_pipe_drops_the_rest_quietly():
+    report = Report(ClosedPipe(), chunk_lines=1)
+    report.line("first")
+    report.line("second")
+    report.close()
+
+    assert report._broken
+
+
+def test_tall_reports_are_paged_only_on_a_terminal(monkeypatch):
+    paged = []
+    monkeypatch.setattr(output, "_page", lambda text: paged.append(text) or True)
+    monkeypatch.setattr("shutil.get_terminal_size", lambda: os.terminal_size((80, 5)))
+
+    tty = CountingStream(tty=True)
+    with Report(tty, pager=True) as report:
+        report.lines_from(f"row {i}" for i in range(2000))
+    assert len(paged) == 1 and paged[0].count("\n") == 2000
+    assert tty.getvalue() == ""
+
+    short = CountingStream(tty=True)
+    with Report(short, pager=True) as report:
+        report.line("fits")
+    assert short.getvalue() == "fits\n" and len(paged) == 1
+
+    pipe = CountingStream()
+    with Report(pipe, pager=True, chunk_lines=10) as report:
+        for i in range(20):
+            report.line(f"row {i}")
+    assert len(pipe.chunks) == 2 and len(paged) == 1
+
+
+def test_skill_listing_limits_each_category(tmp_path):
+    monitor_module = load_script("monitor-skills.py")
+    monitor = monitor_module.SkillMonitor(str(tmp_path / ".claude" / "skills"), cache=Cache(str(tmp_path / "cache")))
+    monitor.skills = [monitor_module.SkillInfo(
+        name=f"skill-{i}", category="planning", path=f"planning/skill-{i}/SKILL.md", exists=True, valid=True,
+        has_frontmatter=True, frontmatter={}, size_bytes=1024, line_count=10, errors=[]) for i in range(5)]
+    monitor.categories = {"planning": [s.name for s in monitor.skills]}
+
+    stream = CountingStream()
+    monitor.print_by_category(Report(stream, colors=NoColors), limit=2)
+
+    text = stream.getvalue()
+    assert "skill-1 " in text and "skill-2 " not in text
+    assert "… 3 more skills (--limit 0 shows all)" in text
+
+
+def test_wizard_listing_supports_limit_and_summary(capsys):
+    wizard = load_script("bmad-wizard.py")
+
+    wizard.browse_all_commands(summary=True, c=NoColors)
+    summary = capsys.readouterr().out
+    assert summary.count("► ") == len(wizard.COMMANDS)
+    assert " commands  " in summary
+
+    wizard.browse_all_commands(limit=1, c=NoColors)
+    limited_out = capsys.readouterr().out
+    for info in wizard.COMMANDS.values():
+        hidden = len(info["commands"]) - 1
+        if hidden:
+            noun = "command" if hidden == 1 else "commands"
+            assert f"… {hidden} more {noun} (--limit 0 shows all)" in limited_out
@@ -0,0 +1,147 @@
+"""Tests for the streaming performance report"""
+
+import gzip
+import io
+import json
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+from bmadlib.loader import load_script
+
+report_mod = load_script("performance-report.py")
+
+START = datetime(2026, 3, 2, 9, 0, 0)
+
+
+def record(command="*implement", duration=100.0, when=START, outcome="success", steps=None):
+    data = {"timestamp": when.isoformat(), "command": command, "duration_ms": duration, "outcome": outcome}
+    if steps is not None:
+        data["steps"] = steps
+    return data
+
+
+def write_log(path, records, compress=False):
+    text = "".join(json.dumps(r) + "\n" for r in records)
+    if compress:
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_percentiles_and_error_rate():
+    report = report_mod.TelemetryReport()
+    for i in range(1, 101):
+        report.add(record(duration=float(i), outcome="error" if i % 10 == 0 else "success"))
+
+    summary = report.report()["summary"]
+    assert summary["operations"] == 100
+    assert summary["p50_ms"] == pytest.approx(50, rel=0.05)
+    assert summary["p99_ms"] == pytest.approx(99, rel=0.05)
+    assert summary["max_ms"] == 100
+    assert summary["error_rate"] == 0.1
+
+
+def test_records_without_durations_are_skipped_and_periods_filter():
+    report = report_mod.TelemetryReport(since=START.timestamp(), until=(START + timedelta(hours=2)).timestamp())
+    report.add({"command": "*implement"})
+    report.add(record(when=START - timedelta(minutes=1)))
+    report.add(record(when=START))
+    report.add(record(when=START + timedelta(hours=1, minutes=30)))
+    report.add(record(when=START + timedelta(hours=2)))
+
+    assert report.total == 2
+    assert report.skipped == 1
+    assert sorted(report.hourly.values()) == [1, 1]
+
+
+def test_steps_are_grouped_per_command_and_skipped_steps_ignored():
+    report = report_mod.TelemetryReport()
+    report.add(record(steps=[{"step": "LOAD", "duration_ms": 10, "outcome": "success"},
+                             {"step": "EXECUTE", "duration_ms": 80, "outcome": "error"},
+                             {"step": "VERIFY", "duration_ms": 0, "outcome": "skipped"}]))
+    report.add(record(command="*review", steps=[{"step": "LOAD", "duration_ms": 30}]))
+
+    data = report.report()
+    assert set(data["commands"]["*implement"]["steps"]) == {"LOAD", "EXECUTE"}
+    assert data["commands"]["*implement"]["steps"]["EXECUTE"]["error_rate"] == 1.0
+    assert data["steps"]["LOAD"]["count"] == 2
+
+
+def test_slowest_commands_are_ranked_by_p95():
+    report = report_mod.TelemetryReport()
+    for command, duration in (("*fast", 10), ("*slow", 900), ("*medium", 200)):
+        for _ in range(5):
+            report.add(record(command=command, duration=duration))
+
+    assert [c for c, _ in report.slowest(2)] == ["*slow", "*medium"]
+
+
+def test_regressions_compare_against_a_saved_baseline():
+    before = report_mod.TelemetryReport()
+    after = report_mod.TelemetryReport()
+    for _ in range(10):
+        before.add(record(duration=100, steps=[{"step": "LOAD", "duration_ms": 10}]))
+        before.add(record(command="*review", duration=100))
+        after.add(record(duration=300, steps=[{"step": "LOAD", "duration_ms": 10}]))
+        after.add(record(command="*review", duration=105))
+    baseline = json.loads(json.dumps(before.baseline()))
+
+    found = after.regressions(baseline, threshold=1.2, min_samples=5)
+    assert {r["name"] for r in found} == {"*implement"}
+    assert found[0]["ratio"] == pytest.approx(3, rel=0.05)
+    assert after.regressions(baseline, threshold=1.2, min_samples=20) == []
+
+
+def test_parallel_build_matches_a_single_pass_over_rotated_files(tmp_path):
+    log = tmp_path / "telemetry.jsonl"
+    write_log(log, [record(duration=float(i)) for i in range(50)])
+    write_log(tmp_path / "telemetry.jsonl.1.gz", [record(command="*review", duration=float(i)) for i in range(30)],
+              compress=True)
+    paths = report_mod.rotated_logs(str(log))
+
+    serial, _ = report_mod.build_report(paths)
+    parallel, _ = report_mod.build_report(paths, jobs=2)
+    assert len(paths) == 2
+    assert serial.total == parallel.total == 80
+    assert serial.report()["commands"] == parallel.report()["commands"]
+
+
+def test_period_parsing():
+    assert report_mod.parse_period("30m") == 1800
+    assert report_mod.parse_period("2w") == 14 * 86400
+    assert report_mod.parse_period("yesterday") is None
+
+
+def test_text_report_lists_commands_regressions_and_throughput():
+    report = report_mod.TelemetryReport()
+    for i in range(5):
+        report.add(record(duration=100 + i, when=START + timedelta(hours=i)))
+    out = io.StringIO()
+    report_mod.write_text(report, out, "All time", top_n=5, hours=3, regressions=[], color=False)
+
+    text = out.getvalue()
+    assert "Total Operations: 5" in text
+    assert "*implement" in text
+    assert "✓ No regressions" in text
+    assert "Throughput per Hour (last 3)" in text
+
+
+def test_json_output_and_baseline_round_trip(tmp_path, monkeypatch):
+    log = write_log(tmp_path / "telemetry.jsonl", [record(duration=100) for _ in range(6)])
+    baseline = tmp_path / "baseline.json"
+    output = tmp_path / "report.json"
+    monkeypatch.setattr(sys, "argv", ["performance-report.py", str(log), "--save-baseline", str(baseline)])
+    assert not report_mod.main()
+
+    write_log(log, [record(duration=500) for _ in range(6)])
+    monkeypatch.setattr(sys, "argv", ["performance-report.py", str(log), "--baseline", str(baseline),
+                                      "--format", "json", "--output", str(output)])
+    assert report_mod.main() == 1
+
+    data = json.loads(output.read_text())
+    assert data["summary"]["operations"] == 6
+    assert data["regressions"][0]["name"] == "*implement"
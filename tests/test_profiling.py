@@ -0,0 +1,118 @@
+"""Tests for the shared profiling options and phase timers"""
+
+import io
+import json
+import sys
+import time
+
+import pytest
+
+from bmadlib import profiling
+
+
+@pytest.fixture(autouse=True)
+def fresh_phases():
+    profiling._phases.clear()
+    yield
+    profiling._phases.clear()
+
+
+def test_options_are_taken_out_of_argv():
+    argv = ["script.py", "--profile=out", "--trace-memory=5", "--timings", "--top", "3"]
+    options = profiling.take_options(argv)
+
+    assert argv == ["script.py", "--top", "3"]
+    assert (options.profile_dir, options.trace_memory, options.timings) == ("out", 5, True)
+    assert options.active
+
+
+def test_bare_options_use_defaults_and_leave_separate_numbers_alone():
+    argv = ["script.py", "--profile", "--trace-memory", "5"]
+    options = profiling.take_options(argv)
+
+    assert argv == ["script.py", "5"]
+    assert options.profile_dir == profiling.DEFAULT_PROFILE_DIR
+    assert options.trace_memory == profiling.DEFAULT_TOP
+    assert not profiling.take_options(["script.py"]).active
+
+
+def test_nested_phases_are_not_counted_twice():
+    with profiling.phase("parsing"):
+        time.sleep(0.02)
+        with profiling.phase("rendering"):
+            time.sleep(0.05)
+    with profiling.phase("parsing"):
+        pass
+
+    totals = profiling.phase_totals()
+    assert totals["parsing"][0] == 2
+    assert totals["rendering"][0] == 1
+    assert totals["parsing"][1] < totals["rendering"][1]
+
+
+def test_timings_table_shows_shares_and_unaccounted_time():
+    profiling._phases["parsing"] = [3, 25_000_000]
+    out = io.StringIO()
+    profiling.print_timings(100_000_000, out)
+
+    lines = out.getvalue().splitlines()
+    assert lines[1] == "⏱️  Timings"
+    assert lines[3].split() == ["parsing", "3", "25.0ms", "25%"]
+    assert lines[4].split() == ["(other)", "75.0ms", "75%"]
+    assert lines[5].split() == ["total", "100.0ms"]
+
+
+def test_empty_timings_do_not_divide_by_zero():
+    out = io.StringIO()
+    profiling.print_timings(0, out)
+
+    assert "(other)" not in out.getvalue()
+
+
+def run_instrumented(monkeypatch, capsys, *flags):
+    @profiling.instrumented("demo")
+    def main():
+        with profiling.phase("work"):
+            sum(range(10000))
+        return sys.argv[1:]
+
+    monkeypatch.setattr(sys, "argv", ["demo.py", "--keep", *flags])
+    return main(), capsys.readouterr().err
+
+
+def test_uninstrumented_runs_print_nothing(monkeypatch, capsys):
+    result, err = run_instrumented(monkeypatch, capsys)
+
+    assert result == ["--keep"]
+    assert err == ""
+
+
+def test_timings_are_printed_after_the_run(monkeypatch, capsys):
+    result, err = run_instrumented(monkeypatch, capsys, "--timings")
+
+    assert result == ["--keep"]
+    assert "⏱️  Timings" in err
+    assert "  work " in err
+
+
+def test_memory_tracing_reports_the_peak(monkeypatch, capsys):
+    _, err = run_instrumented(monkeypatch, capsys, "--trace-memory=3")
+
+    assert "🧠 Memory: peak" in err
+    assert len(err.split("allocated at\n", 1)[1].splitlines()) <= 3
+
+
+def test_profiles_are_saved_for_pstats_and_speedscope(monkeypatch, capsys, tmp_path):
+    _, err = run_instrumented(monkeypatch, capsys, f"--profile={tmp_path}")
+
+    assert "🔬 Top functions by own time" in err
+    prof = list(tmp_path.glob("demo-*.prof"))
+    speedscope = list(tmp_path.glob("demo-*.speedscope.json"))
+    assert len(prof) == len(speedscope) == 1
+
+    data = json.loads(speedscope[0].read_text())
+    profile = data["profiles"][0]
+    frames = data["shared"]["frames"]
+    assert len(profile["samples"]) == len(profile["weights"]) > 0
+    assert all(0 <= i < len(frames) for sample in profile["samples"] for i in sample)
+    assert profile["endValue"] == pytest.approx(sum(profile["weights"]))
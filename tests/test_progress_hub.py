@@ -0,0 +1,127 @@
+"""Tests for the shared multi-workflow progress dashboard"""
+
+import io
+import threading
+
+from bmadlib.loader import load_script
+
+progress = load_script("progress-visualizer.py")
+WorkflowStep = progress.WorkflowStep
+
+
+def plain(text):
+    return progress.ANSI_ESCAPE.sub("", text)
+
+
+def make_hub(in_place=False):
+    stream = io.StringIO()
+    return progress.ProgressHub(stream=stream, max_fps=0, in_place=in_place), stream
+
+
+def tracker(hub, name):
+    t = progress.ProgressTracker(renderer=hub, show_eta=False, show_elapsed=False)
+    t.start(name)
+    return t
+
+
+def test_publishing_only_queues_events():
+    hub, stream = make_hub()
+    t = tracker(hub, "alex - *create-task-spec")
+    t.update_step(WorkflowStep.LOAD)
+
+    assert hub.trackers == []
+    assert stream.getvalue() == ""
+    hub.flush()
+    assert hub.trackers == [t]
+
+
+def test_rows_are_numbered_in_start_order_and_messages_are_labelled():
+    hub, stream = make_hub()
+    first = tracker(hub, "alex - *plan-sprint")
+    second = tracker(hub, "james - *implement")
+    second.update_step(WorkflowStep.EXECUTE)
+    first.update_step(WorkflowStep.LOAD)
+    hub.message("two lines\nof output", second)
+    hub.flush()
+
+    lines = plain(stream.getvalue()).splitlines()
+    assert "#2 two lines" in lines
+    assert "#2 of output" in lines
+    rows = [line for line in lines if "/7" in line]
+    assert rows[0].startswith("#1 alex - *plan-sprint")
+    assert rows[1].startswith("#2 james - *implement")
+
+
+def test_unchanged_rows_are_not_repeated():
+    hub, stream = make_hub()
+    t = tracker(hub, "quinn - *review")
+    t.update_step(WorkflowStep.VERIFY)
+    hub.flush()
+    before = stream.getvalue()
+    hub.mark_dirty(t)
+    hub.flush()
+
+    assert stream.getvalue() == before
+
+
+def test_finished_workflows_leave_their_final_row():
+    hub, stream = make_hub()
+    t = tracker(hub, "quinn - *review")
+    t.update_step(WorkflowStep.VERIFY)
+    t.complete("Review done")
+    hub.flush()
+
+    output = plain(stream.getvalue())
+    assert "Review done" in output
+    assert "#1 quinn - *review" in output.splitlines()[-1]
+    assert hub.trackers == []
+
+
+def test_in_place_dashboard_redraws_one_block():
+    hub, stream = make_hub(in_place=True)
+    for name in ("alex - *plan-sprint", "james - *implement"):
+        tracker(hub, name).update_step(WorkflowStep.LOAD)
+    hub.flush()
+    hub.mark_dirty(None)
+    hub.flush()
+
+    output = plain(stream.getvalue())
+    assert output.count("BMAD workflows: 2 active") == 2
+    assert "\033[3A\033[J" in stream.getvalue()
+
+
+def test_concurrent_workflows_share_one_hub():
+    hub = progress.ProgressHub(stream=io.StringIO(), max_fps=50, in_place=False)
+    errors = []
+
+    def run(n):
+        try:
+            t = tracker(hub, f"workflow {n}")
+            for step in WorkflowStep:
+                t.update_step(step)
+                for i in range(20):
+                    t.update_substep(f"item {i}")
+            t.complete()
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    hub.stop()
+
+    assert errors == []
+    assert hub.trackers == []
+    finals = [line for line in plain(hub.stream.getvalue()).splitlines() if "7/7" in line]
+    assert {line.split()[2] for line in finals} >= {str(n) for n in range(8)}
+
+
+def test_headless_hub_is_the_event_stream(monkeypatch, tmp_path):
+    monkeypatch.setenv("BMAD_PROGRESS", "events")
+    monkeypatch.setenv("BMAD_PROGRESS_FILE", str(tmp_path / "events.ndjson"))
+    try:
+        assert progress.get_hub() is progress.get_event_stream()
+    finally:
+        progress.close_event_stream()
@@ -0,0 +1,126 @@
+"""Tests for the coalescing terminal renderer"""
+
+import io
+import threading
+import time
+
+from bmadlib.loader import load_script
+
+progress = load_script("progress-visualizer.py")
+WorkflowStep = progress.WorkflowStep
+
+
+class SlowStream(io.StringIO):
+    """A terminal that takes a while to accept each write"""
+
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        time.sleep(self.delay)
+        return super().write(text)
+
+
+def tracker(renderer):
+    return progress.ProgressTracker(renderer=renderer, show_eta=False, show_elapsed=False)
+
+
+def test_bursts_of_updates_are_coalesced_into_one_frame():
+    stream = io.StringIO()
+    renderer = progress.TerminalRenderer(stream=stream, max_fps=0, in_place=False)
+    t = tracker(renderer)
+    t.update_step(WorkflowStep.EXECUTE)
+    for i in range(100):
+        t.update_substep(f"item {i}")
+    renderer.flush()
+
+    output = stream.getvalue()
+    assert "item 99" in output
+    assert "item 98" not in output
+
+
+def test_unchanged_frames_are_not_repeated_when_appending():
+    stream = io.StringIO()
+    renderer = progress.TerminalRenderer(stream=stream, max_fps=0, in_place=False)
+    t = tracker(renderer)
+    t.update_step(WorkflowStep.LOAD, "Loading")
+    renderer.flush()
+    first = stream.getvalue()
+    renderer.mark_dirty(t)
+    renderer.flush()
+
+    assert stream.getvalue() == first
+
+
+def test_redraws_are_limited_to_the_frame_rate():
+    stream = SlowStream(0)
+    renderer = progress.TerminalRenderer(stream=stream, max_fps=20, in_place=False)
+    t = tracker(renderer)
+    t.update_step(WorkflowStep.EXECUTE)
+    deadline = time.monotonic() + 0.5
+    updates = 0
+    while time.monotonic() < deadline:
+        updates += 1
+        t.update_substep(f"item {updates}")
+    renderer.stop()
+
+    assert updates > 1000
+    # 0.5s at 20 fps, plus the final flush and some scheduling slack
+    assert stream.writes <= 14
+
+
+def test_detach_does_not_wait_for_the_render_thread():
+    stream = SlowStream(0.05)
+    renderer = progress.TerminalRenderer(stream=stream, max_fps=100, in_place=False)
+    busy, other = tracker(renderer), tracker(renderer)
+    busy.update_step(WorkflowStep.EXECUTE)
+    other.update_step(WorkflowStep.LOAD)
+    stop = threading.Event()
+
+    def keep_dirty():
+        while not stop.is_set():
+            renderer.mark_dirty(busy)
+
+    worker = threading.Thread(target=keep_dirty)
+    worker.start()
+    try:
+        renderer.detach(busy)
+        start = time.monotonic()
+        renderer.detach(other)
+        elapsed = time.monotonic() - start
+    finally:
+        stop.set()
+        worker.join()
+
+    assert elapsed < 0.5
+    assert renderer._thread is None
+
+
+def test_attach_after_detach_starts_a_new_render_thread():
+    renderer = progress.TerminalRenderer(stream=io.StringIO(), max_fps=50, in_place=False)
+    first = tracker(renderer)
+    first.update_step(WorkflowStep.LOAD)
+    renderer.detach(first)
+    second = tracker(renderer)
+    second.update_step(WorkflowStep.LOAD)
+
+    assert renderer._thread is not None and renderer._thread.is_alive()
+    renderer.stop()
+    assert renderer._thread is None
+
+
+def test_in_place_frames_redraw_over_the_live_lines():
+    stream = io.StringIO()
+    renderer = progress.TerminalRenderer(stream=stream, max_fps=0, in_place=True)
+    t = tracker(renderer)
+    t.update_step(WorkflowStep.LOAD, "Loading")
+    renderer.flush()
+    t.update_step(WorkflowStep.ASSESS, "Assessing")
+    renderer.flush()
+
+    output = stream.getvalue()
+    assert "\033[2A\033[J" in output
+    assert output.rstrip().endswith("Assessing" + progress.Colors.ENDC)
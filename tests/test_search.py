@@ -0,0 +1,87 @@
+"""Tests for BM25 ranking and tokenization"""
+
+import json
+import math
+
+from bmadlib.search import BM25Index, bm25, idf, stem, tokenize
+
+
+def test_tokenize_stems_and_drops_stopwords():
+    assert tokenize("The tests are failing") == [stem("tests"), stem("failing")]
+    assert stem("testing") == stem("tests") == "test"
+
+
+def test_idf_is_positive_and_falls_with_document_frequency():
+    assert idf(10, 1) > idf(10, 5) > idf(10, 10) > 0
+
+
+def test_bm25_saturates_and_penalises_long_documents():
+    term_idf = idf(100, 10)
+    assert bm25(2, term_idf, 10, 10) > bm25(1, term_idf, 10, 10)
+    # Term frequency saturates towards idf * (k1 + 1)
+    assert bm25(1000, term_idf, 10, 10) < term_idf * 2.2
+    assert bm25(1, term_idf, 5, 10) > bm25(1, term_idf, 20, 10)
+
+
+def test_rare_terms_outrank_common_ones():
+    index = BM25Index()
+    index.add("bug", "fix the failing login bug")
+    index.add("feature", "implement a new login feature")
+    index.add("docs", "write login documentation")
+
+    assert index.search("login bug")[0][0] == "bug"
+    assert index.search("feature")[0][0] == "feature"
+    assert index.search("unrelated words") == []
+
+
+def test_scores_match_the_formula():
+    index = BM25Index()
+    index.add("a", "alpha beta")
+    index.add("b", "beta gamma delta")
+
+    (doc, score), = index.search("alpha")
+    expected = bm25(1, idf(2, 1), 2, 2.5)
+
+    assert doc == "a"
+    assert math.isclose(score, expected)
+
+
+def test_field_weights_count_terms_repeatedly():
+    index = BM25Index()
+    index.add("title", {"name": "deploy", "body": "other words here"}, weights={"name": 3.0})
+    index.add("body", {"name": "other", "body": "deploy words here"}, weights={"name": 3.0})
+
+    assert index.docs["title"]["terms"][stem("deploy")] == 3.0
+    assert [doc for doc, _ in index.search("deploy")] == ["title", "body"]
+
+
+def test_ties_are_ordered_by_id_and_k_limits_results():
+    index = BM25Index()
+    for doc_id in ("c", "a", "b"):
+        index.add(doc_id, "same text")
+
+    assert [doc for doc, _ in index.search("text", k=2)] == ["a", "b"]
+
+
+def test_replace_and_remove_rebuild_the_index():
+    index = BM25Index()
+    index.add("a", "quality gate")
+    index.add("a", "security review")
+    index.add("b", "quality review")
+
+    assert [doc for doc, _ in index.search("quality")] == ["b"]
+    index.remove("b")
+    assert index.search("quality") == []
+    assert len(index) == 1
+
+
+def test_round_trip_through_json_keeps_rankings():
+    index = BM25Index(k1=1.5, b=0.5)
+    index.add("a", "validate the quality gate", meta={"subagent": "quinn"})
+    index.add("b", "review code quality")
+
+    restored = BM25Index.from_dict(json.loads(json.dumps(index.to_dict())))
+
+    assert restored.search("quality gate") == index.search("quality gate")
+    assert restored.meta("a") == {"subagent": "quinn"}
+    assert (restored.k1, restored.b) == (1.5, 0.5)
@@ -0,0 +1,84 @@
+"""Tests for the quantile sketch"""
+
+import json
+import random
+
+import pytest
+
+from bmadlib.sketch import QuantileSketch
+
+
+def exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+@pytest.mark.parametrize("q", [0.5, 0.9, 0.95, 0.99])
+def test_quantiles_are_within_relative_accuracy(q):
+    rng = random.Random(7)
+    values = [rng.lognormvariate(0, 1.5) for _ in range(20000)]
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+
+    expected = exact_quantile(values, q)
+    assert sketch.quantile(q) == pytest.approx(expected, rel=0.01)
+
+
+def test_extremes_mean_and_empty_sketch():
+    sketch = QuantileSketch()
+    assert sketch.quantile(0.5) is None
+    assert sketch.mean is None
+
+    for value in [0.0, 2.0, 4.0, 10.0]:
+        sketch.add(value)
+
+    assert sketch.quantile(0) == 0.0
+    assert sketch.quantile(1) == 10.0
+    assert sketch.mean == 4.0
+    assert sketch.zero_count == 1
+
+
+def test_merge_matches_a_single_sketch():
+    rng = random.Random(3)
+    values = [rng.uniform(0.001, 50) for _ in range(5000)]
+    whole, left, right = QuantileSketch(), QuantileSketch(), QuantileSketch()
+    for i, value in enumerate(values):
+        whole.add(value)
+        (left if i % 2 else right).add(value)
+
+    left.merge(right)
+
+    assert left.buckets == whole.buckets
+    assert left.count == whole.count
+    assert (left.min, left.max) == (whole.min, whole.max)
+    for q in (0.5, 0.95, 0.99):
+        assert left.quantile(q) == whole.quantile(q)
+
+
+def test_merge_rejects_different_accuracy():
+    with pytest.raises(ValueError):
+        QuantileSketch(0.01).merge(QuantileSketch(0.02))
+
+
+def test_round_trips_through_json():
+    sketch = QuantileSketch()
+    for value in range(1, 1001):
+        sketch.add(value / 10)
+
+    restored = QuantileSketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+
+    assert restored.buckets == sketch.buckets
+    assert restored.quantile(0.99) == sketch.quantile(0.99)
+    assert restored.mean == sketch.mean
+
+
+def test_collapse_bounds_memory_and_keeps_upper_quantiles():
+    values = [1.01 ** i for i in range(2000)]
+    sketch = QuantileSketch(relative_accuracy=0.01, max_buckets=100)
+    for value in values:
+        sketch.add(value)
+
+    assert len(sketch.buckets) <= 100
+    assert sketch.count == len(values)
+    assert sketch.quantile(0.99) == pytest.approx(exact_quantile(values, 0.99), rel=0.01)
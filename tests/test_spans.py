@@ -0,0 +1,150 @@
+"""Tests for the span profiler and its trace exports"""
+
+import io
+import json
+import threading
+
+from bmadlib.loader import load_script
+from bmadlib.spans import SpanRecorder
+
+progress = load_script("progress-visualizer.py")
+
+
+def by_name(recorder):
+    return {span.name: span for span in recorder.spans}
+
+
+def test_context_managed_spans_nest_per_thread():
+    rec = SpanRecorder()
+    with rec.span("outer", story="1.1"):
+        with rec.span("inner"):
+            pass
+
+    spans = by_name(rec)
+    assert spans["inner"].parent is spans["outer"]
+    assert spans["inner"].root is spans["outer"]
+    assert spans["outer"].args == {"story": "1.1"}
+    assert spans["outer"].start_ns <= spans["inner"].start_ns
+    assert spans["inner"].end_ns <= spans["outer"].end_ns
+
+
+def test_spans_on_other_threads_start_their_own_trees():
+    rec = SpanRecorder()
+    def work():
+        with rec.span("worker"):
+            pass
+
+    with rec.span("main"):
+        worker = threading.Thread(target=work)
+        worker.start()
+        worker.join()
+
+    spans = by_name(rec)
+    assert spans["worker"].parent is None
+    assert spans["worker"].tid != spans["main"].tid
+
+
+def test_failing_spans_record_the_error_and_traced_uses_the_qualname():
+    rec = SpanRecorder()
+
+    @rec.traced()
+    def load():
+        raise KeyError("missing")
+
+    try:
+        load()
+    except KeyError:
+        pass
+
+    span = rec.spans[0]
+    assert span.name.endswith("load")
+    assert span.args == {"error": "KeyError"}
+
+
+def test_sampling_skips_whole_trees():
+    rec = SpanRecorder(sample_rate=0.0)
+    with rec.span("root"):
+        with rec.span("child"):
+            pass
+
+    assert rec.spans == []
+
+
+def test_spans_past_the_limit_are_counted_as_dropped():
+    rec = SpanRecorder(max_spans=3)
+    for i in range(5):
+        rec.end(rec.begin(f"span {i}"))
+
+    assert len(rec.spans) == 3
+    assert rec.dropped == 2
+    rec.clear()
+    assert (rec.spans, rec.dropped) == ([], 0)
+
+
+def test_chrome_trace_has_one_lane_per_tree():
+    rec = SpanRecorder()
+    for name in ("first", "second"):
+        with rec.span(name):
+            with rec.span(f"{name} child"):
+                pass
+
+    events = rec.to_chrome_trace()["traceEvents"]
+    lanes = [e for e in events if e["ph"] == "M"]
+    complete = {e["name"]: e for e in events if e["ph"] == "X"}
+    assert [lane["args"]["name"].split(" (")[0] for lane in lanes] == ["first", "second"]
+    assert complete["first"]["ts"] == 0
+    assert complete["first child"]["tid"] == complete["first"]["tid"]
+    assert complete["second child"]["tid"] != complete["first"]["tid"]
+    assert complete["first child"]["dur"] <= complete["first"]["dur"]
+
+
+def test_speedscope_events_open_and_close_in_order():
+    rec = SpanRecorder()
+    with rec.span("root"):
+        with rec.span("a"):
+            pass
+        with rec.span("b"):
+            pass
+
+    data = rec.to_speedscope("demo")
+    frames = [f["name"] for f in data["shared"]["frames"]]
+    events = data["profiles"][0]["events"]
+    opened = []
+    for event in events:
+        if event["type"] == "O":
+            opened.append(event["frame"])
+        else:
+            assert opened.pop() == event["frame"]
+    assert opened == []
+    assert [frames[e["frame"]] for e in events if e["type"] == "O"] == ["root", "a", "b"]
+    assert [e["at"] for e in events] == sorted(e["at"] for e in events)
+
+
+def test_export_picks_the_format_from_the_file_name(tmp_path):
+    rec = SpanRecorder()
+    with rec.span("run"):
+        pass
+
+    chrome = json.loads(rec.export(str(tmp_path / "run.trace.json")).read_text())
+    speedscope = json.loads(rec.export(str(tmp_path / "run.speedscope.json")).read_text())
+    assert "traceEvents" in chrome
+    assert speedscope["profiles"][0]["unit"] == "nanoseconds"
+
+
+def test_workflow_steps_and_substeps_become_spans():
+    rec = SpanRecorder()
+    renderer = progress.TerminalRenderer(stream=io.StringIO(), max_fps=0, in_place=False)
+    tracker = progress.ProgressTracker(renderer=renderer, show_eta=False, show_elapsed=False, spans=rec)
+    tracker.start("james - *implement")
+    tracker.update_step(progress.WorkflowStep.LOAD)
+    tracker.update_substep("reading spec")
+    tracker.update_step(progress.WorkflowStep.EXECUTE)
+    tracker.complete()
+
+    spans = by_name(rec)
+    root = spans["james - *implement"]
+    load = spans[progress.STEP_NAMES[progress.WorkflowStep.LOAD]]
+    assert load.parent is root
+    assert spans["reading spec"].parent is load
+    assert spans[progress.STEP_NAMES[progress.WorkflowStep.EXECUTE]].parent is root
+    assert all(span.end_ns is not None for span in rec.spans)
@@ -0,0 +1,49 @@
+"""Tests for the bmad entry point: import-time budgets and the zipapp build"""
+
+import os
+import subprocess
+import sys
+import zipfile
+
+import bmad
+
+# Shared CI runners are noisier than a developer machine
+TOLERANCE = 1.5
+
+
+def test_subcommands_load_within_their_startup_budgets(capsys):
+    code = bmad.check_startup(["--scale", str(TOLERANCE)])
+
+    assert code == 0, capsys.readouterr().out
+
+
+def test_dispatching_imports_nothing_heavy():
+    _, modules = bmad.import_profile("")
+
+    eager = {name.split(".")[0] for name in modules} & set(bmad.DISPATCH_FORBIDDEN)
+    assert not eager
+
+
+def test_every_budgeted_command_exists():
+    assert set(bmad.STARTUP_BUDGETS_MS) - {""} <= set(bmad.COMMANDS)
+
+
+def test_zipapp_runs_subcommands_from_the_archive(tmp_path, capsys):
+    target = tmp_path / "bmad.pyz"
+    assert bmad.build_zipapp(["-o", str(target)]) == 0
+    assert os.access(target, os.X_OK)
+
+    with zipfile.ZipFile(target) as archive:
+        names = set(archive.namelist())
+    assert {"__main__.py", "bmad.py", "bmad.pyc", "bmadlib/loader.py", "bmadlib/loader.pyc"} <= names
+    assert not names & bmad.ZIPAPP_EXCLUDE
+
+    # Run from an empty directory so nothing is imported from the source tree
+    def run(*args):
+        return subprocess.run([sys.executable, str(target), *args], cwd=tmp_path,
+                              stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+    assert run("--version").stdout.strip() == "bmad (BMAD Enhanced scripts)"
+    report = run("report", "--help")
+    assert report.returncode == 0 and "usage: bmad report" in report.stdout
+    assert run("nope").returncode == 2
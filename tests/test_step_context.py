@@ -0,0 +1,100 @@
+"""Tests for the sync and async workflow step context managers"""
+
+import asyncio
+
+import pytest
+
+from bmadlib.loader import load_script
+
+progress = load_script("progress-visualizer.py")
+WorkflowStep = progress.WorkflowStep
+
+
+class Recorder:
+    """Telemetry writer stand-in keeping records in memory"""
+
+    def __init__(self):
+        self.records = []
+
+    def write(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def workflow(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BMAD_PROGRESS", "events")
+    monkeypatch.setenv("BMAD_PROGRESS_FILE", str(tmp_path / "events.ndjson"))
+    monkeypatch.delenv("BMAD_TRACE_DIR", raising=False)
+    wf = progress.WorkflowProgress("feature-delivery", "james", "*implement", telemetry=Recorder(),
+                                   history=progress.StepTimingHistory(str(tmp_path / "history.json")))
+    wf.start()
+    yield wf
+    progress.close_event_stream()
+
+
+def test_step_records_result_and_timing(workflow):
+    with workflow.step(WorkflowStep.LOAD, "Loading") as step:
+        step.substep("reading config")
+        step.set_result({"files": 2})
+    workflow.complete()
+
+    assert workflow.results[WorkflowStep.LOAD] == {"files": 2}
+    record = workflow.telemetry.records[-1]
+    assert record["outcome"] == "success"
+    assert record["steps"][0]["step"] == "LOAD"
+    assert record["steps"][0]["outcome"] == "success"
+    assert record["steps"][0]["substep_count"] == 1
+
+
+def test_escaping_exception_fails_the_workflow(workflow):
+    with pytest.raises(ValueError):
+        with workflow.step(WorkflowStep.EXECUTE):
+            raise ValueError("bad spec")
+
+    record = workflow.telemetry.records[-1]
+    assert record["outcome"] == "error"
+    assert record["message"] == "Execute failed: bad spec"
+    assert record["steps"][0]["error"] == "ValueError: bad spec"
+    assert isinstance(workflow.results[WorkflowStep.EXECUTE], ValueError)
+
+
+def test_failure_message_names_exceptions_without_text(workflow):
+    with pytest.raises(RuntimeError):
+        with workflow.step(WorkflowStep.LOAD):
+            raise RuntimeError()
+
+    assert workflow.telemetry.records[-1]["message"] == "Load Context failed: RuntimeError"
+
+
+def test_fail_workflow_false_keeps_the_workflow_running(workflow):
+    with pytest.raises(KeyError):
+        with workflow.step(WorkflowStep.VERIFY, fail_workflow=False):
+            raise KeyError("missing")
+
+    assert workflow.telemetry.records == []
+    assert not workflow.tracker.completed
+
+
+def test_async_steps(workflow):
+    async def run():
+        async with workflow.step(WorkflowStep.LOAD) as step:
+            await asyncio.sleep(0)
+            step.set_result("loaded")
+        value = await workflow.arun_step(WorkflowStep.EXECUTE, lambda: asyncio.sleep(0, result=42))
+        await workflow.acomplete()
+        return value
+
+    assert asyncio.run(run()) == 42
+    assert workflow.results[WorkflowStep.LOAD] == "loaded"
+    assert workflow.telemetry.records[-1]["outcome"] == "success"
+
+
+def test_async_failure_fails_the_workflow(workflow):
+    async def run():
+        async with workflow.step(WorkflowStep.GUARD):
+            raise PermissionError()
+
+    with pytest.raises(PermissionError):
+        asyncio.run(run())
+    assert workflow.telemetry.records[-1]["message"] == "Check Guardrails failed: PermissionError"
@@ -0,0 +1,88 @@
+"""Tests for persisted step timings and history-based ETAs"""
+
+import json
+import multiprocessing
+import threading
+
+import pytest
+
+from bmadlib.loader import load_script
+
+progress = load_script("progress-visualizer.py")
+WorkflowStep = progress.WorkflowStep
+
+
+def history(tmp_path):
+    return progress.StepTimingHistory(str(tmp_path / "step-timings.json"))
+
+
+def test_saved_durations_feed_later_estimates(tmp_path):
+    first = history(tmp_path)
+    first.record("feature", "*implement", WorkflowStep.EXECUTE, 4.0)
+    first.record("feature", "*implement", WorkflowStep.EXECUTE, 8.0)
+    first.save()
+
+    second = history(tmp_path)
+    # EWMA with alpha 0.3: 4.0, then 0.3 * 8 + 0.7 * 4
+    assert second.estimate("feature", "*implement", WorkflowStep.EXECUTE) == pytest.approx(5.2)
+    assert second.quantile("feature", "*implement", WorkflowStep.EXECUTE, 1.0) == pytest.approx(8.0, rel=0.02)
+    assert second.estimate("feature", "*implement", WorkflowStep.VERIFY) is None
+
+
+def test_unknown_pairs_fall_back_to_the_all_workflows_aggregate(tmp_path):
+    h = history(tmp_path)
+    h.record("feature", "*implement", WorkflowStep.LOAD, 2.0)
+    h.save()
+
+    assert history(tmp_path).estimate("bugfix", "*fix", WorkflowStep.LOAD) == pytest.approx(2.0)
+
+
+def test_corrupt_history_is_treated_as_empty(tmp_path):
+    (tmp_path / "step-timings.json").write_text("[1, 2")
+
+    h = history(tmp_path)
+    assert h.estimate("feature", "*implement", WorkflowStep.LOAD) is None
+    h.record("feature", "*implement", WorkflowStep.LOAD, 1.0)
+    h.save()
+    assert history(tmp_path).estimate("feature", "*implement", WorkflowStep.LOAD) == 1.0
+
+
+def test_eta_uses_history_for_remaining_steps(tmp_path):
+    h = history(tmp_path)
+    for step in WorkflowStep:
+        h.record("feature", "*implement", step, 10.0)
+    h.save()
+    tracker = progress.ProgressTracker(renderer=progress.TerminalRenderer(max_fps=0, in_place=False),
+                                       history=history(tmp_path), history_key=("feature", "*implement"))
+    tracker.current_step = WorkflowStep.VERIFY.value
+
+    # VERIFY and TELEMETRY still to come, current step not started
+    assert tracker._estimate_remaining() == pytest.approx(20.0)
+
+
+def _save_samples(path, rounds):
+    for _ in range(rounds):
+        h = progress.StepTimingHistory(path)
+        h.record("feature", "*implement", WorkflowStep.LOAD, 1.0)
+        h.save()
+
+
+def test_concurrent_saves_keep_every_sample(tmp_path):
+    path = str(tmp_path / "step-timings.json")
+    try:
+        context = multiprocessing.get_context("fork")
+    except ValueError:
+        pytest.skip("needs fork")
+    workers = [context.Process(target=_save_samples, args=(path, 25)) for _ in range(4)]
+    threads = [threading.Thread(target=_save_samples, args=(path, 25)) for _ in range(2)]
+    for worker in workers + threads:
+        worker.start()
+    for worker in workers:
+        worker.join(30)
+        assert worker.exitcode == 0
+    for thread in threads:
+        thread.join(30)
+
+    steps = json.loads((tmp_path / "step-timings.json").read_text())["steps"]
+    assert steps["feature|*implement|LOAD"]["count"] == 6 * 25
+    assert steps["*|*|LOAD"]["count"] == 6 * 25
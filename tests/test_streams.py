@@ -0,0 +1,94 @@
+"""Tests for the streaming log readers"""
+
+import gzip
+import io
+import json
+
+from bmadlib.streams import JSONRecordReader, parse_timestamp, rotated_logs
+
+
+def test_reads_json_lines_and_pretty_printed_records(tmp_path):
+    log = tmp_path / "errors.log"
+    log.write_text('{"n": 1}\n{"n": 2}\n' + json.dumps({"n": 3}, indent=2) + "\n" + json.dumps({"n": 4}, indent=2))
+
+    reader = JSONRecordReader([log])
+
+    assert [record["n"] for record in reader] == [1, 2, 3, 4]
+    assert reader.records == 4
+    assert reader.malformed == 0
+
+
+def test_records_spanning_chunks_are_reassembled(tmp_path):
+    log = tmp_path / "errors.log"
+    records = [{"n": i, "message": "x" * 50} for i in range(20)]
+    log.write_text("".join(json.dumps(r, indent=2) + "\n" for r in records))
+
+    reader = JSONRecordReader([log], chunk_size=16)
+
+    assert [record["n"] for record in reader] == list(range(20))
+
+
+def test_malformed_records_are_skipped_and_counted(tmp_path):
+    log = tmp_path / "errors.log"
+    log.write_text('{"n": 1}\n{"n": \n{"n": 2}\n[1, 2]\n')
+
+    reader = JSONRecordReader([log], chunk_size=8, max_record_bytes=64)
+
+    assert [record["n"] for record in reader] == [1, 2]
+    assert reader.malformed == 2
+
+
+def test_oversized_record_does_not_stall_the_stream(tmp_path):
+    log = tmp_path / "errors.log"
+    log.write_text('{"n": 1}\n{"big": "' + "y" * 500 + '\n{"n": 2}\n')
+
+    reader = JSONRecordReader([log], chunk_size=32, max_record_bytes=100)
+
+    assert [record["n"] for record in reader] == [1, 2]
+    assert reader.malformed == 1
+
+
+def test_rotated_logs_are_read_oldest_first(tmp_path):
+    log = tmp_path / "errors.log"
+    log.write_text('{"n": 4}\n')
+    (tmp_path / "errors.log.1").write_text('{"n": 3}\n')
+    with gzip.open(tmp_path / "errors.log.2.gz", "wt") as f:
+        f.write('{"n": 2}\n')
+    (tmp_path / "errors.log-20240101").write_text('{"n": 1}\n')
+    (tmp_path / "errors.log.bak").write_text('{"n": 0}\n')
+
+    files = rotated_logs(log)
+    reader = JSONRecordReader(files)
+
+    assert [p.name for p in files] == ["errors.log-20240101", "errors.log.2.gz", "errors.log.1", "errors.log"]
+    assert [record["n"] for record in reader] == [1, 2, 3, 4]
+    assert reader.files_read == 4
+
+
+def test_missing_files_are_skipped(tmp_path):
+    reader = JSONRecordReader([tmp_path / "missing.log"])
+
+    assert list(reader) == []
+    assert reader.files_read == 0
+
+
+def test_parse_timestamp():
+    assert parse_timestamp("1970-01-01T00:00:10Z") == 10.0
+    assert parse_timestamp("not a date") is None
+    assert parse_timestamp(None) is None
+
+
+def test_corrupt_record_resyncs_at_the_next_line(tmp_path):
+    lines = [json.dumps({"n": i}) for i in range(2000)]
+    lines[10] = '{"n": 10, "message": "cut off'
+    handle = io.StringIO("\n".join(lines) + "\n")
+    reader = JSONRecordReader([], chunk_size=64)
+
+    records = reader._decode(handle)
+    seen = [next(records)["n"] for _ in range(11)]
+
+    assert seen == [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 11]
+    assert reader.malformed == 1
+    # Only a chunk or two past the corrupt line was read, not up to the size cap
+    assert handle.tell() < 400
+    assert [record["n"] for record in records] == list(range(12, 2000))
@@ -0,0 +1,95 @@
+"""Tests for the background telemetry writer"""
+
+import json
+import threading
+import time
+
+from bmadlib.telemetry import TelemetryWriter, get_writer
+
+
+def read_records(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_records_are_written_on_flush(tmp_path):
+    path = tmp_path / "telemetry.jsonl"
+    writer = TelemetryWriter(str(path), flush_interval=60)
+    try:
+        for i in range(10):
+            assert writer.write({"n": i})
+        assert writer.flush()
+
+        assert [r["n"] for r in read_records(path)] == list(range(10))
+        assert writer.written == 10
+    finally:
+        writer.close()
+
+
+def test_flush_waits_for_records_queued_by_other_threads(tmp_path):
+    path = tmp_path / "telemetry.jsonl"
+    writer = TelemetryWriter(str(path), flush_interval=60, batch_size=1)
+    stop = threading.Event()
+
+    def background():
+        while not stop.is_set():
+            writer.write({"source": "background"})
+            time.sleep(0.0001)
+
+    thread = threading.Thread(target=background)
+    thread.start()
+    try:
+        for i in range(100):
+            assert writer.write({"source": "main", "n": i})
+            assert writer.flush()
+            mine = [r["n"] for r in read_records(path) if r["source"] == "main"]
+            assert mine[-1] == i
+    finally:
+        stop.set()
+        thread.join()
+        writer.close()
+
+
+def test_close_writes_pending_records_and_rejects_later_ones(tmp_path):
+    path = tmp_path / "telemetry.jsonl"
+    writer = TelemetryWriter(str(path), flush_interval=60)
+    writer.write({"n": 1})
+    writer.close()
+
+    assert read_records(path) == [{"n": 1}]
+    assert not writer.write({"n": 2})
+    assert writer.dropped == 1
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path):
+    writer = TelemetryWriter(str(tmp_path / "telemetry.jsonl"), flush_interval=60, max_queue=2)
+    # Nothing is written until the thread starts, so fill the queue first
+    writer._start = lambda: None
+    results = [writer.write({"n": i}) for i in range(4)]
+
+    assert results == [True, True, False, False]
+    assert writer.dropped == 2
+
+
+def test_unserialisable_records_are_counted_as_errors(tmp_path):
+    path = tmp_path / "telemetry.jsonl"
+    writer = TelemetryWriter(str(path), flush_interval=60)
+    try:
+        writer.write({"bad": float("nan"), "ok": {1, 2}})
+        writer.write({"n": 1})
+        assert writer.flush()
+    finally:
+        writer.close()
+
+    assert len(read_records(path)) == 2
+
+
+def test_shared_writer_per_path_and_disable_switch(tmp_path, monkeypatch):
+    path = str(tmp_path / "shared.jsonl")
+    first = get_writer(path)
+    try:
+        assert get_writer(path) is first
+        monkeypatch.setenv("BMAD_TELEMETRY", "0")
+        assert get_writer(path) is None
+    finally:
+        first.close()
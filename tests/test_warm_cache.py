@@ -0,0 +1,96 @@
+"""Tests for the cache warmer"""
+
+import sys
+
+import pytest
+
+from bmadlib.docsearch import DEFAULT_DB, DocsIndex
+from bmadlib.loader import load_script
+from bmadlib.output import NoColors
+
+warm_cache = load_script("warm-cache.py")
+
+SKILL = """---
+name: {name}
+description: A test skill
+---
+
+# {name}
+"""
+
+
+def make_project(root):
+    for name in ("alpha", "beta"):
+        skill = root / ".claude" / "skills" / "development" / name
+        skill.mkdir(parents=True)
+        (skill / "SKILL.md").write_text(SKILL.format(name=name), encoding="utf-8")
+    (root / "docs").mkdir()
+    (root / "docs" / "guide.md").write_text("# Guide\n\nHow to deploy.\n", encoding="utf-8")
+    return root
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.delenv("BMAD_CACHE_DIR", raising=False)
+    monkeypatch.delenv("BMAD_DOCS_INDEX", raising=False)
+    # run_target changes directory, as it does in its worker process
+    monkeypatch.chdir(tmp_path)
+    return make_project(tmp_path / "project")
+
+
+def test_skills_are_analysed_once_then_served_from_the_cache(project):
+    root, name, ok, detail, _ = warm_cache.run_target("skills", str(project))
+    assert (root, name, ok) == (str(project), "skills", True)
+    assert detail.startswith("2 skills")
+
+    *_, again, _ = warm_cache.run_target("skills", str(project))
+    assert again.startswith("2 skills (2 already cached)")
+
+
+def test_search_target_builds_the_docs_index(project):
+    *_, ok, detail, _ = warm_cache.run_target("search", str(project))
+    assert ok and detail == "1 files, 1 indexed, 0 removed"
+
+    index = DocsIndex(project)
+    try:
+        assert index.refresh()["updated"] == 0
+        assert index.search("deploy")[0]["path"] == "docs/guide.md"
+    finally:
+        index.close()
+
+
+def test_manifest_is_skipped_outside_the_bmad_tree(project):
+    *_, ok, detail, _ = warm_cache.run_target("manifest", str(project))
+    assert ok and detail.startswith("skipped")
+
+
+def test_a_failing_target_is_reported_not_raised(project, monkeypatch):
+    def broken(root):
+        raise OSError("read-only cache")
+
+    monkeypatch.setitem(warm_cache.TARGETS, "broken", warm_cache.Target("broken", "fails", broken))
+    *_, ok, detail, _ = warm_cache.run_target("broken", str(project))
+    assert not ok and detail == "OSError: read-only cache"
+
+
+def test_targets_for_several_projects_run_in_worker_processes(tmp_path, project, capsys):
+    other = make_project(tmp_path / "other")
+
+    failures = warm_cache.warm([str(project), str(other)], ["skills", "search"], jobs=2, colors=NoColors)
+
+    assert failures == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert sum(line.startswith("[") for line in lines) == 4
+    assert lines[-1].startswith("✅ Warmed 4 cache(s)")
+    assert (project / DEFAULT_DB).is_file() and (other / DEFAULT_DB).is_file()
+
+
+def test_unknown_targets_and_missing_roots_are_rejected(project, monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["warm-cache.py", "--targets", "skills,nope"])
+    assert warm_cache.main() == 2
+    monkeypatch.setattr(sys, "argv", ["warm-cache.py", str(project / "missing")])
+    assert warm_cache.main() == 2
+
+    err = capsys.readouterr().err
+    assert "Unknown target(s): nope" in err
+    assert "Not a directory" in err
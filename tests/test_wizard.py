@@ -0,0 +1,68 @@
+"""Tests for the command wizard's goal routing"""
+
+import io
+import json
+
+from bmadlib.loader import load_script
+
+wizard = load_script("bmad-wizard.py")
+
+
+def test_review_code_recommends_quinn_review():
+    subagent, commands = wizard.recommend_by_goal("review code")
+
+    assert subagent == "quinn"
+    assert commands[0] == "*review"
+
+
+def test_a_command_named_in_the_goal_ranks_first():
+    for goal, expected in [("fix a bug", "*fix"), ("plan the next sprint", "*plan-sprint"),
+                           ("refactor code", "*refactor"), ("explain the code", "*explain")]:
+        assert wizard.search_commands(goal, 1)[0][1] == expected, goal
+
+
+def test_goals_without_a_command_name_use_plain_ranking():
+    ranked = wizard.search_commands("check security", 3)
+
+    assert ranked[0][:2] == ("quinn", "*assess-nfr")
+    assert [score for _, _, score in ranked] == sorted((score for _, _, score in ranked), reverse=True)
+
+
+def test_unknown_goal_has_no_recommendation():
+    assert wizard.recommend_by_goal("zzqx") == (None, [])
+
+
+def test_batch_records_keep_their_fields_and_report_bad_lines():
+    assert wizard.route_goal('{"id": 7, "goal": "review code"}', 1)["id"] == 7
+    assert wizard.route_goal('"review code"', 2)["subagent"] == "quinn"
+    assert wizard.route_goal("{not json", 3)["error"].startswith("invalid JSON")
+    assert wizard.route_goal('{"title": "review code"}', 4) == {
+        "line": 4, "error": "expected an object with a 'goal' string"}
+
+
+def test_batch_output_keeps_input_order_with_worker_processes(monkeypatch):
+    goals = ["review code", "fix a bug", "plan the next sprint", "refactor code", "explain the code"] * 10
+    lines = [json.dumps({"id": i, "goal": goal}) for i, goal in enumerate(goals)]
+    text = "\n".join(lines[:20] + ["", "{broken"] + lines[20:]) + "\n"
+    monkeypatch.setattr(wizard, "BATCH_CHUNK_SIZE", 7)
+
+    serial, parallel = io.StringIO(), io.StringIO()
+    assert wizard.run_batch(io.StringIO(text), serial, k=3) == {"goals": 51, "errors": 1}
+    assert wizard.run_batch(io.StringIO(text), parallel, k=3, jobs=2) == {"goals": 51, "errors": 1}
+
+    assert parallel.getvalue() == serial.getvalue()
+    results = [json.loads(line) for line in serial.getvalue().splitlines()]
+    assert [r.get("id") for r in results if "id" in r] == list(range(50))
+    assert results[20] == {"line": 22, "error": results[20]["error"]}
+    assert all(len(r["recommendations"]) <= 3 for r in results if "id" in r)
+
+
+def test_batch_mode_reads_and_writes_files(tmp_path, capsys):
+    source = tmp_path / "goals.jsonl"
+    output = tmp_path / "routed.jsonl"
+    source.write_text('{"goal": "review code"}\n', encoding="utf-8")
+
+    assert wizard.batch_mode(str(source), output_path=str(output)) == 0
+    assert json.loads(output.read_text())["recommendations"][0]["command"] == "*review"
+    assert "Routed 1 goals" in capsys.readouterr().err
+    assert wizard.batch_mode(str(tmp_path / "missing.jsonl")) == 1